@@ -58,6 +58,7 @@ def __getattr__(name: str) -> str:
 __copyright__ = "Copyright 2015 Reuben Cummings"
 
 DEF_CONNECTION_COUNT = 16
+DEF_HOST_CONNECTION_COUNT = 6
 ENCODING = "utf-8"
 
 from riko.api import (  # noqa: E402
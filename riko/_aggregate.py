@@ -0,0 +1,299 @@
+# vim: sw=4:ts=4:expandtab
+"""
+riko._aggregate
+~~~~~~~~~~~~~~~
+Streaming hash aggregation: each group key keeps one running ``Accumulator``
+(count, sum, min, max, mean, approximate distinct count) instead of a list of
+its items, so memory grows with the number of keys rather than the length of
+the stream. Key tables larger than a budget are spilled to disk as sorted runs
+of partial accumulators and combined on the way out.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from hashlib import blake2b
+from heapq import merge
+from itertools import groupby
+from math import log
+from operator import itemgetter
+from typing import Any
+
+from riko._iterutils import def_itemgetter
+from riko._spill import external_sort, read_run, write_run
+from riko.types.values import PrimitiveValue
+
+AGGREGATES = ("count", "sum", "min", "max", "mean", "distinct")
+
+
+class Sketch:
+    """
+    A HyperLogLog distinct counter (about 3% standard error at the default
+    precision) that can be merged with other sketches of the same precision.
+
+    Examples:
+        >>> sketch = Sketch()
+        >>> for x in range(10_000):
+        ...     sketch.add(x % 2_000)
+        >>> 1900 < sketch.estimate() < 2100
+        True
+
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 10) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: object) -> None:
+        # repr (rather than the builtin hash) keeps sketches mergeable across
+        # processes with different hash seeds
+        digest = blake2b(repr(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest)
+        index = hashed & (len(self.registers) - 1)
+        rank = 64 - self.precision - (hashed >> self.precision).bit_length() + 1
+        self.registers[index] = max(self.registers[index], rank)
+
+    def merge(self, other: "Sketch") -> None:
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> int:
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0**-rank for rank in self.registers)
+        zeros = self.registers.count(0)
+
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            raw = size * log(size / zeros)
+
+        return round(raw)
+
+
+class Accumulator:
+    """
+    The running aggregates of one group. Every added item counts, while only
+    non None values feed the sum, min, max, mean, and distinct aggregates.
+
+    Examples:
+        >>> acc = Accumulator(distinct=True)
+        >>> for value in [3, 1, None, 2, 1]:
+        ...     acc.add(value)
+        >>> [acc.result(func) for func in AGGREGATES]
+        [5, 7, 1, 3, 1.75, 3]
+
+    """
+
+    __slots__ = ("count", "first", "high", "low", "sketch", "total", "valued")
+
+    def __init__(self, first: int = 0, distinct: bool = False) -> None:
+        self.first = first
+        self.count = self.valued = 0
+        self.total = self.low = self.high = None
+        self.sketch = Sketch() if distinct else None
+
+    def add(self, value: Any = None) -> None:
+        self.count += 1
+
+        if value is not None:
+            self.valued += 1
+            self.total = value if self.total is None else self.total + value
+            self.low = value if self.low is None or value < self.low else self.low
+            self.high = value if self.high is None or value > self.high else self.high
+
+            if self.sketch is not None:
+                self.sketch.add(value)
+
+    def merge(self, other: "Accumulator") -> None:
+        self.first = min(self.first, other.first)
+        self.count += other.count
+        self.valued += other.valued
+
+        if other.valued:
+            if self.total is None:
+                self.total, self.low, self.high = other.total, other.low, other.high
+            else:
+                self.total += other.total
+                self.low = min(self.low, other.low)
+                self.high = max(self.high, other.high)
+
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def result(self, func: str) -> Any:
+        if func == "count":
+            result = self.count
+        elif func == "sum":
+            result = self.total
+        elif func == "min":
+            result = self.low
+        elif func == "max":
+            result = self.high
+        elif func == "mean":
+            result = self.total / self.valued if self.valued else None
+        elif func == "distinct":
+            result = self.sketch.estimate() if self.sketch else None
+        else:
+            raise ValueError(f"Unsupported aggregate: {func!r}.")
+
+        return result
+
+
+type Groups = Iterator[tuple[str, Accumulator]]
+
+
+def _combine_runs(runs: list[Any], budget: int) -> Groups:
+    # Each run is sorted by key, so equal keys meet in one merged pass. Groups
+    # are then restored to first seen order with another (external) sort.
+    merged = merge(*map(read_run, runs), key=itemgetter(0))
+
+    def gen_combined() -> Iterator[tuple[str, Accumulator]]:
+        for key, group in groupby(merged, itemgetter(0)):
+            acc, *others = (acc for _, acc in group)
+
+            for other in others:
+                acc.merge(other)
+
+            yield key, acc
+
+    try:
+        yield from external_sort(gen_combined(), key=_first, budget=budget)
+    finally:
+        for run in runs:
+            run.close()
+
+
+def get_budget(budget: int | str | None) -> int | None:
+    """
+    The key table budget from a pipe configuration, or None (never spill) if
+    it is unset or 0.
+
+    Examples:
+        >>> get_budget('2'), get_budget(None), get_budget(0)
+        (2, None, None)
+
+    """
+    return int(budget) if budget else None
+
+
+def _first(pair: tuple[str, Accumulator]) -> int:
+    return pair[1].first
+
+
+def aggregate_by[T: Mapping | PrimitiveValue](
+    content: Iterable[T],
+    attr: str | None,
+    valuefunc: Callable[[T], Any] | None = None,
+    default: PrimitiveValue | None = None,
+    distinct: bool = False,
+    budget: int | None = None,
+) -> Groups:
+    """
+    Aggregate `content` by the (stringified) `attr` value of each item, like
+    `group_by` but keeping only an `Accumulator` per key. Groups are yielded in
+    first seen order. `valuefunc` extracts the value to aggregate from each
+    item. Once more than `budget` keys are held, the key table is spilled to
+    disk, and the spilled tables are combined when the stream is exhausted.
+
+    Examples:
+        >>> items = [{'k': x % 3, 'v': x} for x in range(7)]
+        >>> grouped = aggregate_by(items, 'k', itemgetter('v'))
+        >>> [(key, acc.count, acc.total) for key, acc in grouped]
+        [('0', 3, 9), ('1', 2, 5), ('2', 2, 7)]
+        >>> spilled = aggregate_by(items, 'k', itemgetter('v'), budget=1)
+        >>> [(key, acc.count, acc.total) for key, acc in spilled]
+        [('0', 3, 9), ('1', 2, 5), ('2', 2, 7)]
+
+    """
+    keyfunc = def_itemgetter(attr, default) if attr else lambda _: None
+    table: dict[str, Accumulator] = {}
+    runs = []
+
+    for position, item in enumerate(content):
+        key = str(keyfunc(item))
+
+        if (acc := table.get(key)) is None:
+            acc = table[key] = Accumulator(position, distinct)
+
+        acc.add(valuefunc(item) if valuefunc else None)
+
+        if budget and len(table) > budget:
+            runs.append(write_run(sorted(table.items(), key=itemgetter(0))))
+            table = {}
+
+    yield from _gen_groups(table, runs, budget)
+
+
+def _gen_groups(
+    table: dict[str, Accumulator], runs: list[Any], budget: int | None
+) -> Groups:
+    if runs:
+        runs.append(write_run(sorted(table.items(), key=itemgetter(0))))
+        yield from _combine_runs(runs, budget or len(table))
+    else:
+        yield from table.items()
+
+
+def merge_groups(
+    partials: Iterable[Iterable[tuple[str, Accumulator]]], budget: int | None = None
+) -> Groups:
+    """
+    Combine the groups of consecutive chunks of a stream, each aggregated on
+    its own by `aggregate_by` (e.g., in parallel), into the groups of the whole
+    stream. Groups are yielded in first seen order, and the key table is
+    spilled to disk once it holds more than `budget` keys.
+
+    Examples:
+        >>> items = [{'k': x % 3, 'v': x} for x in range(7)]
+        >>> chunks = [items[:2], items[2:5], items[5:]]
+        >>> partials = [aggregate_by(chunk, 'k', itemgetter('v')) for chunk in chunks]
+        >>> merged = merge_groups(partials)
+        >>> [(key, acc.count, acc.total) for key, acc in merged]
+        [('0', 3, 9), ('1', 2, 5), ('2', 2, 7)]
+        >>> partials = [aggregate_by(chunk, 'k', itemgetter('v')) for chunk in chunks]
+        >>> spilled = merge_groups(partials, budget=1)
+        >>> [(key, acc.count, acc.total) for key, acc in spilled]
+        [('0', 3, 9), ('1', 2, 5), ('2', 2, 7)]
+
+    """
+    table: dict[str, Accumulator] = {}
+    runs = []
+    position = 0
+
+    for groups in partials:
+        for key, other in groups:
+            # Positions are per chunk, so renumber them in stream order
+            other.first, position = position, position + 1
+
+            if (acc := table.get(key)) is None:
+                table[key] = other
+            else:
+                acc.merge(other)
+
+            if budget and len(table) > budget:
+                runs.append(write_run(sorted(table.items(), key=itemgetter(0))))
+                table = {}
+
+    yield from _gen_groups(table, runs, budget)
+
+
+def gen_aggregates(
+    groups: Groups, funcs: Iterable[str], group_key: str | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Convert aggregated groups into items of their requested results.
+
+    Examples:
+        >>> items = [{'k': 'a', 'v': 1}, {'k': 'b', 'v': 2}, {'k': 'a', 'v': 3}]
+        >>> groups = aggregate_by(items, 'k', itemgetter('v'))
+        >>> for item in gen_aggregates(groups, ['count', 'mean'], 'k'):
+        ...     print(item)
+        {'k': 'a', 'count': 2, 'mean': 2.0}
+        {'k': 'b', 'count': 1, 'mean': 2.0}
+
+    """
+    funcs = list(funcs)
+
+    for key, acc in groups:
+        item = {group_key: key} if group_key else {}
+        item.update((func, acc.result(func)) for func in funcs)
+        yield item
@@ -0,0 +1,98 @@
+# vim: sw=4:ts=4:expandtab
+"""
+riko._cache
+~~~~~~~~~~~
+Memoization that is safe to share between threads running in parallel (e.g.,
+on a free-threaded interpreter). Unlike ``functools.cache``, concurrent misses
+for one key all end up with the same (first stored) result, so callers that
+compare results by identity, e.g., ``get_opener``, agree.
+"""
+
+from collections.abc import Callable, Hashable
+from functools import wraps
+from threading import Lock
+from typing import NamedTuple, Protocol
+
+# Separates positional from keyword arguments in a cache key
+KWD_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class SharedCacheWrapper[R](Protocol):
+    def __call__(self, *args: Hashable, **kwargs: Hashable) -> R: ...  # noqa: E704
+    def cache_clear(self) -> None: ...  # noqa: E704
+    def cache_info(self) -> CacheInfo: ...  # noqa: E704
+
+
+def shared_cache[R](fn: Callable[..., R]) -> SharedCacheWrapper[R]:
+    """
+    Memoize *fn* (on hashable args) for use from parallel threads. Hits read
+    the cache without locking and results are stored under a lock, so *fn* may
+    run more than once for a key but every caller gets the same result. As
+    with ``functools.cache``, equal args (e.g., ``(1,)`` and ``(1.0,)``) share
+    a key. Hit and miss counts are approximate while threads race.
+
+    Examples:
+        >>> from threading import Barrier, Thread
+        >>>
+        >>> barrier = Barrier(4)
+        >>>
+        >>> @shared_cache
+        ... def make(key):
+        ...     barrier.wait()
+        ...     return object()
+        >>>
+        >>> results = []
+        >>> threads = [
+        ...     Thread(target=lambda: results.append(make('a'))) for _ in range(4)
+        ... ]
+        >>> for thread in threads:
+        ...     thread.start()
+        >>> for thread in threads:
+        ...     thread.join()
+        >>> len(set(map(id, results)))
+        1
+        >>> make('a') is results[0]
+        True
+        >>> make.cache_info().hits, make.cache_info().currsize
+        (1, 1)
+
+    """
+    cache: dict[Hashable, R] = {}
+    lock = Lock()
+    counts = [0, 0]
+
+    @wraps(fn)
+    def wrapper(*args: Hashable, **kwargs: Hashable) -> R:
+        key = (*args, KWD_MARK, *kwargs.items()) if kwargs else args
+
+        try:
+            result = cache[key]
+        except KeyError:
+            counts[1] += 1
+            value = fn(*args, **kwargs)
+
+            with lock:
+                result = cache.setdefault(key, value)
+        else:
+            counts[0] += 1
+
+        return result
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            counts[:] = [0, 0]
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(counts[0], counts[1], None, len(cache))
+
+    setattr(wrapper, "cache_clear", cache_clear)  # noqa: B010
+    setattr(wrapper, "cache_info", cache_info)  # noqa: B010
+    return wrapper  # pyright: ignore[reportReturnType]
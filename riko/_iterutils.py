@@ -35,6 +35,7 @@ from riko.types.values import PrimitiveValue, PrimitiveValueType, SortableValue
 
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 NON_SORTABLE = (Mapping, Sequence)
+PLAIN_TYPES = frozenset({str, int, float, Decimal, bool})
 
 B = TypeVar("B", Literal[True], Literal[False])
 T = TypeVar("T")
@@ -168,15 +169,29 @@ def def_itemgetter(
     _invalid_type = _type in {CastType.LOCATION, CastType.PASS, CastType.NONE}
     invalid_type = _invalid_type or (_type and _type not in CAST_SWITCH)
 
+    # A plain (non empty, non dotted, non index) key holding a primitive value
+    # can be read by a single lookup, skipping the path and sentinel parsing of
+    # ``get``
+    plain = attr and "." not in attr and not attr.isdigit()
+
     def keyfunc(item: Mapping | PrimitiveValue) -> SortableValue:
-        if isinstance(item, (dict, CaseInsensitiveDict, Mapping)):
+        value = None
+
+        if plain and isinstance(item, CaseInsensitiveDict):
+            try:
+                value = item[attr]
+            except KeyError:
+                pass
+
+        if type(value) in PLAIN_TYPES:
+            pass
+        elif isinstance(item, (dict, CaseInsensitiveDict, Mapping)):
             value = item.get(attr, default)
         else:
             value = item
 
-        msg = f"Invalid cast type={_type} for key '{attr}'."
-
         if invalid_type:
+            msg = f"Invalid cast type={_type} for key '{attr}'."
             casted = _resolve_uncastable(value, msg, default)
         elif _type:
             _casted = cast_value(value, CastType(_type))
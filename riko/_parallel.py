@@ -0,0 +1,1050 @@
+# vim: sw=4:ts=4:expandtab
+"""
+riko._parallel
+~~~~~~~~~~~~~~
+Streaming execution of a pipe over a worker pool: the upstream iterator is
+read lazily in chunks and at most `window` chunks are in flight at once, so a
+parallel stage neither waits for nor holds its whole upstream, and a slow
+consumer stops the pool from reading further ahead (backpressure).
+
+``imap_transport`` does the same for process pools with less pickling overhead,
+and ``QueueFeed`` instead overlaps whole stages: it runs an upstream stage in its
+own thread and hands its items over through a bounded queue. ``pool_registry``
+keeps warm pools alive across pipelines, and ``FuturesPool`` runs all of the
+above on any ``concurrent.futures`` executor (see ``SubmitExecutor``), e.g.,
+the subinterpreters of an ``InterpreterPool``.
+"""
+
+import atexit
+import pickle  # noqa: S403 (batches are exchanged with our own workers only)
+import sys
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent import futures
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from importlib import import_module
+from itertools import batched, islice
+from multiprocessing import cpu_count, get_all_start_methods, get_context
+from multiprocessing.pool import CLOSE, RUN, TERMINATE, AsyncResult
+from multiprocessing.pool import Pool as MPPool
+from queue import Empty, Full, Queue, SimpleQueue
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any, Protocol, Self, cast
+from uuid import uuid4
+
+# Default number of in-flight chunks per worker
+DEF_WINDOW_FACTOR = 2
+
+# Default number of items a pipelined stage may queue for the next one
+DEF_CAPACITY = 1024
+
+# Seconds a blocked feed thread waits before checking whether it was closed
+POLL_INTERVAL = 0.05
+
+# Default number of items per batch sent to a process pool worker
+DEF_TRANSPORT_BATCH = 256
+
+# Autotuning: the worker time to aim for per chunk, the largest chunk (in items
+# and in encoded result bytes), the seconds of throughput compared between
+# worker counts, the weight of the newest chunk in the moving averages, and the
+# relative change treated as noise
+TARGET_TASK_TIME = 0.02
+MAX_CHUNKSIZE = 4096
+MAX_BATCH_BYTES = 4 * 1024 * 1024
+TUNING_PERIOD = 0.1
+SMOOTHING = 0.3
+TOLERANCE = 0.05
+
+PROTOCOL = 5
+
+ITEM, DONE, ERROR = range(3)
+
+# Worker-side cache of unpickled pipelines, keyed per ``imap_transport`` call
+_PIPELINES: dict[str, Callable[[Any], Any]] = {}
+MAX_PIPELINES = 16
+
+# Python 3.14+ runs pools of subinterpreters, each with its own GIL
+try:
+    from concurrent.futures import (  # pyright: ignore[reportAttributeAccessIssue]
+        InterpreterPoolExecutor,
+    )
+except ImportError:
+    InterpreterPoolExecutor = None
+
+# Modules a registered (warm) worker imports before its first task
+WARM_MODULES = (
+    "riko.collections",
+    "riko.modules",
+    "riko.dotdict",
+    "riko.cast",
+    "riko.dates",
+    "riko.parsers",
+)
+
+# How ``ProcessPool`` starts its workers. Unlike ``fork``, neither is affected
+# by the threads this process may run (e.g., warm thread pools or the loop
+# bridge), and a fork server hands out workers with `WARM_MODULES` imported.
+START_METHOD = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+
+
+def is_free_threaded() -> bool:
+    """
+    Whether Python threads run in parallel, i.e., the interpreter is a
+    free-threaded build (e.g., ``python3.13t``) and the GIL is disabled. An
+    extension module without free-threading support re-enables the GIL when
+    imported, so check before each pool is created.
+
+    Examples:
+        >>> gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+        >>> is_free_threaded() is not gil_enabled
+        True
+
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return bool(is_gil_enabled) and not is_gil_enabled()
+
+
+class ApplyPool(Protocol):
+    def apply_async(  # noqa: E704
+        self,
+        func: Callable[..., Any],
+        args: Iterable[Any] = ...,
+        kwds: dict[str, Any] = ...,
+        callback: Callable[[Any], object] | None = ...,
+        error_callback: Callable[[BaseException], object] | None = ...,
+    ) -> AsyncResult[Any]: ...
+
+
+def imap_bounded[T, R](
+    pool: ApplyPool,
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    window: int | Callable[[], int],
+    ordered: bool = True,
+) -> Iterator[R]:
+    """
+    Lazily map `func` over `iterable` in `pool` with at most `window` calls in
+    flight. Unlike ``Pool.imap``, whose task feeder drains the whole input up
+    front, the next item is only read once a result has been taken.
+
+    Args:
+        pool (obj): A ``multiprocessing`` (or thread) pool
+        func (callable): The function to apply (must pickle for process pools)
+        iterable (Iter): The inputs
+        window (int or callable): The maximum number of calls in flight, or a
+            function returning it (read before each call, so it may change)
+        ordered (bool): Yield results in input order (default) rather than in
+            completion order
+
+    Yields:
+        The results of `func`
+
+    Examples:
+        >>> from multiprocessing.dummy import Pool
+        >>>
+        >>> with Pool(2) as pool:
+        ...     list(imap_bounded(pool, abs, [-1, 2, -3], 2))
+        [1, 2, 3]
+        >>> with Pool(2) as pool:
+        ...     sorted(imap_bounded(pool, abs, [-1, 2, -3], 2, ordered=False))
+        [1, 2, 3]
+
+    """
+    items = iter(iterable)
+    limit = window if callable(window) else lambda: window
+
+    if ordered:
+        pending: deque[AsyncResult[R]] = deque()
+
+        for item in items:
+            pending.append(pool.apply_async(func, (item,)))
+
+            while len(pending) >= max(limit(), 1):
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+    else:
+        done: SimpleQueue[tuple[bool, Any]] = SimpleQueue()
+        on_result = lambda result: done.put((True, result))  # noqa: E731
+        on_error = lambda error: done.put((False, error))  # noqa: E731
+        in_flight = 0
+
+        def take() -> R:
+            ok, value = done.get()
+
+            if not ok:
+                raise value
+
+            return value
+
+        for item in items:
+            args = (func, (item,))
+            pool.apply_async(*args, callback=on_result, error_callback=on_error)
+            in_flight += 1
+
+            while in_flight >= max(limit(), 1):
+                in_flight -= 1
+                yield take()
+
+        for _ in range(in_flight):
+            yield take()
+
+
+def chunkpipe[T, R](args: tuple[tuple[T, ...], Callable[[T], R]]) -> list[R]:
+    """
+    Apply a pipeline to each item of a chunk (see ``imap_chunks``).
+
+    Examples:
+        >>> chunkpipe(((1, 2), str))
+        ['1', '2']
+
+    """
+    chunk, pipeline = args
+    return [pipeline(item) for item in chunk]
+
+
+def timed[T, R](func: Callable[[T], R], args: T) -> tuple[float, R]:
+    """
+    Call `func` and also return how long it took (in the worker).
+
+    Examples:
+        >>> elapsed, result = timed(abs, -1)
+        >>> result, elapsed >= 0
+        (1, True)
+
+    """
+    start = perf_counter()
+    result = func(args)
+    return perf_counter() - start, result
+
+
+def gen_chunks[T](
+    iterable: Iterable[T], chunksize: Callable[[], int]
+) -> Iterator[tuple[T, ...]]:
+    """
+    Like ``itertools.batched`` but reads the (changing) size for each chunk.
+
+    Examples:
+        >>> sizes = iter([1, 2, 3, 4])
+        >>> list(gen_chunks(range(6), lambda: next(sizes)))
+        [(0,), (1, 2), (3, 4, 5)]
+
+    """
+    items = iter(iterable)
+
+    while chunk := tuple(islice(items, max(chunksize(), 1))):
+        yield chunk
+
+
+def _get_window(pool: ApplyPool, window: int | None) -> int:
+    workers = getattr(pool, "_processes", None) or 1
+    return workers * DEF_WINDOW_FACTOR if window is None else window
+
+
+def imap_chunks[T, R](
+    pool: ApplyPool,
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    chunksize: int = 1,
+    window: int | None = None,
+    ordered: bool = True,
+    tuner: "AutoTuner | None" = None,
+) -> Iterator[R]:
+    """
+    Like ``imap_bounded`` but ships `chunksize` items per task.
+
+    Args:
+        pool (obj): A ``multiprocessing`` (or thread) pool
+        func (callable): The function to apply (must pickle for process pools)
+        iterable (Iter): The inputs
+        chunksize (int): The number of items per task (default: 1)
+        window (int): The maximum number of chunks in flight (default: twice
+            the pool's worker count)
+        ordered (bool): Keep input order (default: True)
+        tuner (obj): An ``AutoTuner`` that picks the chunksize and the number
+            of chunks in flight instead
+
+    Yields:
+        The results of `func`
+
+    Examples:
+        >>> from multiprocessing.dummy import Pool
+        >>>
+        >>> with Pool(2) as pool:
+        ...     list(imap_chunks(pool, abs, range(-5, 0), chunksize=2))
+        [5, 4, 3, 2, 1]
+
+    """
+    if tuner:
+        chunks = ((chunk, func) for chunk in gen_chunks(iterable, tuner.get_chunksize))
+        timed_chunks = imap_bounded(
+            pool, partial(timed, chunkpipe), chunks, tuner.get_window, ordered
+        )
+        results = tuner.track((elapsed, chunk, 0) for elapsed, chunk in timed_chunks)
+    else:
+        chunks = ((chunk, func) for chunk in batched(iterable, max(chunksize, 1)))
+        window = _get_window(pool, window)
+        results = imap_bounded(pool, chunkpipe, chunks, window, ordered=ordered)
+
+    return (result for chunk in results for result in chunk)
+
+
+@dataclass
+class QueueStats:
+    """A snapshot of a ``QueueFeed``'s bounded queue."""
+
+    name: str
+    capacity: int
+    depth: int
+    peak: int
+    items: int
+
+
+class QueueFeed[T](Iterator[T]):
+    """
+    Runs `source` in a background thread that pushes its items into a bounded
+    queue, so the upstream stage overlaps with whatever consumes this iterator.
+    The thread blocks once `capacity` items are waiting (backpressure), errors
+    are re-raised in the consumer, and ``close`` stops the thread and closes
+    `source` from it.
+
+    Args:
+        source (Iter): The upstream stage
+        capacity (int): The maximum number of queued items (default:
+            DEF_CAPACITY)
+        name (str): A label for ``stats``
+
+    Examples:
+        >>> feed = QueueFeed(iter(range(5)), capacity=2, name='numbers')
+        >>> list(feed)
+        [0, 1, 2, 3, 4]
+        >>> stats = feed.stats
+        >>> (stats.name, stats.capacity, stats.depth, stats.items)
+        ('numbers', 2, 0, 5)
+
+    """
+
+    def __init__(
+        self, source: Iterable[T], capacity: int | None = None, name: str = ""
+    ):
+        self.source = source
+        self.capacity: int = max(capacity or DEF_CAPACITY, 1)
+        self.name = name
+        self.peak = self.items = 0
+        self._queue: Queue[tuple[int, Any]] = Queue(self.capacity)
+        self._stop = Event()
+        self._done = False
+        self._thread = Thread(target=self._produce, name=f"riko-feed-{name}")
+        self._thread.daemon = True
+
+    def _put(self, entry: tuple[int, Any]) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(entry, timeout=POLL_INTERVAL)
+            except Full:
+                continue
+            else:
+                return True
+
+        return False
+
+    def _produce(self) -> None:
+        items = iter(self.source)
+
+        try:
+            for item in items:
+                if not self._put((ITEM, item)):
+                    break
+            else:
+                self._put((DONE, None))
+        except BaseException as error:  # noqa: BLE001 (re-raised by the consumer)
+            self._put((ERROR, error))
+        finally:
+            if self._stop.is_set() and (close := getattr(items, "close", None)):
+                close()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def stats(self) -> QueueStats:
+        args = (self.name, self.capacity, self.depth, self.peak, self.items)
+        return QueueStats(*args)
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+
+        if not self._thread.is_alive() and not self._thread.ident:
+            self._thread.start()
+
+        self.peak = max(self.peak, self.depth)
+        kind, value = self._queue.get()
+
+        if kind == ITEM:
+            self.items += 1
+            return value
+
+        self._done = True
+
+        if kind == ERROR:
+            raise value
+
+        raise StopIteration
+
+    def close(self) -> None:
+        """Stop the background thread (draining its queue so it can exit)."""
+        self._done = True
+        self._stop.set()
+
+        if self._thread.ident:
+            while self._thread.is_alive():
+                with suppress(Empty):
+                    self._queue.get(timeout=POLL_INTERVAL)
+
+            self._thread.join()
+
+
+def _load_pipeline(key: str, blob: bytes) -> Callable[[Any], list[Any]]:
+    if (pipeline := _PIPELINES.get(key)) is None:
+        if len(_PIPELINES) >= MAX_PIPELINES:
+            del _PIPELINES[next(iter(_PIPELINES))]
+
+        pipeline = _PIPELINES[key] = pickle.loads(blob)  # noqa: S301
+
+    return pipeline
+
+
+def run_batch(args: tuple[str, bytes, bytes]) -> bytes:
+    """
+    Worker side of ``imap_transport``: decode a batch, run the (cached)
+    pipeline over each item and encode the results as one blob.
+
+    Examples:
+        >>> key, blob = 'doc', pickle.dumps(str)
+        >>> results = run_batch((key, blob, pickle.dumps([1, 2])))
+        >>> pickle.loads(results)
+        ['1', '2']
+
+    """
+    key, blob, payload = args
+    pipeline = _load_pipeline(key, blob)
+    items = pickle.loads(payload)  # noqa: S301
+    return pickle.dumps([pipeline(item) for item in items], PROTOCOL)
+
+
+def imap_transport[T, R](
+    pool: ApplyPool,
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    chunksize: int = DEF_TRANSPORT_BATCH,
+    window: int | None = None,
+    ordered: bool = True,
+    tuner: "AutoTuner | None" = None,
+) -> Iterator[R]:
+    """
+    Like ``imap_chunks`` but tuned for process pools. `func` is pickled once
+    (rather than once per chunk) and unpickled once per worker, and each
+    batch travels as a single protocol 5 pickle in either direction, so the
+    pool's own pickling only ever copies bytes. Results stream back one batch
+    at a time.
+
+    Args:
+        pool (obj): A ``multiprocessing`` process (or thread) pool
+        func (callable): The function to apply (must pickle)
+        iterable (Iter): The inputs (must pickle)
+        chunksize (int): The number of items per batch (default:
+            DEF_TRANSPORT_BATCH)
+        window (int): The maximum number of batches in flight (default: twice
+            the pool's worker count)
+        ordered (bool): Keep input order (default: True)
+        tuner (obj): An ``AutoTuner`` that picks the batch size and the number
+            of batches in flight instead
+
+    Yields:
+        The results of `func`
+
+    Examples:
+        >>> from multiprocessing.dummy import Pool
+        >>>
+        >>> with Pool(2) as pool:
+        ...     list(imap_transport(pool, abs, range(-5, 0), chunksize=2))
+        [5, 4, 3, 2, 1]
+
+    """
+    key, blob = uuid4().hex, pickle.dumps(func, PROTOCOL)
+    loads = cast(Callable[[bytes], list[R]], pickle.loads)  # noqa: S301
+
+    if tuner:
+        chunks = gen_chunks(iterable, tuner.get_chunksize)
+        tasks = ((key, blob, pickle.dumps(chunk, PROTOCOL)) for chunk in chunks)
+        args = (pool, partial(timed, run_batch), tasks, tuner.get_window, ordered)
+        decoded = (
+            (elapsed, loads(payload), len(payload))
+            for elapsed, payload in imap_bounded(*args)
+        )
+        results = tuner.track(decoded)
+    else:
+        chunks = batched(iterable, max(chunksize, 1))
+        tasks = ((key, blob, pickle.dumps(chunk, PROTOCOL)) for chunk in chunks)
+        window = _get_window(pool, window)
+        payloads = imap_bounded(pool, run_batch, tasks, window, ordered=ordered)
+        results = map(loads, payloads)
+
+    return (result for chunk in results for result in chunk)
+
+
+@dataclass
+class TuningStats:
+    """
+    What an ``AutoTuner`` has measured and chosen. Pass ``chunksize`` and
+    ``workers`` back in (e.g., ``SyncPipe(..., chunksize=..., workers=...)``) to
+    pin them.
+    """
+
+    chunksize: int
+    workers: int
+    items: int = 0
+    batches: int = 0
+    item_latency: float = 0.0
+    item_size: float = 0.0
+    throughput: float = 0.0
+    settled: bool = False
+
+
+class AutoTuner:
+    """
+    Picks the chunksize and the number of active workers (chunks in flight)
+    online. Each finished chunk updates moving averages of the per-item worker
+    time and encoded result size; the chunksize then follows the size that
+    takes about TARGET_TASK_TIME (and yields at most MAX_BATCH_BYTES), growing
+    at most twofold per chunk. Once it holds steady, the worker count is
+    lowered one at a time for as long as throughput holds up, and then settles.
+
+    Args:
+        workers (int): The pool size (the most workers that can be active)
+        chunksize (int): Pin the chunksize (default: tune it)
+        active (int): Pin the number of active workers (default: tune it)
+        start (int): The chunksize to start tuning from (default: 1)
+
+    Examples:
+        >>> tuner = AutoTuner(4)
+        >>> tuner.get_chunksize(), tuner.get_window()
+        (1, 4)
+        >>> tuner.record(1, 0.0001)
+        >>> tuner.record(2, 0.0002)
+        >>> tuner.stats.chunksize, tuner.stats.items, tuner.stats.batches
+        (4, 3, 2)
+        >>> pinned = AutoTuner(4, chunksize=8, active=2)
+        >>> pinned.record(8, 0.001)
+        >>> pinned.get_chunksize(), pinned.get_window()
+        (8, 2)
+
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        chunksize: int | None = None,
+        active: int | None = None,
+        start: int = 1,
+    ):
+        self.max_workers = max(workers, 1)
+        self.tune_chunksize = chunksize is None
+        self.tune_workers = active is None and self.max_workers > 1
+        _active = min(active or self.max_workers, self.max_workers)
+        self.stats = TuningStats(max(chunksize or start, 1), _active)
+        self.stats.settled = not (self.tune_chunksize or self.tune_workers)
+        self._period: tuple[float, int, int] | None = None
+        self._best = 0.0
+        self._previous: int | None = None
+
+    def get_chunksize(self) -> int:
+        return self.stats.chunksize
+
+    def get_window(self) -> int:
+        return self.stats.workers
+
+    def record(self, items: int, elapsed: float, size: int = 0) -> None:
+        """Account for a finished chunk of `items` (`size` result bytes)."""
+        stats = self.stats
+
+        if items:
+            latency, item_size = elapsed / items, size / items
+
+            if stats.batches:
+                stats.item_latency += SMOOTHING * (latency - stats.item_latency)
+                stats.item_size += SMOOTHING * (item_size - stats.item_size)
+            else:
+                stats.item_latency, stats.item_size = latency, item_size
+
+        stats.items += items
+        stats.batches += 1
+
+        if self.tune_chunksize:
+            self._tune_chunksize()
+
+        self._measure()
+
+    def _tune_chunksize(self) -> None:
+        stats = self.stats
+        ideal = TARGET_TASK_TIME / stats.item_latency if stats.item_latency else 0
+
+        if stats.item_size:
+            ideal = min(ideal or MAX_CHUNKSIZE, MAX_BATCH_BYTES / stats.item_size)
+
+        grown = stats.chunksize * 2
+        stats.chunksize = max(1, int(min(ideal or grown, grown, MAX_CHUNKSIZE)))
+
+    def _measure(self) -> None:
+        stats, now = self.stats, perf_counter()
+
+        if self._period is None:
+            self._period = (now, stats.items, stats.chunksize)
+        elif (elapsed := now - self._period[0]) >= TUNING_PERIOD:
+            _, items, chunksize = self._period
+            stats.throughput = (stats.items - items) / elapsed
+            self._period = (now, stats.items, stats.chunksize)
+
+            # Compare worker counts only while the chunksize holds steady
+            steady = abs(stats.chunksize - chunksize) <= chunksize * TOLERANCE
+
+            if self.tune_workers and steady and not stats.settled:
+                self._tune_workers(stats.throughput)
+
+    def _tune_workers(self, rate: float) -> None:
+        stats = self.stats
+
+        if self._previous is not None and rate < self._best * (1 - TOLERANCE):
+            # Fewer workers were slower, so go back and stay there
+            stats.workers = self._previous
+            stats.settled = True
+        elif stats.workers > 1:
+            self._best = max(self._best, rate)
+            self._previous = stats.workers
+            stats.workers -= 1
+        else:
+            stats.settled = True
+
+    def track[R](
+        self, chunks: Iterable[tuple[float, list[R], int]]
+    ) -> Iterator[list[R]]:
+        """Record each `(elapsed, results, size)` chunk and pass its results on."""
+        for elapsed, results, size in chunks:
+            self.record(len(results), elapsed, size)
+            yield results
+
+
+class FutureResult[R]:
+    """
+    A ``multiprocessing`` ``AsyncResult`` look-alike for a future.
+
+    Examples:
+        >>> future = futures.Future()
+        >>> result = FutureResult(future)
+        >>> result.ready()
+        False
+        >>> future.set_result(1)
+        >>> result.ready(), result.successful(), result.get()
+        (True, True, 1)
+
+    """
+
+    def __init__(self, future: futures.Future[R]) -> None:
+        self.future = future
+
+    def get(self, timeout: float | None = None) -> R:
+        return self.future.result(timeout)
+
+    def wait(self, timeout: float | None = None) -> None:
+        futures.wait([self.future], timeout)
+
+    def ready(self) -> bool:
+        return self.future.done()
+
+    def successful(self) -> bool:
+        if not self.ready():
+            raise ValueError(f"{self!r} not ready")
+
+        return self.future.exception() is None
+
+
+class SubmitExecutor(Protocol):
+    """
+    What riko needs of an executor: any ``concurrent.futures.Executor``, or an
+    object with the same ``submit`` and ``shutdown`` methods.
+    """
+
+    def submit(  # noqa: E704
+        self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+    ) -> futures.Future[Any]: ...
+    def shutdown(  # noqa: E704
+        self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None: ...
+
+
+def is_executor(obj: object) -> bool:
+    """
+    Whether `obj` is an executor (rather than, e.g., an executor name).
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>>
+        >>> with ThreadPoolExecutor(1) as executor:
+        ...     is_executor(executor), is_executor('thread')
+        (True, False)
+
+    """
+    return callable(getattr(obj, "submit", None))
+
+
+def shares_memory(executor: SubmitExecutor) -> bool:
+    """
+    Whether `executor` runs tasks on threads of this interpreter, so tasks and
+    results are passed by reference. Any other executor is assumed to pickle
+    them, like a process (or subinterpreter) pool does.
+
+    Examples:
+        >>> from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        >>>
+        >>> shares_memory(ThreadPoolExecutor(1))
+        True
+        >>> shares_memory(ProcessPoolExecutor(1))
+        False
+
+    """
+    isolated = InterpreterPoolExecutor and isinstance(executor, InterpreterPoolExecutor)
+    return isinstance(executor, futures.ThreadPoolExecutor) and not isolated
+
+
+class FuturesPool:
+    """
+    The parts of the ``multiprocessing`` pool interface riko uses, over a
+    ``concurrent.futures`` executor. Like a pool, it can be closed (no more
+    tasks), joined (wait for the submitted ones) or terminated (cancel the
+    queued ones and shut the executor down). ``cancel`` only cancels the
+    queued tasks submitted through this pool, and so leaves a shared executor
+    usable.
+
+    ``imap`` and ``imap_unordered`` stream: at most twice the worker count of
+    chunks are in flight, results are taken in input order or as they
+    complete, and the chunks still queued are cancelled when the caller stops
+    early. Executors that don't share memory get the pipeline and chunks as
+    bytes (see ``imap_transport``).
+
+    Args:
+        executor (obj): The ``concurrent.futures`` executor to submit to
+        workers (int): The executor's worker count (default: its
+            ``_max_workers``, else 1)
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>>
+        >>> with FuturesPool(ThreadPoolExecutor(2)) as pool:
+        ...     pool.apply_async(abs, (-1,)).get(), pool.map(abs, [-2, -3])
+        (1, [2, 3])
+        >>> pool.apply_async(abs, (-1,))
+        Traceback (most recent call last):
+            ...
+        ValueError: Pool not running
+
+    """
+
+    def __init__(self, executor: SubmitExecutor, workers: int | None = None):
+        self.executor = executor
+        self._processes: int = workers or getattr(executor, "_max_workers", None) or 1
+        self._state = RUN
+        self._pending: set[futures.Future[Any]] = set()
+        self.shares_memory = shares_memory(executor)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.terminate()
+
+    def submit[R](
+        self, func: Callable[..., R], *args: Any, **kwargs: Any
+    ) -> futures.Future[R]:
+        """Submit a call, tracking it until it is done (so it can be cancelled)."""
+        if self._state != RUN:
+            raise ValueError("Pool not running")
+
+        future = self.executor.submit(func, *args, **kwargs)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def apply_async[R](
+        self,
+        func: Callable[..., R],
+        args: Iterable[Any] = (),
+        kwds: dict[str, Any] | None = None,
+        callback: Callable[[R], object] | None = None,
+        error_callback: Callable[[BaseException], object] | None = None,
+    ) -> FutureResult[R]:
+        future = self.submit(func, *args, **(kwds or {}))
+
+        def done(future: futures.Future[R]) -> None:
+            # A cancelled call reports a ``CancelledError``, so nothing waits
+            # forever on its callback
+            cancelled = future.cancelled()
+            error = futures.CancelledError() if cancelled else future.exception()
+
+            if error is not None:
+                if error_callback:
+                    error_callback(error)
+            elif callback:
+                callback(future.result())
+
+        if callback or error_callback:
+            future.add_done_callback(done)
+
+        return FutureResult(future)
+
+    def _stream[T, R](
+        self,
+        func: Callable[[T], R],
+        iterable: Iterable[T],
+        chunksize: int,
+        ordered: bool,
+    ) -> Iterator[R]:
+        window = self._processes * DEF_WINDOW_FACTOR
+        chunks = ((chunk, func) for chunk in batched(iterable, max(chunksize, 1)))
+        pending: deque[futures.Future[list[R]]] = deque()
+
+        def take() -> list[R]:
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = next(futures.as_completed(pending))
+                pending.remove(future)
+
+            return future.result()
+
+        try:
+            for chunk in chunks:
+                pending.append(self.submit(chunkpipe, chunk))
+
+                while len(pending) >= window:
+                    yield from take()
+
+            while pending:
+                yield from take()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def imap[T, R](
+        self, func: Callable[[T], R], iterable: Iterable[T], chunksize: int = 1
+    ) -> Iterator[R]:
+        if self.shares_memory:
+            results = self._stream(func, iterable, chunksize, True)
+        else:
+            results = imap_transport(self, func, iterable, max(chunksize, 1))
+
+        return results
+
+    def imap_unordered[T, R](
+        self, func: Callable[[T], R], iterable: Iterable[T], chunksize: int = 1
+    ) -> Iterator[R]:
+        if self.shares_memory:
+            results = self._stream(func, iterable, chunksize, False)
+        else:
+            args = (self, func, iterable, max(chunksize, 1))
+            results = imap_transport(*args, ordered=False)
+
+        return results
+
+    def map[T, R](
+        self, func: Callable[[T], R], iterable: Iterable[T], chunksize: int = 1
+    ) -> list[R]:
+        return list(self.imap(func, iterable, chunksize))
+
+    def cancel(self) -> int:
+        """Cancel the queued tasks submitted through this pool (and count them)."""
+        return sum(future.cancel() for future in list(self._pending))
+
+    def close(self) -> None:
+        if self._state == RUN:
+            self._state = CLOSE
+
+    def terminate(self) -> None:
+        self._state = TERMINATE
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def join(self) -> None:
+        if self._state == RUN:
+            raise ValueError("Pool is still running")
+
+        self.executor.shutdown(wait=True)
+
+
+def has_interpreters() -> bool:
+    """
+    Whether ``InterpreterPool`` is available (Python 3.14+).
+
+    Examples:
+        >>> has_interpreters() == (sys.version_info >= (3, 14))
+        True
+
+    """
+    return InterpreterPoolExecutor is not None
+
+
+def InterpreterPool(  # noqa: N802
+    processes: int | None = None,
+    initializer: Callable[..., object] | None = None,
+    initargs: Iterable[Any] = (),
+) -> FuturesPool:
+    """
+    A pool of subinterpreters, each with its own GIL, so CPU-bound work runs in
+    parallel without the start up and memory cost of processes. Workers share
+    no objects with the caller (tasks and results are pickled), so it is
+    driven by ``imap_transport``, whose pipelines and batches cross over as
+    plain bytes.
+    """
+    if InterpreterPoolExecutor is None:
+        raise RuntimeError("Subinterpreter pools require Python 3.14+")
+
+    workers = processes or cpu_count()
+    kwargs = {"initializer": initializer, "initargs": tuple(initargs)}
+    return FuturesPool(InterpreterPoolExecutor(workers, **kwargs), workers)
+
+
+def ProcessPool(  # noqa: N802
+    processes: int | None = None,
+    initializer: Callable[..., object] | None = None,
+    initargs: Iterable[Any] = (),
+) -> MPPool:
+    """
+    A ``multiprocessing`` pool whose workers are started by `START_METHOD`, so
+    they are never forked from a (possibly multithreaded) caller.
+
+    Examples:
+        >>> with ProcessPool(1) as pool:
+        ...     pool.apply(len, ['abc'])
+        3
+
+    """
+    context = get_context(START_METHOD)
+
+    if START_METHOD == "forkserver":
+        context.set_forkserver_preload(list(WARM_MODULES))
+
+    return context.Pool(processes, initializer, tuple(initargs))
+
+
+def warm_worker(modules: Iterable[str] = WARM_MODULES) -> None:
+    """
+    Pool initializer that imports riko's heavier modules up front, so a
+    registered worker pays for them once rather than in its first task.
+
+    Examples:
+        >>> warm_worker(['riko.dotdict'])
+
+    """
+    for module in modules:
+        import_module(module)
+
+
+class PoolRegistry:
+    """
+    A process-wide set of warm worker pools, one per key (e.g., executor type).
+    ``acquire`` hands out (and, if needed, creates) the pool for a key and
+    ``release`` gives it back. Released pools stay running for the next pipeline
+    until ``shutdown``, which also runs at interpreter exit. A caller asking for
+    more workers than an idle pool has gets a larger pool in its place, while a
+    pool in use is shared as is (callers cap their own work in flight), so at
+    most one pool per key is ever kept.
+
+    Examples:
+        >>> from multiprocessing.dummy import Pool
+        >>>
+        >>> registry = PoolRegistry()
+        >>> pool = registry.acquire('thread', lambda: Pool(2), 2)
+        >>> registry.acquire('thread', lambda: Pool(4), 4) is pool
+        True
+        >>> registry.leases('thread')
+        2
+        >>> registry.release('thread')
+        >>> registry.release('thread')
+        >>> registry.leases('thread')
+        0
+        >>> registry.acquire('thread', lambda: Pool(1), 1) is pool
+        True
+        >>> registry.release('thread')
+        >>> larger = registry.acquire('thread', lambda: Pool(4), 4)
+        >>> larger is pool, larger._processes
+        (False, 4)
+        >>> registry.shutdown()
+        >>> registry.leases('thread')
+        0
+
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[Hashable, Any] = {}
+        self._leases: dict[Hashable, int] = {}
+        self._lock = Lock()
+
+    def acquire[P](
+        self, key: Hashable, factory: Callable[[], P], size: int | None = None
+    ) -> P:
+        """
+        Lease the pool for `key`, creating it with `factory` if need be, or
+        replacing it if it is idle and has fewer than `size` workers.
+        """
+        retired = None
+
+        with self._lock:
+            pool = self._pools.get(key)
+            workers = getattr(pool, "_processes", None)
+
+            if pool is None or getattr(pool, "_state", RUN) != RUN:
+                pool = self._pools[key] = factory()
+                self._leases[key] = 0
+            elif size and workers and workers < size and not self._leases[key]:
+                retired, pool = pool, factory()
+                self._pools[key] = pool
+
+            self._leases[key] += 1
+
+        if retired is not None:
+            retired.close()
+            retired.join()
+
+        return pool
+
+    def release(self, key: Hashable) -> None:
+        """Return a leased pool, leaving it running for later pipelines."""
+        with self._lock:
+            if self._leases.get(key):
+                self._leases[key] -= 1
+
+    def leases(self, key: Hashable) -> int:
+        """The number of pipelines currently holding the pool for `key`."""
+        return self._leases.get(key, 0)
+
+    def shutdown(self) -> None:
+        """Close idle pools, terminate leased ones, and forget them all."""
+        with self._lock:
+            pools, leases = self._pools, self._leases
+            self._pools, self._leases = {}, {}
+
+        for key, pool in pools.items():
+            pool.terminate() if leases.get(key) else pool.close()
+            pool.join()
+
+
+pool_registry = PoolRegistry()
+atexit.register(pool_registry.shutdown)
@@ -30,6 +30,7 @@ from typing import (
 import pygogo as gogo
 
 import riko.cast as cast_module
+from riko._cache import shared_cache
 from riko._objectify import Objectify
 from riko.dotdict import DotDict
 from riko.types.values import (
@@ -200,7 +201,8 @@ def _from_hashable(
 def repr_cache[R](fn: Callable[..., R]) -> ReprCacheWrapper[R]:
     """
     Memoize *fn* on repr-hashable args. Unsupported (unhashable) args bypass the
-    cache so distinct instances never collide on a shared key.
+    cache so distinct instances never collide on a shared key. The cache may be
+    shared by parallel threads (see ``riko._cache.shared_cache``).
 
     Examples:
         >>> calls = []
@@ -217,7 +219,7 @@ def repr_cache[R](fn: Callable[..., R]) -> ReprCacheWrapper[R]:
 
     """
 
-    @cache
+    @shared_cache
     def _cached(hashable_args: tuple, hashable_kwargs: tuple) -> R:
         args = tuple(_from_hashable(a) for a in hashable_args)
         kwargs = {k: _from_hashable(v) for k, v in hashable_kwargs}
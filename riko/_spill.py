@@ -0,0 +1,90 @@
+# vim: sw=4:ts=4:expandtab
+"""
+riko._spill
+~~~~~~~~~~~
+Disk-backed runs for operators whose working set may outgrow memory: items are
+pickled back to back into anonymous temp files (deleted on close) and read back
+lazily, so an external sort holds at most one run while writing and one item
+per run while merging.
+"""
+
+import pickle  # noqa: S403 (runs are written and read by this process only)
+from collections.abc import Callable, Iterable, Iterator
+from heapq import merge
+from itertools import batched, chain
+from tempfile import TemporaryFile
+from typing import IO, Any
+
+# Default number of items an operator may hold in memory before spilling
+DEF_BUDGET = 100_000
+
+
+def write_run(items: Iterable[Any]) -> IO[bytes]:
+    """
+    Pickle `items` into a temp file and rewind it for reading.
+
+    Examples:
+        >>> list(read_run(write_run([{'x': 1}, 'y', 2])))
+        [{'x': 1}, 'y', 2]
+
+    """
+    f = TemporaryFile()  # noqa: SIM115
+
+    # Items are pickled independently (rather than through one shared Pickler)
+    # so that neither side's memo pins every item of the run in memory
+    for item in items:
+        pickle.dump(item, f, pickle.HIGHEST_PROTOCOL)
+
+    f.seek(0)
+    return f
+
+
+def read_run(f: IO[bytes]) -> Iterator[Any]:
+    """Lazily unpickle the items of a run, closing (and deleting) it when done."""
+    with f:
+        while True:
+            try:
+                yield pickle.load(f)  # noqa: S301
+            except EOFError:
+                break
+
+
+def external_sort[T](
+    items: Iterable[T],
+    key: Callable[[T], Any] | None = None,
+    reverse: bool = False,
+    budget: int = DEF_BUDGET,
+) -> Iterator[T]:
+    """
+    Sort `items` like `sorted` but without holding more than `budget` of them
+    in memory. Each `budget` sized chunk is sorted and spilled to its own run,
+    and the runs are then merged lazily. Input that fits in a single chunk never
+    touches the disk. The sort is stable, so the output is identical to
+    `sorted(items, key=key, reverse=reverse)`.
+
+    Examples:
+        >>> items = [(x % 3, x) for x in range(8)]
+        >>> sorted_items = external_sort(items, key=lambda x: x[0], budget=3)
+        >>> list(sorted_items) == sorted(items, key=lambda x: x[0])
+        True
+        >>> list(external_sort('riko', reverse=True))
+        ['r', 'o', 'k', 'i']
+
+    """
+    chunks = batched(items, max(budget, 1))
+    first = next(chunks, ())
+    second = next(chunks, None)
+
+    if second is None:
+        yield from sorted(first, key=key, reverse=reverse)
+    else:
+        runs = [
+            write_run(sorted(chunk, key=key, reverse=reverse))
+            for chunk in chain([first, second], chunks)
+        ]
+
+        try:
+            yield from merge(*map(read_run, runs), key=key, reverse=reverse)
+        finally:
+            for run in runs:
+                run.close()
@@ -11,6 +11,7 @@ no-argument coroutine function) — anyio needs no reactor.
 """
 
 from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
 from typing import Any, Protocol, Unpack
 
 
@@ -37,10 +38,12 @@ except ImportError:
     async_partial: Callable[..., Any] = lambda *_: None
     async_return: Callable[..., Any] = lambda *_: None
     async_sleep: Callable[..., Any] = lambda *_: None
+    async_stream: Callable[..., Any] = lambda *_, **__: nullcontext()
     create_memory_object_stream: Callable[..., Any] | None = None
     create_task_group: Callable[..., Any] | None = None
     fail_after: Callable[..., Any] | None = None
     gather_results: Callable[..., Any] = lambda *_: None
+    http_client: Callable[..., Any] = lambda *_, **__: nullcontext()
     lowlevel: Any = None
     maybe_deferred: Callable[..., Any] = lambda *_: None
 
@@ -65,7 +68,9 @@ else:
         async_json,
         async_partial,
         async_return,
+        async_stream,
         gather_results,
+        http_client,
         maybe_deferred,
     )
 
@@ -86,12 +91,14 @@ __all__ = [
     "async_partial",
     "async_return",
     "async_sleep",
+    "async_stream",
     "backend",
     "checkpoint",
     "create_memory_object_stream",
     "create_task_group",
     "fail_after",
     "gather_results",
+    "http_client",
     "isasync",
     "issync",
     "lowlevel",
@@ -8,11 +8,15 @@ falls back to sync-only stubs when it is absent. ``run`` is the entry point
 (``run(main)`` where ``main`` is a no-argument coroutine function).
 """
 
-from collections.abc import Awaitable, Callable, Iterable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
 from functools import partial
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, cast
 
+from riko import DEF_CONNECTION_COUNT, DEF_HOST_CONNECTION_COUNT
+
 try:
     import anyio
     import httpx
@@ -20,15 +24,192 @@ except ImportError:
     anyio = httpx = None
 
 if TYPE_CHECKING:
-    from httpx import Response
+    from httpx import AsyncClient, Response
+
+
+class HttpClient:
+    """
+    A pooled ``httpx.AsyncClient`` shared by the requests of a running pipe or
+    collection, so they reuse (keep-alive) connections rather than each paying
+    for a new TCP and TLS handshake. At most `connections` requests are open at
+    once, and at most `host_connections` to any one host. A client passed in by
+    the caller is used as is (with its own limits) and left open.
+
+    Args:
+        connections (int): The maximum number of open connections (default:
+            DEF_CONNECTION_COUNT)
+        host_connections (int): The maximum number of open connections per
+            host (default: DEF_HOST_CONNECTION_COUNT)
+        client (obj): An ``httpx.AsyncClient`` to use instead of a new one
+
+    Examples:
+        >>> from riko.bado import run
+        >>>
+        >>> def handler(request):
+        ...     return httpx.Response(200, text=request.url.host)
+        >>>
+        >>> async def main():
+        ...     transport = httpx.MockTransport(handler)
+        ...     client = HttpClient(client=httpx.AsyncClient(transport=transport))
+        ...     response = await client.get('https://example.com/feed')
+        ...     await client.aclose()
+        ...     print(response.text, client.client.is_closed)
+        >>>
+        >>> run(main)
+        example.com False
+
+    """
+
+    def __init__(
+        self,
+        connections: int = DEF_CONNECTION_COUNT,
+        host_connections: int = DEF_HOST_CONNECTION_COUNT,
+        client: "AsyncClient | None" = None,
+    ) -> None:
+        if client is None:
+            limits = httpx.Limits(
+                max_connections=connections, max_keepalive_connections=connections
+            )
+            client = httpx.AsyncClient(follow_redirects=True, limits=limits)
+            self.owned = True
+        else:
+            self.owned = False
+
+        self.client: AsyncClient = client
+        self.host_connections = max(min(host_connections, connections), 1)
+        self._hosts: dict[str, anyio.CapacityLimiter] = {}
+
+    def _limiter(self, url: str) -> "anyio.CapacityLimiter":
+        host = httpx.URL(url).host
+
+        if (limiter := self._hosts.get(host)) is None:
+            limiter = anyio.CapacityLimiter(self.host_connections)
+            self._hosts[host] = limiter
+
+        return limiter
+
+    async def get(self, url: str, **kwargs: Any) -> "Response":
+        async with self._limiter(url):
+            return await self.client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, url: str, **kwargs: Any) -> AsyncGenerator["Response", None]:
+        """GET `url`, holding its host's connection until the body is read."""
+        async with self._limiter(url), self.client.stream("GET", url, **kwargs) as r:
+            yield r
+
+    async def aclose(self) -> None:
+        """Close the client (and its connections) if it was created here."""
+        if self.owned:
+            await self.client.aclose()
+
+
+# The client shared by the pipe or collection running in this context
+_active_client: ContextVar[HttpClient | None] = ContextVar(
+    "riko_http_client", default=None
+)
+
+
+@asynccontextmanager
+async def http_client(
+    connections: int = DEF_CONNECTION_COUNT, client: "AsyncClient | None" = None
+) -> AsyncGenerator[HttpClient, None]:
+    """
+    Route ``async_get`` (and so e.g. ``async_url_open``) through one pooled
+    ``HttpClient`` until the block exits, when the client is closed. Tasks
+    started inside the block share it too. Without an explicit `client`, a
+    block nested in another reuses the outer one, so a whole pipeline (or
+    collection) shares a single connection pool.
+
+    Examples:
+        >>> from riko.bado import run
+        >>>
+        >>> async def main():
+        ...     async with http_client(4) as outer:
+        ...         async with http_client() as inner:
+        ...             print(inner is outer, outer.client.is_closed)
+        ...     print(outer.client.is_closed)
+        >>>
+        >>> run(main)
+        True False
+        True
+
+    """
+    active = _active_client.get()
+
+    if active and not active.client.is_closed and client is None:
+        yield active
+    else:
+        pooled = HttpClient(connections, client=client)
+        token = _active_client.set(pooled)
+
+        try:
+            yield pooled
+        finally:
+            # An async generator may be finalized in another context
+            with suppress(ValueError):
+                _active_client.reset(token)
+
+            await pooled.aclose()
 
 
 async def async_get(url: str, **kwargs: Any) -> "Response":
     if kwargs.get("timeout") == 0:
         kwargs["timeout"] = None
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        return await client.get(url, **kwargs)
+    kwargs.setdefault("follow_redirects", True)
+
+    active = _active_client.get()
+
+    if active and not active.client.is_closed:
+        response = await active.get(url, **kwargs)
+    else:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(url, **kwargs)
+
+    return response
+
+
+@asynccontextmanager
+async def async_stream(url: str, **kwargs: Any) -> AsyncGenerator["Response", None]:
+    """
+    Like ``async_get``, but the response body is left unread so it can be
+    consumed incrementally (e.g., with ``aiter_bytes``) before the block exits.
+
+    Examples:
+        >>> from riko.bado import run
+        >>>
+        >>> def handler(request):
+        ...     return httpx.Response(200, content=b'riko')
+        >>>
+        >>> async def main():
+        ...     transport = httpx.MockTransport(handler)
+        ...     client = httpx.AsyncClient(transport=transport)
+        ...
+        ...     async with http_client(client=client):
+        ...         async with async_stream('https://example.com') as response:
+        ...             print([chunk async for chunk in response.aiter_bytes(2)])
+        >>>
+        >>> run(main)
+        [b'ri', b'ko']
+
+    """
+    if kwargs.get("timeout") == 0:
+        kwargs["timeout"] = None
+
+    kwargs.setdefault("follow_redirects", True)
+
+    active = _active_client.get()
+
+    if active and not active.client.is_closed:
+        async with active.stream(url, **kwargs) as response:
+            yield response
+    else:
+        async with (
+            httpx.AsyncClient() as client,
+            client.stream("GET", url, **kwargs) as response,
+        ):
+            yield response
 
 
 async def async_json(response: "Response") -> dict[str, Any]:
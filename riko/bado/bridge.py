@@ -0,0 +1,297 @@
+# vim: sw=4:ts=4:expandtab
+"""
+riko.bado.bridge
+~~~~~~~~~~~~~~~~
+Runs async riko pipelines for sync callers on a background event loop.
+
+A ``LoopBridge`` runs one anyio event loop in a daemon thread (via a
+``BlockingPortal``). ``iterate`` exposes an ``AsyncPipe``, ``AsyncCollection``,
+or any other async iterable as an ordinary blocking iterator that reads at most
+``prefetch`` items ahead of its consumer and cancels the async side on
+``close``. ``client`` hands out a pooled ``httpx.AsyncClient`` for the loop, so
+repeated calls reuse both the loop and its connections. ``get_bridge`` returns
+the process-wide bridge, whose loop starts on first use and stops at exit.
+
+Examples:
+    basic usage::
+
+        >>> from riko import get_path
+        >>> from riko.bado.bridge import get_bridge
+        >>> from riko.collections import AsyncPipe
+        >>>
+        >>> bridge = get_bridge()
+        >>> url = get_path('feed.xml')
+        >>> pipe = AsyncPipe('fetch', conf={'url': url}, client=bridge.client())
+        >>>
+        >>> with bridge.iterate(pipe) as stream:
+        ...     next(stream)['title']
+        'Donations'
+
+"""
+
+import atexit
+import os
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterator
+from concurrent.futures import Future, wait
+from contextlib import ExitStack
+from threading import Lock
+from typing import TYPE_CHECKING, Self
+from weakref import WeakSet
+
+from riko import DEF_CONNECTION_COUNT
+from riko._cache import shared_cache
+from riko.bado import create_memory_object_stream
+
+try:
+    import httpx
+    from anyio import TASK_STATUS_IGNORED, CancelScope, EndOfStream
+    from anyio.abc import TaskStatus
+    from anyio.from_thread import BlockingPortal, start_blocking_portal
+except ImportError:
+    httpx = start_blocking_portal = None
+    TASK_STATUS_IGNORED = CancelScope = EndOfStream = None
+
+if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectSendStream
+    from httpx import AsyncClient
+
+# The number of items a blocking iterator reads ahead of its consumer
+PREFETCH = 16
+
+# Every live bridge, so a forked child can reset them
+_BRIDGES: "WeakSet[LoopBridge]" = WeakSet()
+
+
+class BlockingStream[T](Iterator[T]):
+    """
+    A blocking iterator over an async iterable that a producer task reads on a
+    bridge's loop, at most `prefetch` items ahead. `close` cancels the producer
+    (which closes the async iterable on the loop) and waits for it to stop. An
+    error raised by the async iterable is re-raised once the items read before
+    it are consumed.
+
+    Args:
+        portal (obj): The ``BlockingPortal`` of the loop to read on
+        aiterable (AsyncIterable): The items to read
+        prefetch (int): The most items read ahead of the consumer (default:
+            PREFETCH)
+
+    Examples:
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> with get_bridge().iterate(async_iter(range(3)), prefetch=1) as stream:
+        ...     list(stream)
+        [0, 1, 2]
+
+    """
+
+    def __init__(
+        self,
+        portal: "BlockingPortal",
+        aiterable: AsyncIterable[T],
+        prefetch: int = PREFETCH,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError("prefetch cannot be negative")
+
+        send, self._receive = create_memory_object_stream[T](max_buffer_size=prefetch)
+        self._portal = portal
+        self._future: Future[None]
+        self._future, self._scope = portal.start_task(self._produce, aiterable, send)
+        self.closed: bool = False
+
+    async def _produce(
+        self,
+        aiterable: AsyncIterable[T],
+        send: "MemoryObjectSendStream[T]",
+        *,
+        task_status: "TaskStatus[CancelScope]" = TASK_STATUS_IGNORED,
+    ) -> None:
+        with CancelScope() as scope:
+            task_status.started(scope)
+            source = aiter(aiterable)
+
+            try:
+                async with send:
+                    async for item in source:
+                        await send.send(item)
+            finally:
+                # `AsyncPipe.aclose` also marks the pipe closed. Don't shield it:
+                # a new scope would sit above any task group the iterable has open.
+                aclose = getattr(aiterable, "aclose", getattr(source, "aclose", None))
+
+                if aclose is not None:
+                    await aclose()
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> T:
+        if self.closed:
+            raise StopIteration
+
+        try:
+            item = self._portal.call(self._receive.receive)
+        except EndOfStream:
+            self.close()
+            self._future.result()
+            raise StopIteration from None
+
+        return item
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop reading: cancel the producer and wait for it (idempotent)."""
+        if not self.closed:
+            self.closed = True
+
+            if not self._future.done():
+                self._portal.call(self._scope.cancel)
+
+            wait([self._future])
+            self._portal.call(self._receive.close)
+
+
+class LoopBridge:
+    """
+    An event loop running in a background thread, which sync code uses to run
+    async pipelines. The loop starts on first use and is stopped by `close` (or
+    at exit), after which the next use starts a new one.
+
+    Examples:
+        >>> from riko.bado import async_return
+        >>>
+        >>> with LoopBridge() as bridge:
+        ...     bridge.run(async_return, 'hi')
+        ...     bridge.client(4) is bridge.client(4)
+        'hi'
+        True
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._stack = ExitStack()
+        self._portal: BlockingPortal | None = None
+        self._clients: dict[int, AsyncClient] = {}
+        self._forked: tuple[object, ...] = ()
+
+        _BRIDGES.add(self)
+
+    def _reset(self) -> None:
+        # Keep the parent's loop objects alive: finalizing them here could block
+        # on a lock the (now missing) loop thread held when the process forked
+        self._forked = (self._portal, self._stack, self._clients)
+        self._lock = Lock()
+        self._stack = ExitStack()
+        self._portal = None
+        self._clients = {}
+
+    @property
+    def portal(self) -> "BlockingPortal":
+        """The portal of the running loop (starting it if need be)."""
+        return self._start()
+
+    def _start(self) -> "BlockingPortal":
+        with self._lock:
+            if self._portal is None:
+                if start_blocking_portal is None:
+                    raise RuntimeError("The loop bridge needs anyio and httpx")
+
+                manager = start_blocking_portal(name="riko-loop-bridge")
+                self._portal = self._stack.enter_context(manager)
+                atexit.register(self.close)
+
+            return self._portal
+
+    def run[R](self, func: Callable[..., Awaitable[R]], *args: object) -> R:
+        """Call `func(*args)` on the loop and block until it returns."""
+        return self.portal.call(func, *args)
+
+    def iterate[T](
+        self, aiterable: AsyncIterable[T], prefetch: int = PREFETCH
+    ) -> BlockingStream[T]:
+        """Read `aiterable` on the loop through a blocking iterator."""
+        return BlockingStream(self.portal, aiterable, prefetch)
+
+    def client(self, connections: int = DEF_CONNECTION_COUNT) -> "AsyncClient":
+        """
+        The loop's pooled ``httpx.AsyncClient`` holding at most `connections`
+        connections. Pass it as an async pipe or collection's `client` so its
+        connections outlive the call. The bridge closes it.
+        """
+        # start the loop first so `close` sees (and closes) the client
+        self._start()
+
+        with self._lock:
+            if (client := self._clients.get(connections)) is None:
+                limits = httpx.Limits(
+                    max_connections=connections, max_keepalive_connections=connections
+                )
+                client = httpx.AsyncClient(follow_redirects=True, limits=limits)
+                self._clients[connections] = client
+
+        return client
+
+    def close(self) -> None:
+        """Close the pooled clients and stop the loop (idempotent)."""
+        with self._lock:
+            portal, stack = self._portal, self._stack
+            clients = list(self._clients.values())
+            self._portal, self._stack = None, ExitStack()
+            self._clients = {}
+
+        if portal:
+            atexit.unregister(self.close)
+
+            with stack:
+                for client in clients:
+                    portal.call(client.aclose)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def _reset_bridges() -> None:
+    # A forked child has no loop thread, so each bridge starts anew on first use
+    for bridge in _BRIDGES:
+        bridge._reset()
+
+
+os.register_at_fork(after_in_child=_reset_bridges)
+
+
+@shared_cache
+def get_bridge() -> LoopBridge:
+    """
+    The bridge shared by the process, e.g., by every ``SyncCollection`` with
+    ``backend='async'``.
+
+    Examples:
+        >>> get_bridge() is get_bridge()
+        True
+
+    """
+    return LoopBridge()
+
+
+def iterate[T](aiterable: AsyncIterable[T], prefetch: int = PREFETCH) -> Iterator[T]:
+    """
+    Read `aiterable` through a blocking iterator on the shared bridge's loop.
+
+    Examples:
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> list(iterate(async_iter('abc')))
+        ['a', 'b', 'c']
+
+    """
+    return get_bridge().iterate(aiterable, prefetch)
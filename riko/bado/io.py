@@ -4,6 +4,12 @@ riko.bado.io
 ~~~~~~~~~~~~
 Async file/url reading for riko pipes (anyio + httpx).
 
+``async_url_open`` and ``async_url_read`` read a whole body at once. To parse a
+body while it downloads (in constant memory), stream its chunks with
+``async_url_chunks`` and hand them to ``async_lines``, ``AsyncChunkReader``
+(e.g., for ``ijson.items_async``; ``AsyncReplayReader`` can also rewind), or
+``async_parse`` (for a sync parser).
+
 Examples:
     basic usage::
 
@@ -12,18 +18,57 @@ Examples:
 
 """
 
-from io import BytesIO, TextIOWrapper
+import re
+from codecs import getincrementaldecoder
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+)
+from contextlib import aclosing
+from io import BufferedReader, BytesIO, RawIOBase, TextIOWrapper
 from logging import Logger
 from typing import Literal, overload
 
 import pygogo as gogo
 
 from riko import ENCODING
-from riko.bado import Path, async_get, async_sleep
+from riko.bado import (
+    Path,
+    async_get,
+    async_sleep,
+    async_stream,
+    create_memory_object_stream,
+    create_task_group,
+)
+from riko.bado.itertools import unwrap_close
 from riko.paths import get_abspath
 
+try:
+    from anyio import (
+        BrokenResourceError,
+        ClosedResourceError,
+        EndOfStream,
+        from_thread,
+        to_thread,
+    )
+except ImportError:
+    from_thread = to_thread = None
+    BrokenResourceError = ClosedResourceError = EndOfStream = None
+
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
+# The number of bytes read at a time from a streamed body
+CHUNK_SIZE = 64 * 1024
+
+# The number of parsed items a sync parser may get ahead of its consumer
+PARSE_BUFFER = 64
+
+# Universal newlines, as translated by ``TextIOWrapper``
+NEWLINES = re.compile(r"\r\n?")
+
 
 class NamedTextIOWrapper(TextIOWrapper):
     _name: str = ""
@@ -37,6 +82,267 @@ class NamedTextIOWrapper(TextIOWrapper):
         self._name = value
 
 
+class AsyncChunkReader:
+    """
+    An async file-like ``read`` over an async iterator of byte chunks, e.g.,
+    for ``ijson.items_async``. A read returns at most one chunk.
+
+    Examples:
+        >>> from riko.bado import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> async def main():
+        ...     reader = AsyncChunkReader(async_iter([b'abc', b'de']))
+        ...     print(await reader.read(2), await reader.read(), await reader.read())
+        >>>
+        >>> run(main)
+        b'ab' b'c' b'de'
+
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self.chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        if not self._buffer:
+            self._buffer = await anext(self.chunks, b"")
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        return data
+
+
+class AsyncReplayReader(AsyncChunkReader):
+    """
+    An ``AsyncChunkReader`` that keeps what it reads until ``replay`` rewinds
+    it to the start, e.g., to peek at a document before parsing it for real.
+
+    Examples:
+        >>> from riko.bado import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> async def main():
+        ...     reader = AsyncReplayReader(async_iter([b'abc', b'de']))
+        ...     print(await reader.read(2))
+        ...     reader.replay()
+        ...     print(await reader.read(), await reader.read(), await reader.read())
+        >>>
+        >>> run(main)
+        b'ab'
+        b'abc' b'de' b''
+
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        super().__init__(chunks)
+        self._read: list[bytes] | None = []
+
+    async def read(self, size: int = -1) -> bytes:
+        data = await super().read(size)
+
+        if self._read is not None:
+            self._read.append(data)
+
+        return data
+
+    def replay(self) -> None:
+        """Rewind to the start (once), and stop keeping what is read."""
+        if self._read is not None:
+            self._buffer = b"".join(self._read) + self._buffer
+            self._read = None
+
+
+class _BlockingReader(RawIOBase):
+    """
+    A raw file (for a sync parser running in a worker thread) that receives
+    its bytes from the event loop.
+    """
+
+    def __init__(self, receive: Callable[[], bytes]) -> None:
+        self._receive = receive
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: "bytearray | memoryview") -> int:  # type: ignore[override]
+        if not self._buffer:
+            try:
+                self._buffer = from_thread.run(self._receive)
+            except (EndOfStream, ClosedResourceError):
+                pass
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+async def async_url_chunks(
+    url: str, timeout: float = 0, chunk_size: int = CHUNK_SIZE
+) -> AsyncGenerator[bytes, None]:
+    """
+    Stream the body of a url (or file) in chunks, so that it never has to be
+    held in memory all at once. A response body is streamed as its chunks
+    arrive (rather than regrouped, which would delay the first one), and a file
+    is read `chunk_size` bytes at a time.
+
+    Examples:
+        >>> from riko import get_path
+        >>> from riko.bado import run
+        >>>
+        >>> async def main():
+        ...     chunks = async_url_chunks(get_path('lorem.txt'), chunk_size=8)
+        ...     print(await anext(chunks))
+        ...     await chunks.aclose()
+        >>>
+        >>> run(main)
+        b'What is '
+
+    """
+    if url.startswith("http"):
+        async with async_stream(url, timeout=timeout) as response:
+            async for chunk in response.aiter_bytes():
+                yield chunk
+    else:
+        path = url.replace("file://", "")
+
+        f = await Path(path).open("rb")
+
+        try:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+        finally:
+            # Close synchronously since `aclose` can't run once the consumer's
+            # task group is cancelled (e.g., when it stops reading early)
+            f.wrapped.close()
+
+
+async def async_lines(
+    chunks: AsyncIterable[bytes], encoding: str = ENCODING
+) -> AsyncGenerator[str, None]:
+    r"""
+    Decode and split a stream of byte chunks into lines, as iterating a text
+    file would, i.e., with universal newlines translated to '\n'.
+
+    Examples:
+        >>> from riko.bado import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> async def main():
+        ...     chunks = async_iter([b'a\r', b'\nb\xc3', b'\xa9\rc'])
+        ...     print([line async for line in async_lines(chunks)])
+        >>>
+        >>> run(main)
+        ['a\n', 'bé\n', 'c']
+
+    """
+    decoder = getincrementaldecoder(encoding)()
+    pending = ""
+
+    async for chunk in chunks:
+        text = pending + decoder.decode(chunk)
+
+        # A '\r' ending the chunk may be the first half of a '\r\n'
+        cut = len(text) - 1 if text.endswith("\r") else len(text)
+        *lines, pending = NEWLINES.sub("\n", text[:cut]).split("\n")
+        pending += text[cut:]
+
+        for line in lines:
+            yield f"{line}\n"
+
+    text = NEWLINES.sub("\n", pending + decoder.decode(b"", final=True))
+    *lines, last = text.split("\n")
+
+    for line in lines:
+        yield f"{line}\n"
+
+    if last:
+        yield last
+
+
+async def async_parse[T](
+    chunks: AsyncGenerator[bytes, None],
+    parse: Callable[..., Iterable[T]],
+    encoding: str = ENCODING,
+    binary: bool = False,
+    name: str = "",
+    buffer: int = PARSE_BUFFER,
+) -> AsyncGenerator[T, None]:
+    """
+    Run a sync, file based parser (e.g., ``meza.io.read_csv``) over a stream
+    of byte chunks as they arrive. The parser runs in a worker thread and reads
+    a (non-seekable) file fed from the stream, and its items are passed back
+    (at most `buffer` ahead of the consumer) as it yields them. The chunks are
+    closed along with the returned generator.
+
+    Examples:
+        >>> from riko.bado import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> async def main():
+        ...     chunks = async_iter([b'a\\nb', b'c\\n'])
+        ...     parse = lambda f: map(str.strip, f)
+        ...     print([line async for line in async_parse(chunks, parse)])
+        >>>
+        >>> run(main)
+        ['a', 'bc']
+
+    """
+    chunk_send, chunk_receive = create_memory_object_stream[bytes](1)
+    item_send, item_receive = create_memory_object_stream[T](buffer)
+    errors: list[BaseException] = []
+
+    async def pump() -> None:
+        # The chunks are read and closed in this one task (see ``HttpClient``)
+        async with chunk_send, aclosing(chunks):
+            try:
+                async for chunk in chunks:
+                    await chunk_send.send(chunk)
+            except BrokenResourceError:
+                pass
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+    def work() -> None:
+        raw = BufferedReader(_BlockingReader(chunk_receive.receive))
+
+        if binary:
+            f: BufferedReader | NamedTextIOWrapper = raw
+        else:
+            f = NamedTextIOWrapper(raw, encoding=encoding)
+            f.name = name
+
+        try:
+            for item in parse(f):
+                from_thread.run(item_send.send, item)
+        except (BrokenResourceError, ClosedResourceError):
+            pass
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+        finally:
+            from_thread.run_sync(chunk_receive.close)
+            from_thread.run_sync(item_send.close)
+
+    async with unwrap_close(), create_task_group() as tg:
+        tg.start_soon(pump)
+        tg.start_soon(to_thread.run_sync, work)
+
+        try:
+            async with item_receive:
+                async for item in item_receive:
+                    yield item
+        finally:
+            tg.cancel_scope.cancel()
+
+    if errors:
+        raise errors[0]
+
+
 async def _read_bytes(url: str, timeout: float) -> tuple[bytes, str]:
     if url.startswith("http"):
         response = await async_get(url, timeout=timeout)
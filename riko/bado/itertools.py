@@ -25,6 +25,7 @@ sliding window of per-item slots consumed in submission order) for the same boun
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator, AsyncIterable, Awaitable, Callable, Iterable
+from contextlib import aclosing, asynccontextmanager
 from functools import partial
 from inspect import isawaitable
 from typing import cast, overload
@@ -325,6 +326,40 @@ async def _pool_stream[T, S](
                 yield result
 
 
+@asynccontextmanager
+async def unwrap_close() -> AsyncGenerator[None, None]:
+    """
+    Turn the close signal of an async generator that is closed early while it
+    runs a task group (e.g., one iterating ``async_map_stream``) back into a
+    clean close. The task group re-raises the generator's ``GeneratorExit`` as
+    a one-member ``BaseExceptionGroup``; anything else in the group propagates.
+
+    Examples:
+        >>> from riko import issync, run
+        >>>
+        >>> async def main():
+        ...     try:
+        ...         async with unwrap_close():
+        ...             raise BaseExceptionGroup('closed', [GeneratorExit()])
+        ...     except GeneratorExit:
+        ...         print('closed')
+        >>>
+        >>> if issync:
+        ...     print('closed')
+        ... else:
+        ...     run(main)
+        closed
+
+    """
+    try:
+        yield
+    except BaseExceptionGroup as eg:
+        if eg.split(GeneratorExit)[1] is not None:
+            raise
+
+        raise GeneratorExit from None
+
+
 async def async_map_stream[T, S](
     func: Callable[[T], Awaitable[S]],
     source: AsyncIterable[T] | Iterable[T],
@@ -376,8 +411,13 @@ async def async_map_stream[T, S](
     async def drain(item: T, results: MemoryObjectSendStream[S]) -> None:
         await results.send(await func(item))
 
-    async for result in _pool_stream(source, drain, limit=limit, buffer=buffer):
-        yield result
+    pool = _pool_stream(source, drain, limit=limit, buffer=buffer)
+
+    # Close the pool here (not in a GC finalizer) so its task group exits in the
+    # task that entered it
+    async with unwrap_close(), aclosing(pool):
+        async for result in pool:
+            yield result
 
 
 async def async_map_ordered_stream[T, S](
@@ -476,5 +516,9 @@ async def async_merge[S](
             if (aclose := getattr(items, "aclose", None)) is not None:
                 await aclose()
 
-    async for item in _pool_stream(feeds, drain, limit=limit, buffer=buffer):
-        yield item
+    pool = _pool_stream(feeds, drain, limit=limit, buffer=buffer)
+
+    # See `async_map_stream`
+    async with unwrap_close(), aclosing(pool):
+        async for item in pool:
+            yield item
@@ -1,5 +1,7 @@
+from collections import deque
 from collections.abc import Awaitable, Callable, Iterator
 from functools import partial
+from importlib import import_module
 from itertools import chain
 from multiprocessing import Pool
 from multiprocessing.dummy import Pool as ThreadPool
@@ -7,6 +9,7 @@ from time import sleep, time
 from timeit import repeat
 
 from riko import get_path
+from riko._parallel import imap_chunks
 from riko.bado import async_sleep, isasync
 from riko.bado import run as async_run
 from riko.bado.itertools import async_map
@@ -17,16 +20,20 @@ from riko.collections import (
     SyncPipe,
     get_chunksize,
     get_worker_cnt,
+    listpipe,
 )
 from riko.modules.fetch import async_pipe as async_fetch
 from riko.modules.fetch import pipe as fetch
+from riko.modules.join import pipe as join
+from riko.modules.sort import pipe as sort
+from riko.modules.strreplace import pipe as strreplace
 from riko.types.general import (
     AsyncPipeParser,
     Items,
     ParserMaterializedOutput,
     ProcessorWrapperOutput,
 )
-from riko.types.modules import FetchConf
+from riko.types.modules import FetchConf, JoinConf, SortConf, SortConfRule
 from riko.types.values import RSSEntry
 
 NUMBER = 1
@@ -56,7 +63,51 @@ sources: list[dict[str, str]] = [{"url": url} for url in urls]
 length: int = len(files)
 iterable: list[float] = [DELAY for _ in files]
 
+# Scaling benchmarks: each variant runs at every size so growth is visible
+JOIN_SIZES: list[int] = [250, 500, 1000]
+JOIN_STRATEGIES: list[str] = ["nested", "hash", "merge"]
+SORT_SIZES: list[int] = [10_000, 100_000]
+SORT_VARIANTS: list[str] = ["full", "top10", "spill"]
+SORT_BUDGET: int = 5_000
+CHAIN_SIZES: list[int] = [10_000]
+CHAIN_VARIANTS: list[str] = ["unfused", "fused"]
+
+# Pipeline-parallel benchmarks: a slow (I/O-bound) source feeding CPU-bound
+# stages, run in one thread or with each stage behind its own bounded queue
+PIPELINE_SIZES: list[int] = [2_000]
+PIPELINE_VARIANTS: list[str] = ["sequential", "pipelined"]
+PIPELINE_DELAY: float = 0.0002
+
+# Parallel transport benchmarks: a process pool fed per-chunk pickles of the
+# pipeline and items (the old transport) or batched blobs, and a thread pool
+PARALLEL_SIZES: list[int] = [20_000]
+PARALLEL_VARIANTS: list[str] = ["thread", "process_chunks", "process_batched"]
+
+# Executor benchmarks: a regex heavy (CPU-bound) pipeline on each executor.
+# Threads only scale on a free-threaded interpreter (e.g., python3.13t); with
+# the GIL enabled, the free-threaded executor falls back to processes.
+EXECUTOR_SIZES: list[int] = [20_000]
+EXECUTOR_VARIANTS: list[str] = ["thread", "process", "free_threaded"]
+
+# Grouped aggregation benchmarks: a sum by key run in one thread or with each
+# chunk summed in the worker pool and the partial sums combined
+AGGREGATE_SIZES: list[int] = [100_000]
+AGGREGATE_VARIANTS: list[str] = ["sequential", "partitioned"]
+
+# Processor throughput benchmarks: items/sec through each processor, fed either
+# a whole stream at once or one item per invocation (as a mapped pipe does)
+PROCESSOR_ITEMS: int = 5_000
+PROCESSOR_CONFS: dict[str, dict[str, object]] = {
+    "strreplace": {"rule": {"find": "hello", "replace": "bye"}},
+    "strtransform": {"rule": {"transform": "title"}},
+    "hash": {},
+    "slugify": {},
+    "simplemath": {"op": "multiply", "other": "3"},
+    "typecast": {"type": "int"},
+}
+
 type AsyncFunc = Callable[..., Awaitable[Iterator[RSSEntry]]]
+type ScalingTest = tuple[str, Callable[[], object]]
 
 
 def baseline_sync() -> list[None]:
@@ -95,6 +146,120 @@ def par_sync_collection() -> Items:
     return list(SyncCollection(sources, parallel=True, sleep=DELAY))
 
 
+def join_items(strategy: str, size: int) -> Items:
+    items = ({"id": f"id-{x}", "sum": x} for x in range(size))
+    other = [{"key": f"id-{x}", "count": x} for x in range(size)]
+    conf = JoinConf({"join_key": "id", "other_join_key": "key", "strategy": strategy})
+    return list(join(items, conf=conf, other=other))
+
+
+def sort_items(variant: str, size: int) -> Items:
+    items = ({"rank": x % 97, "name": f"name-{x}"} for x in range(size))
+    rules = [SortConfRule(field="rank"), SortConfRule(field="name", dir="desc")]
+    conf = SortConf(rule=rules)
+    limit = 10 if variant == "top10" else None
+    budget = SORT_BUDGET if variant == "spill" else None
+    return list(sort(items, conf=conf, limit=limit, budget=budget))
+
+
+def chain_items(variant: str, size: int) -> Items:
+    items = ({"content": f"Hello World {x}"} for x in range(size))
+    replace = {"rule": {"find": "Hello", "replace": "Bye"}}
+    transform = {"rule": {"transform": "upper"}}
+    flow = SyncPipe("strreplace", source=items, conf=replace, fuse=variant == "fused")
+    return list(flow.strtransform(conf=transform).hash().slugify())
+
+
+def gen_slow_items(size: int) -> Items:
+    for x in range(size):
+        sleep(PIPELINE_DELAY)
+        yield {"content": f"Hello World {x}"}
+
+
+def pipeline_items(variant: str, size: int) -> Items:
+    pipelined = variant == "pipelined"
+    flow = SyncPipe("hash", source=gen_slow_items(size), pipelined=pipelined)
+    rule = {"field": "content", "match": r"(\w+) (\w+)", "replace": "$2 $1"}
+    transform = {"rule": {"transform": "title"}}
+    return list(flow.regex(conf={"rule": rule}).strtransform(conf=transform).slugify())
+
+
+def parallel_items(variant: str, size: int) -> Items:
+    # a generator (like any upstream pipe) has no length to size chunks by
+    items = ({"content": f"Hello World {x}", "id": x} for x in range(size))
+    conf = {"rule": {"find": "Hello", "replace": "Bye"}}
+
+    if variant == "process_chunks":
+        workers = get_worker_cnt(0, False)
+        func = partial(listpipe, pipeline=partial(strreplace, conf=conf))
+
+        with Pool(workers) as pool:
+            chunks = imap_chunks(pool, func, items, get_chunksize(0, workers))
+            results = list(chain.from_iterable(chunks))
+    else:
+        threads = variant == "thread"
+        kwargs = {"conf": conf, "parallel": True, "threads": threads}
+
+        with (flow := SyncPipe("strreplace", source=items, **kwargs)):
+            results = list(flow)
+
+    return results
+
+
+def executor_items(variant: str, size: int) -> Items:
+    items = ({"content": f"Hello World {x} " * 8} for x in range(size))
+    rule = {"field": "content", "match": r"(\w+) (\w+) (\d+)", "replace": "$3 $2 $1"}
+    kwargs = {"parallel": True, "executor": variant, "ordered": True}
+
+    with (flow := SyncPipe("regex", source=items, conf={"rule": rule}, **kwargs)):
+        results = list(flow)
+
+    return results
+
+
+def aggregate_items(variant: str, size: int) -> Items:
+    items = ({"key": f"key-{x % 97}", "amount": x} for x in range(size))
+    conf = {"sum_key": "amount", "group_key": "key"}
+    parallel = variant == "partitioned"
+
+    with (flow := SyncPipe("sum", source=items, conf=conf, parallel=parallel)):
+        results = list(flow)
+
+    return results
+
+
+def gen_scaling_tests(
+    name: str, func: Callable[[str, int], object], variants: list[str], sizes: list[int]
+) -> list[ScalingTest]:
+    return [
+        (f"{name}_{variant}_{size}", partial(func, variant, size))
+        for variant in variants
+        for size in sizes
+    ]
+
+
+def processor_rate(name: str, per_item: bool = False) -> float:
+    pipe = import_module(f"riko.modules.{name}").pipe
+    conf = PROCESSOR_CONFS[name]
+    items = ({"content": f"{x} hello world"} for x in range(PROCESSOR_ITEMS))
+    start = time()
+
+    if per_item:
+        deque(chain.from_iterable(pipe(item, conf=conf) for item in items), 0)
+    else:
+        deque(pipe(items, conf=conf), 0)
+
+    return PROCESSOR_ITEMS / (time() - start)
+
+
+def print_rates(max_chars: int) -> None:
+    msg = "{0} - {1:,.0f} items/sec (per item: {2:,.0f} items/sec)"
+
+    for name in PROCESSOR_CONFS:
+        padded = name.zfill(max_chars).replace("0", " ")
+        print(msg.format(padded, processor_rate(name), processor_rate(name, True)))
+
+
 async def baseline_async() -> list[None]:
     return await async_map(async_sleep, iterable)
 
@@ -169,13 +334,37 @@ def main() -> None:
         async_tests = []
         combined_tests = sync_tests
 
-    max_chars = max(list(map(len, combined_tests)))
+    scaling_tests = gen_scaling_tests("join", join_items, JOIN_STRATEGIES, JOIN_SIZES)
+    scaling_tests += gen_scaling_tests("sort", sort_items, SORT_VARIANTS, SORT_SIZES)
+    scaling_tests += gen_scaling_tests(
+        "chain", chain_items, CHAIN_VARIANTS, CHAIN_SIZES
+    )
+    scaling_tests += gen_scaling_tests(
+        "pipeline", pipeline_items, PIPELINE_VARIANTS, PIPELINE_SIZES
+    )
+    scaling_tests += gen_scaling_tests(
+        "parallel", parallel_items, PARALLEL_VARIANTS, PARALLEL_SIZES
+    )
+    scaling_tests += gen_scaling_tests(
+        "executor", executor_items, EXECUTOR_VARIANTS, EXECUTOR_SIZES
+    )
+    scaling_tests += gen_scaling_tests(
+        "aggregate", aggregate_items, AGGREGATE_VARIANTS, AGGREGATE_SIZES
+    )
+    scaling_names = [name for name, _ in scaling_tests]
+    max_chars = max(list(map(len, combined_tests + scaling_names)))
 
     for test in sync_tests:
         results = run(f"{test}()", setup=f"from riko.cli.benchmark import {test}")
         run_time, units = parse_results(results)
         print_time(test, max_chars, run_time, units)
 
+    for name, scaling_test in scaling_tests:
+        run_time, units = parse_results(run(scaling_test))
+        print_time(name, max_chars, run_time, units)
+
+    print_rates(max_chars)
+
     if isasync:
         async_run(run_async, async_tests, max_chars)
 
@@ -89,23 +89,34 @@ from collections.abc import (
     AsyncIterable,
     Callable,
     Generator,
+    Hashable,
     Iterable,
+    Iterator,
     Mapping,
+    Sequence,
 )
 from contextlib import aclosing
 from enum import StrEnum
 from functools import partial
 from inspect import isawaitable
 from io import StringIO
-from itertools import chain, repeat
+from itertools import batched, chain, groupby, repeat
 from logging import Logger
-from multiprocessing import Pool as CPUPool
 from multiprocessing import cpu_count
 from multiprocessing.dummy import Pool as ThreadPool
 from multiprocessing.pool import Pool as CPUPoolType
 from multiprocessing.pool import ThreadPool as ThreadPoolType
-from operator import length_hint
-from typing import Any, Literal, Protocol, Self, TypeGuard, cast, overload
+from operator import itemgetter, length_hint
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    Protocol,
+    Self,
+    TypeGuard,
+    cast,
+    overload,
+)
 
 import pygogo as gogo
 
@@ -123,19 +134,40 @@ from meza import io
 
 from riko import DEF_CONNECTION_COUNT
 from riko._iterutils import listize
+from riko._parallel import (
+    DEF_TRANSPORT_BATCH,
+    DEF_WINDOW_FACTOR,
+    AutoTuner,
+    FuturesPool,
+    InterpreterPool,
+    ProcessPool,
+    QueueFeed,
+    QueueStats,
+    SubmitExecutor,
+    TuningStats,
+    has_interpreters,
+    imap_chunks,
+    imap_transport,
+    is_executor,
+    is_free_threaded,
+    pool_registry,
+    shares_memory,
+    warm_worker,
+)
 from riko._pubsub import sync_hub
-from riko.bado import async_return
+from riko.bado import async_return, http_client, issync
+from riko.bado.bridge import PREFETCH, BlockingStream, get_bridge
 from riko.bado.itertools import (
     async_iter,
-    async_map,
     async_map_ordered_stream,
-    async_map_stream,
     async_merge,
+    unwrap_close,
 )
 from riko.context import Context, ExecutionMode, parse_context
 from riko.exceptions import PipelineStateError
 from riko.ext.names import ModuleNameLike, normalize_module_name
 from riko.ext.resolver import pipe_resolver
+from riko.modules._decorators import DEF_BATCH_SIZE
 from riko.types.general import (
     AsyncPipeParser,
     AsyncSource,
@@ -145,17 +177,23 @@ from riko.types.general import (
     Feed,
     Function,
     Item,
+    ItemOrValue,
     Items,
     ParserOutput,
     SkipIf,
     SplitterParserOutput,
+    Stage,
     Stream,
     SyncPipeParser,
 )
-from riko.types.values import BasicValue, Inputs
+from riko.types.values import Inputs
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
 
-type AnyPool = ThreadPoolType | CPUPoolType
+type AnyPool = ThreadPoolType | CPUPoolType | FuturesPool
 type PoolFactory = Callable[..., AnyPool]
+type ExecutorLike = Executor | str | SubmitExecutor
 
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
@@ -203,9 +241,113 @@ def _is_template(obj: object) -> TypeGuard[TemplatePipe]:
     )
 
 
+def get_sort_limit(name: str | None, conf: Conf | None) -> tuple[int, bool] | None:
+    """
+    How many items a ``truncate`` (from the start) or ``tail`` (from the end)
+    needs from a sorted source, so the ``sort`` can select just those. Only
+    static integer confs qualify.
+
+    Examples:
+        >>> get_sort_limit('truncate', {'start': '2', 'count': 3})
+        (5, False)
+        >>> get_sort_limit('tail', {'count': 3})
+        (3, True)
+        >>> get_sort_limit('tail', {'count': {'terminal': 'count'}})
+        >>> get_sort_limit('filter', {})
+
+    """
+    conf = conf or {}
+
+    if name == "truncate":
+        values, from_end = [conf.get("start", 0), conf.get("count", 0)], False
+    elif name == "tail":
+        values, from_end = [conf.get("count")], True
+    else:
+        values, from_end = [], False
+
+    try:
+        limit = (sum(map(int, values)), from_end) if values else None
+    except (TypeError, ValueError):
+        limit = None
+
+    return limit
+
+
+def gen_fused(
+    item: ItemOrValue, stages: Sequence[Stage], owned: bool = False
+) -> Stream:
+    """
+    Run `item` through consecutive processor `stages` (see ``wrapper.stage``)
+    as a single step. The item is parsed once on entry, and each stage then
+    assigns its result onto that same item in place. Only a result which isn't
+    the item it was handed (e.g., an emitted value) is parsed anew, just as
+    the next (unfused) pipe would.
+
+    Examples:
+        >>> from riko.modules.strtransform import pipe
+        >>>
+        >>> rule = {'rule': {'transform': 'upper'}}
+        >>> upper = pipe.stage(conf=rule, assign='upper')
+        >>> rule = {'rule': {'transform': 'title'}}
+        >>> title = pipe.stage(conf=rule, field='upper', assign='title')
+        >>> item = {'content': 'hello world'}
+        >>> next(gen_fused(item, [upper, title]))
+        {'content': 'hello world', 'upper': 'HELLO WORLD', 'title': 'Hello World'}
+        >>> item
+        {'content': 'hello world'}
+
+    """
+    _input, processed = stages[0](item, owned)
+    rest = stages[1:]
+
+    for result in processed:
+        if rest:
+            yield from gen_fused(result, rest, result is _input)
+        else:
+            yield result
+
+
+def gen_fused_chunk(
+    chunk: Iterable[ItemOrValue], stages: Sequence[tuple[bool, Callable[..., Any]]]
+) -> Stream:
+    """
+    Run a `chunk` of items through consecutive processor `stages` as a single
+    step. Each stage is a `(batch, func)` pair. Runs of per-item stages are
+    fused as in ``gen_fused``, while a batch stage (the pipeline of a processor
+    with ``batch=True``) is handed the whole chunk, just as if it were unfused.
+
+    Examples:
+        >>> from riko.modules import strreplace, strtransform
+        >>>
+        >>> rule = {'rule': {'find': 'hello', 'replace': 'bye'}}
+        >>> replace = partial(strreplace.pipe, conf=rule, assign='bye')
+        >>> rule = {'rule': {'transform': 'title'}}
+        >>> title = strtransform.pipe.stage(conf=rule, field='bye')
+        >>> stages = [(True, replace), (False, title)]
+        >>> chunk = [{'content': 'hello world'}, {'content': 'hello you'}]
+        >>> [item['strtransform'] for item in gen_fused_chunk(chunk, stages)]
+        ['Bye World', 'Bye You']
+
+    """
+    items: Iterator[ItemOrValue] = iter(chunk)
+
+    for batch, group in groupby(stages, itemgetter(0)):
+        funcs = [func for _, func in group]
+
+        if batch:
+            for func in funcs:
+                items = iter(func(items))
+        else:
+            fused = partial(gen_fused, stages=funcs)
+            items = chain.from_iterable(map(fused, items))
+
+    yield from items
+
+
 class PoolScope(StrEnum):
     PIPE = "pipe"
     PIPELINE = "pipeline"
+    PROCESS = "process"
 
 
 class PipeState(StrEnum):
@@ -220,13 +362,70 @@ class Executor(StrEnum):
     INLINE = "inline"
     THREAD = "thread"
     PROCESS = "process"
+    FREE_THREADED = "free_threaded"
+    INTERPRETER = "interpreter"
 
 
 _POOLS: dict[Executor, PoolFactory] = {
     Executor.THREAD: ThreadPool,
-    Executor.PROCESS: CPUPool,
+    Executor.PROCESS: ProcessPool,
+    Executor.FREE_THREADED: ThreadPool,
+    Executor.INTERPRETER: InterpreterPool,
 }
 
+# Executors whose workers are threads of this process
+THREADED = {Executor.THREAD, Executor.FREE_THREADED}
+
+# Executors that need interpreter support (else processes stand in for them)
+_SUPPORTED: dict[Executor, Callable[[], bool]] = {
+    Executor.FREE_THREADED: is_free_threaded,
+    Executor.INTERPRETER: has_interpreters,
+}
+
+
+def get_executor(
+    parallel: bool, threads: bool | None = True, executor: ExecutorLike | None = None
+) -> Executor:
+    """
+    The executor a pipe or collection runs on. An explicit `executor` wins over
+    `threads`. The free-threaded executor runs CPU-bound work on threads, so it
+    falls back to processes while the GIL is enabled, as does the interpreter
+    executor before Python 3.14. A ``concurrent.futures`` executor instance
+    runs like threads if it shares memory with the caller, else like processes.
+
+    Examples:
+        >>> get_executor(False, executor='process')
+        <Executor.INLINE: 'inline'>
+        >>> get_executor(True, threads=False)
+        <Executor.PROCESS: 'process'>
+        >>> free = get_executor(True, executor='free_threaded')
+        >>> free == ('free_threaded' if is_free_threaded() else 'process')
+        True
+        >>> subs = get_executor(True, executor='interpreter')
+        >>> subs == ('interpreter' if has_interpreters() else 'process')
+        True
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>>
+        >>> with ThreadPoolExecutor(1) as pool:
+        ...     get_executor(True, threads=False, executor=pool)
+        <Executor.THREAD: 'thread'>
+
+    """
+    if not parallel:
+        resolved = Executor.INLINE
+    elif is_executor(executor):
+        executor = cast(SubmitExecutor, executor)
+        resolved = Executor.THREAD if shares_memory(executor) else Executor.PROCESS
+    elif executor:
+        resolved = Executor(cast(Executor | str, executor))
+
+        if (supported := _SUPPORTED.get(resolved)) and not supported():
+            resolved = Executor.PROCESS
+    else:
+        resolved = Executor.THREAD if threads else Executor.PROCESS
+
+    return resolved
+
 
 class _Lifecycle:
     """
@@ -278,26 +477,98 @@ class _Lifecycle:
 
 
 class _PoolHandle:
-    """Shared pool state, including whether riko owns the pool."""
+    """
+    Shared pool state, including whether riko owns the pool and (if riko
+    created it) its ``executor``. A pool leased from ``pool_registry``
+    (``lease`` is its registry key) is handed back rather than shut down, and
+    stays warm for the next pipeline.
+    """
 
-    def __init__(self, pool: AnyPool, *, owned: bool) -> None:
+    def __init__(
+        self,
+        pool: AnyPool,
+        *,
+        owned: bool,
+        lease: Hashable | None = None,
+        executor: Executor | None = None,
+    ) -> None:
         self.pool: AnyPool | None = pool
         self.owned = owned
+        self.lease = lease
+        self.executor = executor
 
     def __bool__(self) -> bool:
         return self.pool is not None
 
     def close(self) -> None:
-        if self.owned and (pool := self.pool):
+        if self.lease is not None and self.pool:
+            pool_registry.release(self.lease)
+            self.pool = None
+        elif self.owned and (pool := self.pool):
             pool.close()
             pool.join()
             self.pool = None
+        elif isinstance(pool := self.pool, FuturesPool):
+            # Drop the work still queued on the caller's executor (e.g., when
+            # the consumer stopped early) but leave the executor running
+            pool.cancel()
 
     def terminate(self) -> None:
-        if self.owned and (pool := self.pool):
+        if self.lease is not None and self.pool:
+            # Other pipelines may be using the pool, so only give it back
+            pool_registry.release(self.lease)
+            self.pool = None
+        elif self.owned and (pool := self.pool):
             pool.terminate()
             pool.join()
             self.pool = None
+        elif isinstance(pool := self.pool, FuturesPool):
+            pool.cancel()
+
+
+def _borrow_pool(
+    pool: AnyPool | None, executor: ExecutorLike | None, workers: int | None
+) -> _PoolHandle | None:
+    """
+    A handle to the caller's pool or ``concurrent.futures`` executor (if any),
+    which riko uses but never shuts down.
+    """
+    if pool and is_executor(executor):
+        raise TypeError("pool and an executor instance cannot both be provided")
+    elif is_executor(executor):
+        borrowed = FuturesPool(cast(SubmitExecutor, executor), workers)
+        handle = _PoolHandle(borrowed, owned=False)
+    elif pool:
+        handle = _PoolHandle(pool, owned=False)
+    else:
+        handle = None
+
+    return handle
+
+
+def _new_pool_handle(
+    executor: Executor, workers: int | None, scope: PoolScope
+) -> _PoolHandle:
+    """
+    A handle to a fresh pool, or to the warm registry pool for the executor if
+    `scope` is ``PoolScope.PROCESS``. The registry keeps one pool per executor,
+    which may have more `workers` than asked for. The executor is resolved
+    again first since e.g. importing an extension module may have re-enabled
+    the GIL (and so ruled out the free-threaded executor) in the meantime.
+    """
+    executor = get_executor(True, executor=executor)
+    factory = partial(_POOLS[executor], workers)
+
+    if scope == PoolScope.PROCESS:
+        if executor in {Executor.PROCESS, Executor.INTERPRETER}:
+            factory = partial(factory, initializer=warm_worker)
+
+        pool = pool_registry.acquire(executor, factory, workers)
+        handle = _PoolHandle(pool, owned=False, lease=executor, executor=executor)
+    else:
+        handle = _PoolHandle(factory(), owned=True, executor=executor)
+
+    return handle
 
 
 def _settle_iter(current: Stream | None) -> Stream:
@@ -508,6 +779,27 @@ class PyPipe(_Lifecycle):
             ids = cast(dict[str, int], self.kwargs.get("ids", {}))
             sync_hub.notify_complete(ids)
 
+    def _start(self, **hints: object) -> Stream | AsyncStream:
+        """Start streaming (if not yet started), passing `hints` to the module."""
+        raise NotImplementedError
+
+    def _push_down_limit(self) -> None:
+        """
+        Turn ``sort`` → ``truncate``/``tail`` into a top-k selection by starting
+        a not yet started ``sort`` source with how many items will be kept.
+        """
+        source = self.source
+        conf = cast(Conf | None, self.kwargs.get("conf"))
+
+        if (
+            isinstance(source, PyPipe)
+            and source.name == "sort"
+            and source.state is PipeState.NEW
+            and (sort_limit := get_sort_limit(self.name, conf))
+        ):
+            limit, from_end = sort_limit
+            source._start(limit=limit, from_end=from_end)
+
     def _definitional_kwargs(self) -> dict[str, object]:
         """
         Module-behavior kwargs (``field``/``assign``/``emit``/…), excluding runtime
@@ -520,7 +812,56 @@ class PyPipe(_Lifecycle):
 
 
 class SyncPipe(PyPipe):
-    """A synchronous Pipe object"""
+    """
+    A synchronous Pipe object
+
+    Consecutive sequential processor pipes, e.g.,
+    ``SyncPipe('fetch').strreplace().strtransform()``, are fused into a single
+    per-item step when iterated (see ``gen_fused``). Pass ``fuse=False`` to
+    run (and debug) each pipe separately; the setting carries down the chain.
+
+    A ``parallel=True`` pipe streams its source through the worker pool in
+    chunks of ``chunksize`` items, keeping at most ``window`` chunks in flight
+    (default: twice the worker count). Results are yielded in completion order
+    unless ``ordered=True``, and the source is only read as results are taken.
+    Process pools (``threads=False``) receive the pipeline once and exchange
+    whole batches as single pickles (see ``riko._parallel.imap_transport``).
+    ``executor='free_threaded'`` instead runs CPU-bound stages on one thread per
+    core when the interpreter is free-threaded (e.g., ``python3.13t``), and on
+    processes while the GIL is enabled. On Python 3.14+,
+    ``executor='interpreter'`` runs them on a pool of subinterpreters (each
+    with its own GIL) that are sent the pipeline and batches as bytes, like
+    processes are (and falls back to processes on older versions).
+    ``executor`` overrides ``threads``. It may also be any
+    ``concurrent.futures`` executor (or object with the same ``submit`` and
+    ``shutdown`` methods), which the chain then shares and leaves running:
+    a ``ThreadPoolExecutor`` runs like threads, and any other executor is sent
+    pickled pipelines and batches, like processes. Work it still has queued
+    for the pipe is cancelled once the pipe is closed or fails.
+    Unless ``autotune=False``, the chunksize and the number of active workers
+    (chunks in flight) that aren't given are tuned as the pipe runs from the
+    measured per-item latency and result size; ``tuning`` reports the choice.
+    Operators that can be aggregated piecewise (``count``, ``sum``, ``uniq``)
+    run in the pool too: each worker computes a partial result for whole
+    chunks of the source, and the partials are merged in source order into
+    what the sequential operator would have yielded.
+
+    By default a parallel pipe creates a pool shared by its chain
+    (``pool_scope='pipeline'``) or by itself alone (``'pipe'``), and shuts it
+    down afterwards. With ``pool_scope='process'`` it instead leases the warm,
+    pre-imported pool for its executor type from
+    ``riko._parallel.pool_registry``, so later pipelines skip the pool startup.
+    The pool may be shared with (and larger than) other pipes, so each keeps
+    at most twice its ``workers`` chunks in flight unless given a ``window``.
+    Leased pools keep running until interpreter exit (or
+    ``pool_registry.shutdown()``).
+
+    A ``pipelined=True`` pipe instead runs its upstream stage (or fused group of
+    stages) in a background thread that feeds it through a bounded queue of
+    ``capacity`` items, so e.g. an I/O-bound fetch overlaps with CPU-bound
+    stages downstream. The setting carries down the chain; ``capacity`` is set
+    per pipe and ``queue_stats()`` reports each queue's depth.
+    """
 
     def __init__(
         self,
@@ -530,15 +871,20 @@ class SyncPipe(PyPipe):
         *,
         _pool_handle: _PoolHandle | None = None,
         assign: str | None = None,
+        autotune: bool = True,
+        capacity: int | None = None,
         chunksize: int | None = None,
         context: Context | None = None,
+        executor: ExecutorLike | None = None,
         field: str | None = None,
         func: Function | None = None,
+        fuse: bool = True,
         inputs: Inputs | None = None,
         mode: ExecutionMode | None = None,
         ordered: bool | None = False,
         others: Iterable[str] | Iterable[Stream] | None = None,
         parallel: bool = False,
+        pipelined: bool = False,
         pool: AnyPool | None = None,
         pool_scope: PoolScope = PoolScope.PIPELINE,
         skip_if: SkipIf | None = None,
@@ -546,6 +892,7 @@ class SyncPipe(PyPipe):
         test: bool | None = False,
         threads: bool | None = True,
         verbose: bool | None = False,
+        window: int | None = None,
         workers: int | None = None,
         **kwargs: object,
     ):
@@ -567,13 +914,18 @@ class SyncPipe(PyPipe):
             verbose=verbose,
             **kwargs,
         )
-        self.threads: bool = bool(threads)
-
-        if parallel:
-            self.executor = Executor.THREAD if self.threads else Executor.PROCESS
-        else:
-            self.executor = Executor.INLINE
-
+        self.executor: Executor = get_executor(parallel, threads, executor)
+        self.threads: bool = self.executor in THREADED if executor else bool(threads)
+        self._executor: ExecutorLike | None = executor
+        self.fuse: bool = fuse
+        self.window: int | None = window
+        self.autotune: bool = autotune
+        self.tune_chunksize: bool = autotune and not chunksize
+        self.tune_workers: bool = autotune and not (workers or window)
+        self._tuner: AutoTuner | None = None
+        self.pipelined: bool = pipelined
+        self.capacity: int | None = capacity
+        self._feed: QueueFeed[Item] | None = None
         self.pool_scope: PoolScope = pool_scope
         self.ordered = ordered
         self._iter: Stream | None = None
@@ -584,44 +936,62 @@ class SyncPipe(PyPipe):
 
         self.map: Callable[..., Iterable[Stream]]
 
-        if pool_scope not in {"pipe", "pipeline"}:
-            raise ValueError("pool_scope must be either 'pipe' or 'pipeline'")
+        if pool_scope not in set(PoolScope):
+            raise ValueError(
+                "pool_scope must be one of 'pipe', 'pipeline' or 'process'"
+            )
 
         if pool and _pool_handle:
             raise TypeError("pool and _pool_handle cannot both be provided")
-        elif pool:
-            self._pool_handle: _PoolHandle | None = _PoolHandle(pool, owned=False)
+        elif _pool_handle:
+            self._pool_handle: _PoolHandle | None = _pool_handle
         else:
-            self._pool_handle = _pool_handle
+            self._pool_handle = _borrow_pool(pool, executor, workers)
 
         if self.name:
             self._pipe: SyncPipeParser = pipe_resolver.resolve(self.name, "pipe")
             self.pollable: bool = getattr(self._pipe, "pollable")  # noqa: B009
             self.loopable: bool = getattr(self._pipe, "loopable")  # noqa: B009
             self.mapify: bool = self.loopable and self.source is not None
-            self.parallelize: bool = self.parallel and self.mapify
+            combinable = hasattr(self._pipe, "combine") and self.source is not None
+            self.partitioned: bool = self.parallel and combinable
+            self.parallelize: bool = self.parallel and (self.mapify or combinable)
+            self.batch: bool = getattr(self._pipe, "batch", False)
         else:
             self._pipe = lambda source, **_: source
             self.pollable = self.loopable = self.mapify = self.parallelize = False
+            self.batch = self.partitioned = False
 
         if self.parallelize:
             length = length_hint(self.source)
-            def_pool = _POOLS.get(self.executor)
-            self.workers: int | None = workers or get_worker_cnt(length, self.threads)
+            io_bound = self.executor == Executor.THREAD
+
+            if is_executor(executor):
+                size = getattr(self.pool, "_processes", None)
+                self.workers: int | None = workers or size
+            else:
+                self.workers = workers or get_worker_cnt(length, io_bound)
+
             self.chunksize: int = chunksize or get_chunksize(length, self.workers)
 
+            if not (chunksize or length or self.threads):
+                self.chunksize = DEF_TRANSPORT_BATCH
+
             if not self._pool_handle:
-                new_pool = def_pool(self.workers)
-                self._pool_handle = _PoolHandle(new_pool, owned=True)
+                args = (self.executor, self.workers, pool_scope)
+                self._pool_handle = _new_pool_handle(*args)
 
-            if not (pool := self.pool):
+            if not self.pool:
                 raise RuntimeError("Cannot reuse a closed worker pool")
 
-            self.map = pool.map if ordered else pool.imap_unordered
+            if resolved := cast(_PoolHandle, self._pool_handle).executor:
+                # Run on whatever the (possibly shared) pool was created as
+                self.executor, self.threads = resolved, resolved in THREADED
         else:
             self.workers = workers
             self.chunksize = chunksize or 1
-            self.map = map
+
+        self.map = map
 
     @property
     def pool(self) -> AnyPool | None:
@@ -646,13 +1016,18 @@ class SyncPipe(PyPipe):
         next_scope = cast(PoolScope, kwargs.get("pool_scope", self.pool_scope))
 
         skwargs = {
-            "chunksize": self.chunksize,
+            "autotune": self.autotune,
+            "chunksize": None if self.tune_chunksize else self.chunksize,
             "context": self.context,
+            "executor": self._executor,
+            "fuse": self.fuse,
             "inputs": self.inputs,
             "parallel": self.parallel,
+            "pipelined": self.pipelined,
             "pool_scope": next_scope,
             "threads": self.threads,
-            "workers": self.workers,
+            "window": self.window,
+            "workers": None if self.tune_workers else self.workers,
         }
 
         if self.pool_scope == next_scope == PoolScope.PIPELINE and "pool" not in kwargs:
@@ -671,6 +1046,17 @@ class SyncPipe(PyPipe):
 
         return child
 
+    def __call__(self, *args: Any, capacity: int | None = None, **kwargs: Any) -> Self:
+        """
+        Configure the pipe (see ``PyPipe.__call__``). ``capacity`` sets the size
+        of the queue feeding a pipelined pipe, e.g.,
+        ``SyncPipe('fetch', pipelined=True).regex(capacity=64, conf=...)``.
+        """
+        if capacity is not None:
+            self.capacity = capacity
+
+        return super().__call__(*args, **kwargs)
+
     def __getattr__(self, name: str) -> "SyncPipe":
         if name.startswith("_") or name in {"keys", "values", "items", "get"}:
             raise AttributeError(name)
@@ -736,15 +1122,20 @@ class SyncPipe(PyPipe):
         """
         self._require_usable("chain")
         skwargs = {
-            "chunksize": self.chunksize,
+            "autotune": self.autotune,
+            "chunksize": None if self.tune_chunksize else self.chunksize,
             "conf": self.conf,
             "context": self.context,
+            "executor": self._executor,
+            "fuse": self.fuse,
             "inputs": self.inputs,
             "ordered": self.ordered,
             "parallel": self.parallel,
+            "pipelined": self.pipelined,
             "pool_scope": self.pool_scope,
             "threads": self.threads,
-            "workers": self.workers,
+            "window": self.window,
+            "workers": None if self.tune_workers else self.workers,
         }
         skwargs.update(self._definitional_kwargs())
         return SyncPipe(self.name, source=source, **skwargs)
@@ -819,38 +1210,189 @@ class SyncPipe(PyPipe):
         self.close() if exc_type is None else self.terminate()
         return False
 
+    def _get_active(self, pool: AnyPool) -> tuple[int, int | None]:
+        """
+        The number of workers this pipe keeps busy, and its window of chunks in
+        flight. A warm registry pool is shared and may be larger than the pipe
+        asked for, so the pipe caps its own share at `workers`.
+        """
+        if (handle := self._pool_handle) and handle.lease is not None:
+            size = self.workers or getattr(pool, "_processes", None) or 1
+            window = self.window or size * DEF_WINDOW_FACTOR
+        else:
+            size = getattr(pool, "_processes", None) or self.workers or 1
+            window = self.window
+
+        return size, window
+
     def _release_pool_after_iteration(self) -> bool:
         if self._in_context:
             result = False
-        elif self.pool_scope == PoolScope.PIPE:
+        elif self.pool_scope in {PoolScope.PIPE, PoolScope.PROCESS}:
             result = True
         else:
             result = self._terminal
 
         return result
 
-    def _stream(self) -> Generator[Item, None, None]:
+    @property
+    def tuning(self) -> TuningStats | None:
+        """
+        The chunksize and active worker count an autotuned parallel pipe has
+        settled on (and what it measured), once it has started. Pass them back
+        as ``chunksize`` and ``workers`` to pin them.
+
+        Examples:
+            >>> src = ({'content': str(x)} for x in range(100))
+            >>> flow = SyncPipe('hash', source=src, parallel=True, workers=2)
+            >>> flow.tuning
+            >>> len(list(flow))
+            100
+            >>> stats = flow.tuning
+            >>> stats.items, stats.workers, stats.chunksize > 1
+            (100, 2, True)
+
+        """
+        return self._tuner.stats if self._tuner else None
+
+    def queue_stats(self) -> list[QueueStats]:
+        """
+        Depth metrics for the bounded queues between the stages of a pipelined
+        chain ending with this pipe (earliest first). A queue is listed once
+        its stage has started.
+
+        Examples:
+            >>> src = [{'content': 'a'}, {'content': 'b'}]
+            >>> flow = (
+            ...     SyncPipe('hash', source=src, pipelined=True, fuse=False)
+            ...     .slugify(field='hash', capacity=8))
+            >>> len(list(flow))
+            2
+            >>> [(s.name, s.capacity, s.items) for s in flow.queue_stats()]
+            [('source', 1024, 2), ('hash', 8, 2)]
+
+        """
+        stats: list[QueueStats] = []
+        pipe = self
+
+        while isinstance(pipe, SyncPipe):
+            if pipe._feed:
+                stats.insert(0, pipe._feed.stats)
+
+            pipe = pipe.source
+
+        return stats
+
+    def _feed_source(self, source: Items) -> Items:
+        """Run `source` in its own thread if this pipe is pipelined."""
+        if self.pipelined and source is not None:
+            name = source.name if isinstance(source, PyPipe) else "source"
+            self._feed = QueueFeed(source, self.capacity, name=str(name))
+            fed = self._feed
+        else:
+            fed = source
+
+        return fed
+
+    def _get_fused(self) -> list["SyncPipe"]:
+        """
+        The run of consecutive sequential processor pipes ending with this one
+        (earliest first) that can be fused, or an empty list if there is none.
+        Apart from this one, the pipes must not have started yet.
+        """
+        fused: list[SyncPipe] = []
+        pipe = self
+
+        while (
+            isinstance(pipe, SyncPipe)
+            and pipe.fuse
+            and pipe.mapify
+            and not pipe.parallelize
+            and hasattr(pipe._pipe, "stage")
+            and (pipe is self or (pipe.state is PipeState.NEW and pipe._iter is None))
+        ):
+            fused.insert(0, pipe)
+            pipe = pipe.source
+
+        return fused if len(fused) > 1 else []
+
+    def _stream(self, **hints: object) -> Generator[Item, None, None]:
         if self.name == "send":
             self.kwargs.setdefault("ids", {})
 
-        self._begin()
-        pipeline = partial(self._pipe, **self.kwargs)
+        pipe_kwargs = {**self.kwargs, **hints}
+
+        fused = self._get_fused()
+        fused_sources = fused[:-1]
+
+        for pipe in [self, *fused_sources]:
+            pipe._begin()
+
+        self._push_down_limit()
+        pipeline = partial(self._pipe, **pipe_kwargs)
+        head = fused[0] if fused else self
+        source = head._feed_source(head.source)
         completed = False
 
         try:
-            if self.parallelize and self.source is not None:
-                source_items = list(self.source)
-                zipped = zip(source_items, repeat(pipeline))
-                mapped = self.map(listpipe, zipped, chunksize=self.chunksize)
-            elif self.mapify and self.source is not None:
-                mapped = self.map(pipeline, self.source)
+            if self.partitioned and source is not None:
+                # Each worker aggregates whole chunks (the map side), and their
+                # partial results are then combined in stream order
+                pool = cast(AnyPool, self.pool)
+                func = partial(partitionpipe, pipe=self._pipe, **pipe_kwargs)
+                size = self.chunksize
+
+                if self.tune_chunksize:
+                    size = max(size, DEF_TRANSPORT_BATCH)
+
+                imap = imap_chunks if self.threads else imap_transport
+                chunks = batched(source, size)
+                window = self._get_active(pool)[1]
+                partials = imap(pool, func, chunks, 1, window=window)
+                mapped = [self._pipe.combine(partials, **pipe_kwargs)]
+            elif self.parallelize and source is not None:
+                pool = cast(AnyPool, self.pool)
+                args = (pool, partial(listpipe, pipeline=pipeline), source)
+                size, window = self._get_active(pool)
+                kwargs = {"window": window, "ordered": bool(self.ordered)}
+                imap = imap_chunks if self.threads else imap_transport
+
+                if self.tune_chunksize or self.tune_workers:
+                    chunksize = None if self.tune_chunksize else self.chunksize
+                    active = None if self.tune_workers else self.window or size
+                    tkwargs = {"chunksize": chunksize, "start": self.chunksize}
+                    self._tuner = AutoTuner(size, active=active, **tkwargs)
+
+                mapped = imap(*args, self.chunksize, tuner=self._tuner, **kwargs)
+            elif fused and any(pipe.batch for pipe in fused):
+                # Batch processors still receive whole batches, so the fused
+                # group runs a chunk (of the largest batch size) at a time
+                stages = [
+                    (True, partial(pipe._pipe, **pipe.kwargs))
+                    if pipe.batch
+                    else (False, pipe._pipe.stage(**pipe.kwargs))
+                    for pipe in fused
+                ]
+                batches = [pipe for pipe in fused if pipe.batch]
+                sizes = [pipe.kwargs.get("batch_size") for pipe in batches]
+                size = max(int(size or DEF_BATCH_SIZE) for size in sizes)
+                fuse_chunk = partial(gen_fused_chunk, stages=stages)
+                mapped = map(fuse_chunk, batched(source, size))
+            elif fused:
+                stages = [pipe._pipe.stage(**pipe.kwargs) for pipe in fused]
+                mapped = map(partial(gen_fused, stages=stages), source)
+            elif self.mapify and source is not None and self.batch:
+                # A batch processor chunks the stream itself
+                mapped = [pipeline(iter(source))]
+            elif self.mapify and source is not None:
+                mapped = self.map(pipeline, source)
             else:
                 mapped = None
 
             self._mapped = mapped
 
             if self._mapped is None:
-                yield from pipeline(self.source)
+                yield from pipeline(source)
             else:
                 yield from chain.from_iterable(self._mapped)
         except GeneratorExit:
@@ -860,7 +1402,8 @@ class SyncPipe(PyPipe):
             completed = True
             raise
         except BaseException:
-            self._fail()
+            for pipe in [self, *fused_sources]:
+                pipe._fail()
 
             if self._release_pool_after_iteration():
                 self._terminate_pool()
@@ -869,25 +1412,29 @@ class SyncPipe(PyPipe):
         else:
             completed = True
         finally:
+            if head._feed:
+                head._feed.close()
+
             if self._release_pool_after_iteration():
                 self._release_pool()
 
-            self._end()
+            for pipe in [self, *fused_sources]:
+                pipe._end()
 
             if completed:
                 self._notify_subscribers()
 
-    def __iter__(self) -> Stream:
+    def _start(self, **hints: object) -> Stream:
         if self._iter is None:
-            self._iter = self._stream()
+            self._iter = self._stream(**hints)
 
         return self._iter
 
-    def __next__(self) -> Item:
-        if self._iter is None:
-            self._iter = self._stream()
+    def __iter__(self) -> Stream:
+        return self._start()
 
-        return next(self._iter)
+    def __next__(self) -> Item:
+        return next(self._start())
 
     def split(self, **kwargs: object) -> SplitterParserOutput:
         splits = self._chain("split", **kwargs)
@@ -935,12 +1482,24 @@ class SyncCollection(PyCollection):
     """
     A synchronous PyCollection object
 
+    With ``backend='async'``, the sources are fetched concurrently (up to
+    ``connections`` at a time) by an ``AsyncCollection`` running on the shared
+    background loop of ``riko.bado.bridge``, and read through a blocking
+    iterator at most ``prefetch`` items ahead. The loop and its pooled client
+    are reused across collections, and closing the collection cancels any
+    fetches still in flight.
+
     Examples:
         >>> from riko import get_path
         >>> sources = [{'url': get_path(f)} for f in ['feed.xml', 'gawker.xml']]
         >>> stream = SyncCollection(sources, parallel=True)
         >>> len(list(stream))
         32
+        >>> if issync:
+        ...     32
+        ... else:
+        ...     len(list(SyncCollection(sources, backend='async')))
+        32
 
     """
 
@@ -952,35 +1511,44 @@ class SyncCollection(PyCollection):
         workers: int | None = None,
         parallel: bool = False,
         threads: bool | None = True,
+        executor: ExecutorLike | None = None,
         ordered: bool | None = False,
         pool: AnyPool | None = None,
+        pool_scope: PoolScope = PoolScope.PIPELINE,
+        backend: Literal["sync", "async"] = "sync",
+        connections: int = DEF_CONNECTION_COUNT,
+        prefetch: int = PREFETCH,
         **kwargs: object,
     ):
         super().__init__(
             sources, conf=conf, workers=workers, parallel=parallel, **kwargs
         )
-        self.threads: bool = bool(threads)
+        if backend not in {"sync", "async"}:
+            raise ValueError(f"Unsupported backend: {backend!r}.")
+        elif backend == "async" and issync:
+            raise RuntimeError("The async backend needs anyio and httpx")
 
-        if parallel:
-            self.executor = Executor.THREAD if self.threads else Executor.PROCESS
-        else:
-            self.executor = Executor.INLINE
+        self.backend: Literal["sync", "async"] = backend
+        self.connections: int = connections
+        self.prefetch: int = prefetch
+        self.executor: Executor = get_executor(parallel, threads, executor)
+        self.threads: bool = self.executor in THREADED if executor else bool(threads)
+        self.pool_scope: PoolScope = pool_scope
 
         self.ordered: bool = bool(ordered)
         self._iter: Stream | None = None
         self.map: Callable[..., Iterable[Stream]]
         self._in_context: bool = False
-        self._pool_handle: _PoolHandle | None = (
-            _PoolHandle(pool, owned=False) if pool else None
-        )
+        self._pool_handle: _PoolHandle | None = _borrow_pool(pool, executor, workers)
 
-        if self.parallel:
+        # The async backend fans out on the bridge's loop, not a worker pool
+        if self.parallel and backend == "sync":
             self.chunksize: int = get_chunksize(self.length, self.workers)
-            def_pool = _POOLS.get(self.executor)
 
             if not self._pool_handle:
-                new_pool = def_pool(self.workers)
-                self._pool_handle = _PoolHandle(new_pool, owned=True)
+                args = (self.executor, self.workers, pool_scope)
+                self._pool_handle = _new_pool_handle(*args)
+                self.executor = self._pool_handle.executor or self.executor
 
             if not (pool := self.pool):
                 raise RuntimeError("Cannot reuse a closed worker pool")
@@ -1059,19 +1627,34 @@ class SyncCollection(PyCollection):
         self.close() if exc_type is None else self.terminate()
         return False
 
+    def _bridge_stream(self) -> "BlockingStream[Item]":
+        """Fetch all source urls with an ``AsyncCollection`` on the shared loop"""
+        bridge = get_bridge()
+        client = bridge.client(self.connections)
+        kwargs = {"connections": self.connections, "ordered": self.ordered}
+        collection = AsyncCollection(
+            self.sources, conf=self.conf, client=client, **kwargs
+        )
+        return bridge.iterate(collection, self.prefetch)
+
     def _stream(self) -> Stream:
         """Fetch all source urls"""
         self._begin()
 
         try:
-            zargs = zip(self.sources, repeat(self.conf))
-
-            if self.parallel:
-                mapped = self.map(fetch_source, zargs, chunksize=self.chunksize)
+            if self.backend == "async":
+                # Closing this generator closes the stream, which cancels the fetch
+                with self._bridge_stream() as stream:
+                    yield from stream
             else:
-                mapped = self.map(fetch_source, zargs)
+                zargs = zip(self.sources, repeat(self.conf))
+
+                if self.parallel:
+                    mapped = self.map(fetch_source, zargs, chunksize=self.chunksize)
+                else:
+                    mapped = self.map(fetch_source, zargs)
 
-            yield from chain.from_iterable(mapped)
+                yield from chain.from_iterable(mapped)
         except BaseException:
             self._fail()
 
@@ -1126,8 +1709,18 @@ class AsyncPipe(PyPipe):
         This matters only when a pipe has side effects (e.g. ``send``, an
         external write). Then bound the work at the pipe, not the consumer: pass
         it ``count``/``truncate`` or fully drain it, so it never runs for
-        un-yielded items. ``parallel=True`` *bounds* the over-run to the
-        in-flight window but doesn't eliminate it (a worker prefetches ahead).
+        un-yielded items. The over-run is bounded by the in-flight window
+        (``connections`` items plus ``prefetch``) but not eliminated.
+
+    A mapped pipe yields its results in source order unless it is ``parallel``
+    (and not ``ordered``), in which case they arrive as they complete. Either
+    way, it and any Feed-native operator (e.g., ``filter`` or ``truncate``) read
+    their upstream only as they need it, so a chain of them streams end-to-end.
+
+    While a pipe runs, its requests (and those of the pipes upstream of it) go
+    through one pooled ``httpx.AsyncClient`` holding at most ``connections``
+    connections, which is closed by ``aclose``. Pass ``client`` to use your own
+    client instead; riko leaves it open.
     """
 
     def __init__(
@@ -1137,6 +1730,7 @@ class AsyncPipe(PyPipe):
         conf: Conf | None = None,
         *,
         assign: str | None = None,
+        client: "AsyncClient | None" = None,
         connections: int = DEF_CONNECTION_COUNT,
         context: Context | None = None,
         field: str | None = None,
@@ -1174,6 +1768,7 @@ class AsyncPipe(PyPipe):
         if connections < 1:
             raise ValueError("limit must be at least 1")
 
+        self.client: AsyncClient | None = client
         self.connections: int = connections
         self.ordered: bool = ordered
         self.prefetch: int = prefetch
@@ -1255,6 +1850,7 @@ class AsyncPipe(PyPipe):
         """
         self._require_usable("chain")
         skwargs = {
+            "client": self.client,
             "conf": self.conf,
             "connections": self.connections,
             "context": self.context,
@@ -1270,17 +1866,17 @@ class AsyncPipe(PyPipe):
         """Chain the next pipe by name (the method form of ``pipe | name``)."""
         return self._chain(name, **kwargs)
 
-    def __aiter__(self) -> AsyncStream:
+    def _start(self, **hints: object) -> AsyncStream:
         if self._aiter is None:
-            self._aiter = self._stream()
+            self._aiter = self._stream(**hints)
 
         return self._aiter
 
-    async def __anext__(self) -> Item:
-        if self._aiter is None:
-            self._aiter = self._stream()
+    def __aiter__(self) -> AsyncStream:
+        return self._start()
 
-        return await anext(self._aiter)
+    async def __anext__(self) -> Item:
+        return await anext(self._start())
 
     def __await__(self) -> Generator[Any, None, Stream]:
         return self._await_stream().__await__()
@@ -1331,6 +1927,7 @@ class AsyncPipe(PyPipe):
         """
         self._require_usable("chain")
         skwargs = {
+            "client": self.client,
             "connections": self.connections,
             "context": self.context,
             "inputs": self.inputs,
@@ -1352,6 +1949,9 @@ class AsyncPipe(PyPipe):
 
         if source is None:
             resolved = None
+        elif isinstance(source, AsyncIterable):
+            # Iterate (rather than await) an upstream pipe so it streams
+            resolved = aiter(source)
         else:
             resolved = await source if isawaitable(source) else source
 
@@ -1367,59 +1967,56 @@ class AsyncPipe(PyPipe):
         Drain a Feed into a list for a non-Feed-native module parser.
 
         This is the **explicit legacy-parser boundary**, not the default way
-        pipes communicate. Today's module parsers still require synchronous
-        ``Items`` rather than a ``Feed``, so a non-parallel async pipe buffers
-        its whole upstream here: everything *before* this point streams lazily,
-        everything *after* it has been materialized. The bounded/parallel path
-        (``_stream``) is the only fully-lazy end-to-end route; per-module opt-in
-        to Feed-native parsers (ROADMAP §4/§8) will shrink this boundary.
+        pipes communicate. Mapped pipes and Feed-native operators (those with a
+        ``feed``, e.g., ``filter`` or ``truncate``) stream their upstream lazily.
+        The remaining operators still require synchronous ``Items`` rather than a
+        ``Feed``, so they buffer their whole upstream here. Most of them (e.g.,
+        ``sort`` or ``count``) need all of it anyway.
         """
         return None if feed is None else [item async for item in feed]
 
-    async def _stream(self) -> AsyncGenerator[Item, None]:
+    async def _stream(self, **hints: object) -> AsyncGenerator[Item, None]:
         self._begin()
-        async_pipeline = partial(self._async_pipe, **self.kwargs)
-        bounded = self.mapify and self.parallel
+        self._push_down_limit()
+        pipe_kwargs = {**self.kwargs, **hints}
+        async_pipeline = partial(self._async_pipe, **pipe_kwargs)
+        feedable = hasattr(self._async_pipe, "feed")
 
         try:
-            feed = await self._normalize_source()
-
-            if bounded and feed is not None:
-                limit = self.connections
-                map_stream = (
-                    async_map_ordered_stream if self.ordered else async_map_stream
-                )
-                mapped = map_stream(
-                    async_pipeline, feed, limit=limit, buffer=self.prefetch
-                )
-
-                # ``aclosing`` tears the inner stream (and its task group) down in
-                # *this* task on any exit, so an early close doesn't leak it to a
-                # cross-task GC finalizer (which trips anyio's cancel-scope guard).
-                # Closing the as-complete stream mid-flight re-raises its task
-                # group's ``GeneratorExit`` as a one-member group; that is the
-                # expected close signal, so unwrap it back into a clean close and
-                # let anything genuinely unexpected propagate.
-                try:
-                    async with aclosing(mapped):
-                        async for stream in mapped:
-                            for item in stream:
-                                yield item
-                except BaseExceptionGroup as eg:
-                    if eg.split(GeneratorExit)[1] is not None:
-                        raise
-
-                    raise GeneratorExit from None
-            else:
-                source = await self._materialize_legacy_source(feed)
-
-                if self.mapify and source is not None:
-                    mapped = await async_map(async_pipeline, source, self.connections)
-
-                    for stream in mapped:
-                        for item in stream:
+            # Requests share one pooled client per pipeline or collection
+            async with http_client(self.connections, self.client):
+                feed = await self._normalize_source()
+
+                if self.mapify and feed is not None:
+                    # The processor maps itself over the feed, `connections` items
+                    # at a time. Without `parallel`, results keep source order (as
+                    # they do with `ordered`)
+                    mapped = getattr(self._async_pipe, "stream")(  # noqa: B009
+                        feed,
+                        concurrency=self.connections,
+                        buffer=self.prefetch,
+                        ordered=self.ordered or not self.parallel,
+                        **pipe_kwargs,
+                    )
+
+                    # ``aclosing`` tears the inner stream (and its task group) down in
+                    # *this* task on any exit, so an early close doesn't leak it to a
+                    # cross-task GC finalizer (which trips anyio's cancel-scope guard).
+                    async with unwrap_close(), aclosing(mapped):
+                        async for item in mapped:
+                            yield item
+                elif feedable and (feed is None or not self.mapify):
+                    # A Feed-native pipe yields each item as soon as it is parsed,
+                    # e.g., a source as it downloads or an operator (the only
+                    # kind of pipe that isn't mapped) as its upstream arrives
+                    _feed = getattr(self._async_pipe, "feed")  # noqa: B009
+                    results = _feed(feed, **pipe_kwargs)
+
+                    async with aclosing(results):
+                        async for item in results:
                             yield item
                 else:
+                    source = await self._materialize_legacy_source(feed)
                     result = await async_pipeline(source)
 
                     if isinstance(result, AsyncIterable):
@@ -1440,7 +2037,10 @@ class AsyncPipe(PyPipe):
 
 
 class AsyncCollection(PyCollection):
-    """An asynchronous PyCollection object"""
+    """
+    An asynchronous PyCollection object. All sources are fetched through one
+    pooled ``httpx.AsyncClient`` (or the given ``client``), see ``AsyncPipe``.
+    """
 
     def __init__(
         self,
@@ -1449,6 +2049,7 @@ class AsyncCollection(PyCollection):
         conf: Conf | None = None,
         workers: int | None = None,
         parallel: bool = False,
+        client: "AsyncClient | None" = None,
         connections: int = DEF_CONNECTION_COUNT,
         ordered: bool = False,
         prefetch: int = 0,
@@ -1460,6 +2061,7 @@ class AsyncCollection(PyCollection):
         if connections < 1:
             raise ValueError("limit must be at least 1")
 
+        self.client: AsyncClient | None = client
         self.connections: int = connections
         self.ordered: bool = ordered
         self.prefetch: int = prefetch
@@ -1519,39 +2121,35 @@ class AsyncCollection(PyCollection):
         self._begin()
 
         try:
-            if self.ordered:
-                # Explicit source-materialization compatibility mode: each source
-                # is fetched (concurrently, up to `connections`) and its records
-                # yielded in source order; records do not interleave across sources.
-                zargs = zip(self.sources, repeat(self.conf))
-                mapped = async_map_ordered_stream(
-                    afetch_source_eager,
-                    zargs,
-                    limit=self.connections,
-                    buffer=self.prefetch,
-                )
-
-                async for stream in mapped:
-                    for item in stream:
-                        yield item
-            else:
-                # Incremental merge: each source is a lazy Feed and records
-                # interleave across sources as they arrive (bounded by
-                # `connections`), never materializing a whole source.
-                feeds = (afetch_source((src, self.conf)) for src in self.sources)
-                merged = async_merge(
-                    feeds, limit=self.connections, buffer=self.prefetch
-                )
-
-                try:
-                    async with aclosing(merged):
+            # Each source pipe fetches through the collection's client
+            async with http_client(self.connections, self.client):
+                if self.ordered:
+                    # Explicit source-materialization compatibility mode: each source
+                    # is fetched (concurrently, up to `connections`) and its records
+                    # yielded in source order; records do not interleave across sources.
+                    zargs = zip(self.sources, repeat(self.conf))
+                    mapped = async_map_ordered_stream(
+                        afetch_source_eager,
+                        zargs,
+                        limit=self.connections,
+                        buffer=self.prefetch,
+                    )
+
+                    async for stream in mapped:
+                        for item in stream:
+                            yield item
+                else:
+                    # Incremental merge: each source is a lazy Feed and records
+                    # interleave across sources as they arrive (bounded by
+                    # `connections`), never materializing a whole source.
+                    feeds = (afetch_source((src, self.conf)) for src in self.sources)
+                    merged = async_merge(
+                        feeds, limit=self.connections, buffer=self.prefetch
+                    )
+
+                    async with unwrap_close(), aclosing(merged):
                         async for item in merged:
                             yield item
-                except BaseExceptionGroup as eg:
-                    if eg.split(GeneratorExit)[1] is not None:
-                        raise
-
-                    raise GeneratorExit from None
         except BaseException:
             self._fail()
             raise
@@ -1573,12 +2171,12 @@ def get_worker_cnt(length: int, threads: bool | None = True) -> int:
     return min(length, maximum) if length else maximum
 
 
-def listpipe(
-    args: tuple[Item, SyncPipeParser], **kwargs: BasicValue
-) -> list[ParserOutput]:
-    source, pipeline = args
-    result = pipeline(source, **kwargs)
-    return list(listize(result))
+def listpipe(source: Item, pipeline: SyncPipeParser) -> list[ParserOutput]:
+    return list(listize(pipeline(source)))
+
+
+def partitionpipe(chunk: Iterable[Item], pipe: SyncPipeParser, **kwargs: Any) -> Any:
+    return getattr(pipe, "partition")(chunk, **kwargs)  # noqa: B009
 
 
 def _fetch_source[T: SyncPipe | AsyncPipe](
@@ -5,9 +5,9 @@ Provides date and time helpers
 
 from calendar import timegm
 from collections.abc import Callable, Iterator
+from copy import copy
 from datetime import UTC, date, timedelta, timezone, tzinfo
 from datetime import datetime as dt
-from functools import cache
 from time import strptime, struct_time
 from typing import Annotated, Literal, cast, overload
 from zoneinfo import ZoneInfo, available_timezones
@@ -16,6 +16,7 @@ import pytz
 from dateutil import parser
 from dateutil.relativedelta import relativedelta
 
+from riko._cache import shared_cache
 from riko.types.values import DateDict
 
 TIMEOUT = 60 * 60 * 1
@@ -43,10 +44,10 @@ AwareST = Annotated[struct_time, "timezone-aware"]
 NaiveST = Annotated[struct_time, "timezone-naive"]
 
 
-@cache
+@shared_cache
 def _parse_date_cached(value: str) -> dt | BaseException:
-    # cache doesn't work with exceptions, so we return the exception and raise it in the
-    # caller
+    # cache doesn't work with exceptions, so we return the exception and the caller
+    # raises a copy of it (parallel threads mustn't share one traceback)
     try:
         return parser.parse(value, tzinfos=TZINFOS)
     except Exception as e:  # noqa: BLE001
@@ -79,7 +80,7 @@ def parse_date_string(value: str) -> dt:
     result = _parse_date_cached(value)
 
     if isinstance(result, BaseException):
-        raise result
+        raise copy(result)
 
     return cast(dt, result)
 
@@ -6,6 +6,7 @@ Provides a class for creating case insensitive dicts with dot notation access
 from __future__ import annotations
 
 from collections.abc import Iterable, Iterator, Mapping
+from copy import deepcopy
 from datetime import date
 from decimal import Decimal
 from functools import reduce
@@ -13,6 +14,7 @@ from logging import Logger
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Self,
     TypeGuard,
     TypeVar,
@@ -344,6 +346,9 @@ class DotDict(CaseInsensitiveDict[VT]):
 
     """
 
+    # Whether nested writes copy (rather than mutate) the mappings along the path
+    _copy_path: ClassVar[bool] = False
+
     def __init__(self, data: Mapping[str, VT] | Data | None = None, **kwargs: VT):
         super().__init__()
         self.update(data, **kwargs)
@@ -528,6 +533,9 @@ class DotDict(CaseInsensitiveDict[VT]):
                 if existing is not None and not is_mapping(existing):
                     del item[key]
                     existing = None
+                elif existing is not None and self._copy_path:
+                    # The mappings along the path may be shared by other views
+                    existing = item[key] = cast(VT, cast(Any, existing).copy())
             else:
                 existing = None
 
@@ -670,7 +678,11 @@ class DotDict(CaseInsensitiveDict[VT]):
             if item and key and (matched := match_key(item, key)):
                 value = raw_get(item, matched)
             else:
-                value = None
+                matched = value = None
+
+            if matched and is_mapping(value) and self._copy_path:
+                # The mappings along the path may be shared by other views
+                value = item[matched] = cast(VT, cast(Any, value).copy())
 
             return cast(Self, value) if is_mapping(value) else None
 
@@ -763,3 +775,94 @@ class DotDict(CaseInsensitiveDict[VT]):
         """
         items = gen_dict(self, key=key, default_key="self", **kwargs)
         return dict(items)
+
+
+class SharedDotDict(DotDict[VT]):
+    """
+    A copy-on-write view of a DotDict. The view shares the source's storage
+    until it is first written to, when it makes its own (shallow) copy, so many
+    views of one item cost next to nothing. Nested writes copy the mappings
+    along their path, and a nested container (e.g., a list) is deep copied
+    when first read, so neither writes nor in place mutations ever reach other
+    views. Note: the source itself should no longer be mutated once it is
+    shared.
+
+    Examples:
+        >>> item = DotDict({'a': 1, 'b': {'c': 2}, 'tags': ['x']})
+        >>> view1, view2 = SharedDotDict(item), SharedDotDict(item)
+        >>> view1['a'] = 3
+        >>> view2['b.c'] = 4
+        >>> view1['tags'].append('y')
+        >>> item, view1, view2  # doctest: +NORMALIZE_WHITESPACE
+        ({'a': 1, 'b': {'c': 2}, 'tags': ['x']},
+         {'a': 3, 'b': {'c': 2}, 'tags': ['x', 'y']},
+         {'a': 1, 'b': {'c': 4}, 'tags': ['x']})
+        >>> view1.delete('b.c')
+        >>> item['b'], view1['b']
+        ({'c': 2}, {})
+
+    """
+
+    _copy_path = True
+
+    def __init__(self, data: Mapping[str, VT] | Data | None = None, **kwargs: VT):
+        self._shared = False
+        # The roots whose nested containers no longer need detaching (if a view)
+        self._detached: set[str] | None = None
+
+        if self.is_self(data) and not kwargs:
+            self._store = data._store
+            self._shared = True
+            self._detached = set()
+        else:
+            super().__init__(data, **kwargs)
+
+    def _own(self) -> None:
+        if self._shared:
+            self._store = self._store.copy()
+            self._shared = False
+
+    def _detach(self, key: Key | None) -> None:
+        # Copy the (shared) container a read reaches into, so that mutating it
+        # in place only affects this view
+        keys = parse_key(key) if self._detached is not None else None
+        root = keys[0].lower() if keys else None
+        detached = cast(set[str], self._detached)
+
+        if root and root not in detached and root in self._store:
+            detached.add(root)
+            original, value = self._store[root]
+
+            try:
+                hash(value)
+            except TypeError:
+                self._own()
+                self._store[root] = (original, deepcopy(value))
+
+    def __getitem__(self, key: Key) -> VT:
+        self._detach(key)
+        return super().__getitem__(key)
+
+    def get(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, key: Key | None = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        self._detach(key)
+        return super().get(key, *args, **kwargs)
+
+    def __setitem__(self, key: str, value: VT) -> None:
+        self._own()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._own()
+        super().__delitem__(key)
+
+    def delete(self, key: str) -> None:
+        self._own()
+        super().delete(key)
+
+    def update(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, data: SupportsKeysAndGetItem[str, VT] | Data | None = None, **kwargs: VT
+    ) -> None:
+        self._own()
+        super().update(data, **kwargs)
@@ -152,8 +152,26 @@ def gen_assignments(  # noqa: E302
     assignment: Item | StreamOrValueStream,
     assign: str | None = None,
     one=False,
+    inplace=False,
     **_,
 ) -> StreamOrValueStream:
+    """
+    Assign a parser result onto `item` (or emit it when there is no `assign`).
+    With `inplace`, a single item result is `item` itself, updated in place,
+    rather than an updated copy.
+
+    Examples:
+        >>> item = DotDict({'content': 'a'})
+        >>> next(gen_assignments(item, 'b', assign='x'))
+        {'content': 'a', 'x': 'b'}
+        >>> item
+        {'content': 'a'}
+        >>> next(gen_assignments(item, 'b', assign='x', inplace=True)) is item
+        True
+        >>> item
+        {'content': 'a', 'x': 'b'}
+
+    """
     if one and isinstance(assignment, Iterator):
         value = next(assignment, None)
     else:
@@ -162,12 +180,16 @@ def gen_assignments(  # noqa: E302
     value_is_iterator = isinstance(value, Iterator)
 
     if assign:
+        if item and value_is_iterator:
+            value = list(cast(Iterator[RikoValue], value))
+
         if value is None:
             yield item
-        elif item and value_is_iterator:
-            yield item | {assign: list(value)}
-        elif value_is_iterator:
+        elif isinstance(value, Iterator):
             yield from cast(StreamOrValueStream, ({assign: v} for v in value))
+        elif inplace:
+            item.update({assign: value})
+            yield item
         else:
             yield item | {assign: value}
     elif value_is_iterator:
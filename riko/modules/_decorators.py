@@ -7,17 +7,33 @@ Pipe-authoring decorators: the ``Module`` base and the ``processor`` /
 sync/async module callables the framework executes.
 """
 
-from collections.abc import Awaitable, Callable, Iterator
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from contextlib import aclosing
 from functools import partial, wraps
 from inspect import isawaitable, iscoroutinefunction
-from itertools import chain, islice
+from itertools import batched, chain, islice
 from logging import Logger
-from typing import Literal, cast, overload
+from operator import is_
+from typing import Any, Literal, cast, overload
 
 import pygogo as gogo
 
+from riko import DEF_CONNECTION_COUNT
 from riko._iterutils import dispatch
-from riko.bado.itertools import async_map
+from riko.bado.itertools import (
+    async_iter,
+    async_map_ordered_stream,
+    async_map_stream,
+    unwrap_close,
+)
 from riko.cast import BasicCastType
 from riko.context import Context, ExecutionMode, parse_context
 from riko.dotdict import DotDict, is_mapping
@@ -37,14 +53,17 @@ from riko.types.configs import DynamicConf
 from riko.types.general import (
     AsyncOperatorParser,
     AsyncOperatorWrapper,
+    AsyncPipeTuples,
     AsyncProcessorParser,
     AsyncProcessorWrapper,
     AsyncSplitterParser,
     AsyncSplitterWrapper,
+    AsyncStream,
     AsyncSubPipe,
     Casted,
     Conf,
     Defaults,
+    FeedOperatorParser,
     Item,
     ItemDispatch,
     ItemOrValue,
@@ -65,6 +84,7 @@ from riko.types.general import (
     SplitterParserOutput,
     SplitterWrapper,
     SplitterWrapperInput,
+    Stage,
     Stream,
     StreamOrValueStream,
     Streams,
@@ -77,11 +97,13 @@ from riko.types.general import (
     SyncSubPipe,
     ValueStream,
 )
-from riko.types.modules import CountValues, ModuleType
+from riko.types.modules import CountValues, LoopOrder, ModuleType
 from riko.types.values import Inputs, PrimitiveValue, RikoValue, StatefulItem
 
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
+DEF_BATCH_SIZE = 128
+
 
 class Module[B: (Literal[True], Literal[False])]:
     isasync: B
@@ -277,7 +299,13 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
         isasync: Literal[False] = ...,
         **kwargs: object,
     ) -> None: ...
-    def __init__(self, *args: object, **kwargs: object):  # noqa: E301
+    def __init__(  # noqa: E301
+        self,
+        *args: object,
+        batch: bool = False,
+        feed: Callable[..., AsyncIterator[Any]] | None = None,
+        **kwargs: object,
+    ):
         """
         Creates a sync/async pipe that processes individual items. These
         pipes are classified as `type: processor` and as either
@@ -289,6 +317,15 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
             isasync (bool): Wraps an async pipe (default: False)
             pollable (bool): Pipe returns a callable stream (default: False)
             debug (bool): Print pipe content to stdout (default: False)
+            batch (bool): The pipe receives a list of (field) values, one per
+                item, and returns a list of their results. Streams are then
+                processed in batches of items (default: False).
+
+            feed (func): An async generator taking the same args as an async
+                pipe and yielding its results as they are parsed, e.g., while
+                a source downloads. Lets an AsyncPipe stream the source rather
+                than wait for its whole result (default: None).
+
             opts (dict): The keyword arguments passed to the wrapper
 
         Kwargs:
@@ -339,6 +376,19 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
                 processing is skipped, the resulting stream will be the original
                 input `item`.
 
+            batch_size (int): The number of items per batch of a `batch` pipe
+                (default: DEF_BATCH_SIZE). Items whose conf depends on the item
+                itself are never batched.
+
+            concurrency (int): The most items of a stream an async pipe
+                processes at once (default: DEF_CONNECTION_COUNT).
+
+            buffer (int): The number of items of a stream an async pipe reads
+                ahead of those it is processing (default: 0). Note: these only
+                bound the work in flight. Awaiting an async pipe on a stream
+                still collects every result before returning them, so use its
+                `stream` attribute to receive them as they are processed.
+
         Examples:
             >>> from riko import async_return, issync, run
             >>>
@@ -368,9 +418,38 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
             ... else:
             ...     run(main)
             {'content': 'say "hello world" three times!'}
+            >>> @processor(batch=True)
+            ... def pipe(contents, extraction, objconf, **kwargs):
+            ...     return [f'{content}!' for content in contents]
+            ...
+            >>> items = iter([{'content': 'hi'}, {'content': 'bye'}])
+            >>> kwargs = {'field': 'content', 'assign': 'content'}
+            >>> [item['content'] for item in pipe(items, **kwargs)]
+            ['hi!', 'bye!']
+            >>> async def feed(item, extraction, objconf, **kwargs):
+            ...     for content in ('hi', 'bye'):
+            ...         yield f'{content}!'
+            ...
+            >>> @processor(isasync=True, feed=feed, ftype='none')
+            ... async def async_pipe(item, extraction, objconf, **kwargs):
+            ...     return iter([item async for item in feed(item, None, None)])
+            ...
+            >>> async def main():
+            ...     print([item async for item in async_pipe.feed()])
+            ...
+            >>> if issync:
+            ...     print(['hi!', 'bye!'])
+            ... else:
+            ...     run(main)
+            ['hi!', 'bye!']
 
         """
         super().__init__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        self.batch: bool = batch
+        self.feed = feed
+
+        # The last invocation's plan, keyed by its call-site options
+        self._plan: tuple[tuple, tuple, PreparedModule] | None = None
 
     def parse(
         self, item: ProcessorWrapperInput | ItemOrValue, module_name: str
@@ -395,6 +474,53 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
 
         return parsed
 
+    def plan(
+        self,
+        module_name: str,
+        conf: Conf | None = None,
+        context: Context | None = None,
+        *,
+        assign: str | None = None,
+        count: CountValues | None = None,
+        mode: ExecutionMode | None = None,
+        inputs: Inputs | None = None,
+        **kwargs: bool,
+    ) -> tuple[PreparedModule, Context]:
+        """
+        Resolve the state shared by every item of an invocation (its
+        ``PreparedModule`` and ``Context``) once, so that an iterator of items
+        only pays for it once. The last ``PreparedModule`` is also reused by
+        later invocations with the same call-site options, as when a pipe maps
+        the module over its source one item at a time. Confs that depend on
+        the item (e.g., those with a ``subkey``) are still parsed and cast per
+        item by ``setup``.
+
+        Examples:
+            >>> @processor()
+            ... def pipe(item, extraction, objconf, **kwargs):
+            ...     return f"{item['content']}-{objconf.times}"
+            ...
+            >>> items = iter([{'content': 'a'}, {'content': 'b'}])
+            >>> [i['x'] for i in pipe(items, conf={'times': '2'}, assign='x')]
+            ['a-2', 'b-2']
+
+        """
+        # conf is compared by value (it may be mutated between invocations),
+        # but the other kwargs by identity since ``prepare`` keeps them as is
+        key = (module_name, repr(conf), assign, count, tuple(kwargs))
+        values = tuple(kwargs.values())
+
+        if (plan := self._plan) and plan[0] == key and all(map(is_, plan[1], values)):
+            prepared = plan[2]
+        else:
+            prepared = self.prepare(
+                module_name, conf=conf, assign=assign, count=count, **kwargs
+            )
+            self._plan = (key, values, prepared)
+
+        _context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
+        return prepared, _context
+
     def setup(
         self,
         prepared: PreparedModule,
@@ -480,6 +606,7 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
         emit: bool = ...,
         skip: bool = ...,
         count: CountValues | None = None,
+        inplace: bool = False,
     ) -> ProcessorWrapperOutput: ...
     def process(  # noqa: E301
         self,
@@ -489,15 +616,42 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
         emit: bool = False,
         skip: bool = False,
         count: CountValues | None = None,
+        inplace: bool = False,
     ) -> ProcessorWrapperOutput:
         if skip or emit:
             _, result = get_assignment(stream, skip=skip, count=count)
         else:
             one, assignment = get_assignment(stream, skip=False, count=count)
-            result = gen_assignments(_input, assignment, assign=assign, one=one)
+            args = (_input, assignment)
+            result = gen_assignments(*args, assign=assign, one=one, inplace=inplace)
 
         return result
 
+    def finalize(
+        self,
+        prepared: PreparedModule,
+        _input: DotDict[RikoValue],
+        stream: ProcessorParserOutput,
+        count: CountValues | None = None,
+        inplace: bool = False,
+    ) -> ProcessorWrapperOutput:
+        """Emit or assign the pipe's result for an item, as configured."""
+        args = (_input, stream, prepared.assign)
+
+        if callable(prepared.emit) and not isinstance(stream, Iterator):
+            emit = prepared.emit(stream)
+        else:
+            emit = bool(prepared.emit)
+
+        if emit:
+            processed = self.process(*args, emit=True, skip=False, count=count)
+        else:
+            processed = self.process(
+                *args, emit=False, skip=False, count=count, inplace=inplace
+            )
+
+        return processed
+
     @overload
     def __call__(  # noqa: E704
         self: "processor[Literal[True]]", pipe: AsyncProcessorParser
@@ -557,147 +711,453 @@ class processor[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
         """
         module_name = pipe.__module__.split(".")[-1]
 
-        async def async_wrapper(
-            item: ProcessorWrapperInput | None = None,
-            conf: Conf | None = None,
-            context: Context | None = None,
-            *,
-            assign: str | None = None,
+        async def async_process(
+            item: ProcessorWrapperInput | None,
+            prepared: PreparedModule,
+            context: Context,
             field: str | None = None,
             count: CountValues | None = None,
-            mode: ExecutionMode | None = None,
-            inputs: Inputs | None = None,
+            concurrency: int = DEF_CONNECTION_COUNT,
+            buffer: int = 0,
             **kwargs: bool,
         ) -> ProcessorWrapperOutput:
             if isinstance(item, Iterator):
-                _wrapper = partial(
-                    async_wrapper,
-                    conf=conf,
-                    context=context,
-                    assign=assign,
-                    field=field,
-                    count=count,
-                    mode=mode,
-                    inputs=inputs,
-                    **kwargs,
-                )
+                if self.batch and prepared.static_casted:
+                    args = (item, prepared, context)
+                    batches = async_batches(*args, field=field, count=count, **kwargs)
+                    processed = chain.from_iterable(await batches)
+                else:
+                    _process = partial(
+                        async_process,
+                        prepared=prepared,
+                        context=context,
+                        field=field,
+                        count=count,
+                        **kwargs,
+                    )
+
+                    mapped = async_map_ordered_stream(
+                        _process, item, limit=concurrency, buffer=buffer
+                    )
 
-                mapped = await async_map(_wrapper, item)
-                processed = chain.from_iterable(mapped)
+                    # The awaited result is a plain iterator, so every result
+                    # is collected first (`async_stream` yields them lazily)
+                    processed = chain.from_iterable([m async for m in mapped])
             else:
                 _input = self.parse(item, module_name)
-                prepared = self.prepare(
-                    module_name, conf=conf, assign=assign, count=count, **kwargs
-                )
-                assign = prepared.assign
                 orig_item, casted, skip = self.setup(
                     prepared, _input, field=field, count=count, **kwargs
                 )
 
                 if skip:
-                    args = (_input, orig_item, assign)
+                    args = (_input, orig_item, prepared.assign)
                     processed = self.process(*args, emit=True, skip=True)
                 else:
                     aync_pipe = cast(AsyncProcessorParser, pipe)
-                    context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
-                    inputs = context.inputs
                     kwargs["test"] = context.test
                     pkwargs: dict[str, object] = {
-                        "inputs": inputs,
+                        "inputs": context.inputs,
                         "count": count,
                         **kwargs,
                     }
-                    result = aync_pipe(*casted, **pkwargs)
-                    stream = (await result) if isawaitable(result) else result
-                    args = (_input, stream, assign)
 
-                    if callable(prepared.emit) and not isinstance(stream, Iterator):
-                        emit = prepared.emit(stream)
+                    if self.batch:
+                        value, *rest = casted
+                        result = aync_pipe([value], *rest, **pkwargs)
+                        results = (await result) if isawaitable(result) else result
+                        stream = results[0]
                     else:
-                        emit = bool(prepared.emit)
+                        result = aync_pipe(*casted, **pkwargs)
+                        stream = (await result) if isawaitable(result) else result
 
-                    if emit:
-                        processed = self.process(
-                            *args, emit=True, skip=False, count=count
-                        )
+                    processed = self.finalize(prepared, _input, stream, count)
+
+            return processed
+
+        async def async_batches(
+            items: Iterator[ProcessorWrapperInput],
+            prepared: PreparedModule,
+            context: Context,
+            field: str | None = None,
+            count: CountValues | None = None,
+            batch_size: int | None = None,
+            **kwargs: bool,
+        ) -> list[ProcessorWrapperOutput]:
+            aync_pipe = cast(AsyncProcessorParser, pipe)
+            _, extraction, objconf = cast(tuple, prepared.static_casted)
+            pkwargs = {"inputs": context.inputs, "count": count, **kwargs}
+            pkwargs["test"] = context.test
+            processed = []
+
+            for chunk in batched(items, batch_size or DEF_BATCH_SIZE):
+                _inputs = [self.parse(item, module_name) for item in chunk]
+                setups = [
+                    self.setup(prepared, _input, field=field, count=count, **kwargs)
+                    for _input in _inputs
+                ]
+                values = [casted[0] for _, casted, skip in setups if not skip]
+                result = aync_pipe(values, extraction, objconf, **pkwargs)
+                results = iter((await result) if isawaitable(result) else result)
+
+                for _input, (orig_item, _, skip) in zip(_inputs, setups, strict=True):
+                    if skip:
+                        args = (_input, orig_item, prepared.assign)
+                        processed.append(self.process(*args, emit=True, skip=True))
                     else:
-                        processed = self.process(
-                            *args, emit=False, skip=False, count=count
-                        )
+                        stream = next(results)
+                        processed.append(self.finalize(prepared, _input, stream, count))
 
             return processed
 
-        def sync_wrapper(
-            item: ProcessorWrapperInput | None = None,
-            conf: Conf | None = None,
-            context: Context | None = None,
-            *,
-            assign: str | None = None,
+        def sync_apply(
+            _input: DotDict[RikoValue],
+            prepared: PreparedModule,
+            context: Context,
+            field: str | None = None,
+            count: CountValues | None = None,
+            inplace: bool = False,
+            **kwargs: bool,
+        ) -> ProcessorWrapperOutput:
+            orig_item, casted, skip = self.setup(
+                prepared, _input, field=field, **kwargs
+            )
+
+            if skip:
+                args = (_input, orig_item, prepared.assign)
+                processed = self.process(*args, emit=True, skip=True)
+            else:
+                sync_pipe = cast(SyncProcessorParser, pipe)
+                kwargs["test"] = context.test
+                pkwargs: dict[str, object] = {
+                    "inputs": context.inputs,
+                    "count": count,
+                    **kwargs,
+                }
+
+                if self.batch:
+                    value, *rest = casted
+                    stream = sync_pipe([value], *rest, **pkwargs)[0]
+                else:
+                    stream = sync_pipe(*casted, **pkwargs)
+
+                args = (prepared, _input, stream, count)
+                processed = self.finalize(*args, inplace=inplace)
+
+            return processed
+
+        def sync_batches(
+            items: Iterator[ProcessorWrapperInput],
+            prepared: PreparedModule,
+            context: Context,
+            field: str | None = None,
+            count: CountValues | None = None,
+            batch_size: int | None = None,
+            **kwargs: bool,
+        ) -> Stream:
+            sync_pipe = cast(SyncProcessorParser, pipe)
+            _, extraction, objconf = cast(tuple, prepared.static_casted)
+            pkwargs = {"inputs": context.inputs, "count": count, **kwargs}
+            pkwargs["test"] = context.test
+
+            for chunk in batched(items, batch_size or DEF_BATCH_SIZE):
+                _inputs = [self.parse(item, module_name) for item in chunk]
+                setups = [
+                    self.setup(prepared, _input, field=field, **kwargs)
+                    for _input in _inputs
+                ]
+                values = [casted[0] for _, casted, skip in setups if not skip]
+                results = iter(sync_pipe(values, extraction, objconf, **pkwargs))
+
+                for _input, (orig_item, _, skip) in zip(_inputs, setups, strict=True):
+                    if skip:
+                        args = (_input, orig_item, prepared.assign)
+                        yield from self.process(*args, emit=True, skip=True)
+                    else:
+                        stream = next(results)
+                        yield from self.finalize(prepared, _input, stream, count)
+
+        def sync_process(
+            item: ProcessorWrapperInput | None,
+            prepared: PreparedModule,
+            context: Context,
             field: str | None = None,
             count: CountValues | None = None,
-            mode: ExecutionMode | None = None,
-            inputs: Inputs | None = None,
             **kwargs: bool,
         ) -> ProcessorWrapperOutput:
             if isinstance(item, Iterator):
-                _wrapper = partial(
-                    sync_wrapper,
-                    conf=conf,
+                _process = partial(
+                    sync_process,
+                    prepared=prepared,
                     context=context,
-                    assign=assign,
                     field=field,
                     count=count,
-                    mode=mode,
-                    inputs=inputs,
                     **kwargs,
                 )
 
-                processed = chain.from_iterable(map(_wrapper, item))
+                if self.batch and prepared.static_casted:
+                    args = (item, prepared, context)
+                    processed = sync_batches(*args, field=field, count=count, **kwargs)
+                else:
+                    processed = chain.from_iterable(map(_process, item))
             else:
                 _input = self.parse(item, module_name)
-                prepared = self.prepare(
-                    module_name, conf=conf, assign=assign, count=count, **kwargs
-                )
-                assign = prepared.assign
-                orig_item, casted, skip = self.setup(
-                    prepared, _input, field=field, **kwargs
+                args = (_input, prepared, context)
+                processed = sync_apply(*args, field=field, count=count, **kwargs)
+
+            return processed
+
+        def sync_stage(
+            conf: Conf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> Stage:
+            """
+            Plan an invocation (taking the same options as the pipe itself)
+            and return its per-item stage. A stage maps an item to the parsed
+            item it worked on and its results, assigning onto that parsed
+            item in place. With `owned`, the item is taken to be an already
+            parsed `DotDict` that the caller owns, so it isn't parsed again.
+            """
+            prepared, _context = self.plan(
+                module_name,
+                conf,
+                context,
+                assign=assign,
+                count=count,
+                mode=mode,
+                inputs=inputs,
+                **kwargs,
+            )
+
+            def stage(
+                item: ItemOrValue, owned: bool = False
+            ) -> tuple[DotDict[RikoValue], ProcessorWrapperOutput]:
+                _input = item if owned else self.parse(item, module_name)
+                args = (cast(DotDict[RikoValue], _input), prepared, _context)
+                processed = sync_apply(
+                    *args, field=field, count=count, inplace=True, **kwargs
                 )
+                return args[0], processed
 
-                if skip:
-                    args = (_input, orig_item, assign)
-                    processed = self.process(*args, emit=True, skip=True)
-                else:
-                    sync_pipe = cast(SyncProcessorParser, pipe)
-                    context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
-                    inputs = context.inputs
-                    kwargs["test"] = context.test
-                    pkwargs: dict[str, object] = {
-                        "inputs": inputs,
-                        "count": count,
-                        **kwargs,
-                    }
-                    stream = sync_pipe(*casted, **pkwargs)
-                    args = (_input, stream, assign)
+            return stage
 
-                    if callable(prepared.emit) and not isinstance(stream, Iterator):
-                        emit = prepared.emit(stream)
-                    else:
-                        emit = bool(prepared.emit)
+        async def async_wrapper(
+            item: ProcessorWrapperInput | None = None,
+            conf: Conf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            concurrency: int = DEF_CONNECTION_COUNT,
+            buffer: int = 0,
+            **kwargs: bool,
+        ) -> ProcessorWrapperOutput:
+            prepared, _context = self.plan(
+                module_name,
+                conf,
+                context,
+                assign=assign,
+                count=count,
+                mode=mode,
+                inputs=inputs,
+                **kwargs,
+            )
+
+            return await async_process(
+                item,
+                prepared,
+                _context,
+                field=field,
+                count=count,
+                concurrency=concurrency,
+                buffer=buffer,
+                **kwargs,
+            )
+
+        async def async_stream(
+            items: AsyncIterable[ProcessorWrapperInput]
+            | Iterable[ProcessorWrapperInput],
+            conf: Conf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            concurrency: int = DEF_CONNECTION_COUNT,
+            buffer: int = 0,
+            ordered: bool = True,
+            **kwargs: bool,
+        ) -> AsyncGenerator[ItemOrValue, None]:
+            """
+            Yield the results for each of the (async) `items` as they are
+            processed, in source order unless not `ordered`. At most
+            `concurrency` items are processed at once and `buffer` more are
+            read ahead, so neither tasks nor results pile up.
+            """
+            prepared, _context = self.plan(
+                module_name,
+                conf,
+                context,
+                assign=assign,
+                count=count,
+                mode=mode,
+                inputs=inputs,
+                **kwargs,
+            )
 
-                    if emit:
-                        processed = self.process(
-                            *args, emit=True, skip=False, count=count
-                        )
+            _process = partial(
+                async_process,
+                prepared=prepared,
+                context=_context,
+                field=field,
+                count=count,
+                **kwargs,
+            )
+
+            map_stream = async_map_ordered_stream if ordered else async_map_stream
+            mapped = map_stream(_process, items, limit=concurrency, buffer=buffer)
+
+            async with unwrap_close(), aclosing(mapped):
+                async for processed in mapped:
+                    for result in processed:
+                        yield result
+
+        async def async_feed(
+            item: ProcessorWrapperInput | None = None,
+            conf: Conf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> AsyncGenerator[Item, None]:
+            """
+            Yield the results of an invocation as the pipe's `feed` parses
+            them. Results emitted, or assigned to an empty (source) item, are
+            finalized one at a time; those assigned to an item are collected
+            first since they all end up in that one item.
+            """
+            prepared, _context = self.plan(
+                module_name,
+                conf,
+                context,
+                assign=assign,
+                count=count,
+                mode=mode,
+                inputs=inputs,
+                **kwargs,
+            )
+
+            _input = self.parse(item, module_name)
+            orig_item, casted, skip = self.setup(
+                prepared, _input, field=field, count=count, **kwargs
+            )
+
+            if skip:
+                args = (_input, orig_item, prepared.assign)
+
+                for processed in self.process(*args, emit=True, skip=True):
+                    yield processed
+            else:
+                feed = cast(Callable[..., AsyncIterator[RikoValue]], self.feed)
+                kwargs["test"] = _context.test
+                pkwargs = {"inputs": _context.inputs, "count": count, **kwargs}
+                values = feed(*casted, **pkwargs)
+
+                async with aclosing(values):  # pyright: ignore[reportArgumentType]
+                    if _input:
+                        results: list[RikoValue] = []
+
+                        async for value in values:
+                            results.append(value)
+
+                            if count == "first":
+                                break
+
+                        stream = iter(results)
+
+                        for processed in self.finalize(prepared, _input, stream, count):
+                            yield processed
                     else:
-                        processed = self.process(
-                            *args, emit=False, skip=False, count=count
-                        )
+                        finalize = partial(self.finalize, prepared, _input, count="all")
+                        empty = True
 
-            yield from processed
+                        async for value in values:
+                            empty = False
+
+                            for processed in finalize(iter([value])):
+                                yield processed
+
+                            if count == "first":
+                                break
+
+                        if empty:
+                            stream = iter(())
+
+                            for processed in self.finalize(
+                                prepared, _input, stream, count
+                            ):
+                                yield processed
+
+        def sync_wrapper(
+            item: ProcessorWrapperInput | None = None,
+            conf: Conf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> ProcessorWrapperOutput:
+            prepared, _context = self.plan(
+                module_name,
+                conf,
+                context,
+                assign=assign,
+                count=count,
+                mode=mode,
+                inputs=inputs,
+                **kwargs,
+            )
+
+            yield from sync_process(
+                item, prepared, _context, field=field, count=count, **kwargs
+            )
 
         isasync = self._resolve_isasync(pipe)
         wrapper = wraps(pipe)(async_wrapper if isasync else sync_wrapper)
         self._set_wrapper_metadata(wrapper, pipe, isasync)
+
+        if not isasync:
+            # Lets a SyncPipe fuse consecutive processors into one per-item step
+            setattr(wrapper, "stage", sync_stage)  # noqa: B010
+
+        if isasync:
+            # Lets an AsyncPipe map the pipe over its upstream in bounded windows
+            setattr(wrapper, "stream", async_stream)  # noqa: B010
+
+        if self.feed and isasync:
+            # Lets an AsyncPipe stream a source's results as they are parsed
+            setattr(wrapper, "feed", async_feed)  # noqa: B010
+
+        setattr(wrapper, "batch", self.batch)  # noqa: B010
+
         return cast(ProcessorWrapper, wrapper)
 
 
@@ -720,13 +1180,32 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
         isasync: Literal[False] = ...,
         **kwargs: object,
     ) -> None: ...
-    def __init__(self, *args: object, **kwargs: object):  # noqa: E301
+    def __init__(  # noqa: E301
+        self,
+        *args: object,
+        partition: Callable[..., Any] | None = None,
+        combine: Callable[..., Any] | None = None,
+        feed: FeedOperatorParser | None = None,
+        **kwargs: object,
+    ):
         """
         Creates a sync/async pipe that processes an entire stream of items
 
         Args:
             defaults (dict): Default `conf` values.
             isasync (bool): Wraps an async pipe (default: False)
+            partition (func): Computes the partial result of one chunk of the
+                stream. Takes the same args as the pipe (default: None).
+            combine (func): Reduces the partial results of consecutive chunks
+                (in stream order) to the pipe's result. Takes the partials,
+                objconf, and kwargs. With `partition`, lets a parallel
+                SyncPipe aggregate chunks in its worker pool (default: None).
+            feed (func): An async generator taking the same args as the pipe,
+                but with `stream` and `tuples` as async iterators, and
+                yielding its results as it reads them. Lets an AsyncPipe run
+                the pipe on its upstream feed without buffering it first
+                (default: None).
+
             opts (dict): The keyword arguments passed to the wrapper
 
         Kwargs:
@@ -779,6 +1258,7 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
 
         Examples:
             >>> from riko import async_return, issync, run
+            >>> from riko.bado.itertools import async_iter
             >>>
             >>> # emit is True by default
             >>> # and operators can't skip items, so the pipe is passed an
@@ -828,9 +1308,44 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
             ...     run(main)
             {'content': 'say "hello world" three times!'}
             {'content': 4}
+            >>> def part(stream, objconf, tuples, **kwargs):
+            ...     return sum(len(item['content'].split()) for item in stream)
+            ...
+            >>> def combine(partials, objconf, **kwargs):
+            ...     return sum(partials)
+            ...
+            >>> @operator(partition=part, combine=combine)
+            ... def pipe3(stream, objconf, tuples, **kwargs) -> int:
+            ...     return part(stream, objconf, tuples, **kwargs)
+            ...
+            >>> partials = [pipe3.partition([item], **kwargs) for item in items]
+            >>> partials
+            [2, 2]
+            >>> next(pipe3.combine(partials, **kwargs))
+            {'content': 4}
+            >>> async def feed(stream, objconf, tuples, **kwargs):
+            ...     async for item in stream:
+            ...         yield {'content': item['content'].upper()}
+            ...
+            >>> @operator(isasync=True, feed=feed)
+            ... def async_pipe3(stream, objconf, tuples, **kwargs):
+            ...     return ({'content': i['content'].upper()} for i in stream)
+            ...
+            >>> async def main():
+            ...     feed = async_iter(items)
+            ...     print([item async for item in async_pipe3.feed(feed)])
+            ...
+            >>> if issync:
+            ...     print([{'content': 'HELLO WORLD'}, {'content': 'BYE WORLD'}])
+            ... else:
+            ...     run(main)
+            [{'content': 'HELLO WORLD'}, {'content': 'BYE WORLD'}]
 
         """
         super().__init__(*args, **kwargs)  # pyright: ignore[reportAttributeAccessIssue]
+        self.partition = partition
+        self.combine = combine
+        self.feed = feed
 
     def parse(self, items: OperatorWrapperInput | None = None) -> Stream:
         if items:
@@ -840,6 +1355,59 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
                 else:
                     yield DotDict({"content": item})
 
+    async def parse_feed(
+        self, items: AsyncIterable[Item] | OperatorWrapperInput | None = None
+    ) -> AsyncGenerator[DotDict, None]:
+        """The async counterpart of `parse`, closing `items` when done."""
+        if items is not None:
+            if isinstance(items, AsyncIterable):
+                source = aiter(items)
+            else:
+                source = async_iter(items)
+
+            try:
+                async for item in source:
+                    if is_mapping(item):
+                        yield DotDict(item)
+                    else:
+                        yield DotDict({"content": item})
+            finally:
+                if isinstance(source, AsyncGenerator):
+                    await source.aclose()
+
+    def setup_feed(
+        self,
+        prepared: PreparedModule,
+        _input: AsyncStream,
+        field: str | None = None,
+        **kwargs: object,
+    ) -> tuple[AsyncPipeTuples, AsyncStream, Casted]:
+        """The async counterpart of `setup`, pulling `_input` lazily."""
+        if prepared.static_casted:
+            _, pre_casted_extract, pre_casted_conf = prepared.static_casted
+            objconf = pre_casted_conf
+            casted = Casted({}, pre_casted_extract, pre_casted_conf)
+            tuples = ((item, objconf) async for item in _input)
+            orig_stream = _input
+        else:
+            _dispatcher = partial(
+                parse_and_cast,
+                conf=prepared.conf,
+                parsers=prepared.parsers,
+                casters=prepared.casters,
+                defaults=self.defaults,
+                field=field,
+            )
+            dispatcher = cast(Callable[[Item, Opts], ItemDispatch], _dispatcher)
+            dispatches = (dispatcher(item, prepared.opts) async for item in _input)
+
+            # `tuples` and `orig_stream` share `dispatches`, see `setup`
+            tuples = ((d.item, d.casted.conf) async for d in dispatches)
+            orig_stream = (d.item async for d in dispatches)
+            casted = dispatcher(DotDict(), prepared.opts, **kwargs).casted
+
+        return (tuples, orig_stream, casted)
+
     def setup(
         self,
         prepared: PreparedModule,
@@ -922,6 +1490,21 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
 
         return result
 
+    def finish(
+        self,
+        stream: OperatorParserOutput,
+        prepared: PreparedModule,
+    ) -> OperatorWrapperOutput:
+        """Emit or assign the parsed `stream` according to `prepared`."""
+        if isinstance(stream, Iterator):
+            emit = bool(prepared.emit)
+        elif callable(prepared.emit):
+            emit = prepared.emit(stream)
+        else:
+            emit = bool(prepared.emit)
+
+        return self.process(stream, prepared.assign, emit=emit)
+
     @overload
     def __call__(  # noqa: E704
         self: "operator[Literal[True]]", pipe: AsyncOperatorParser
@@ -1022,6 +1605,8 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
             mode: ExecutionMode | None = None,
             inputs: Inputs | None = None,
             embed: AsyncProcessorWrapper | AsyncSubPipe | None = None,
+            concurrency: int = 1,
+            order: LoopOrder = "parent",
             **kwargs: bool,
         ) -> OperatorWrapperOutput:
             _input = self.parse(items)
@@ -1050,6 +1635,8 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
                 assign=assign,
                 emit=bool(prepared.emit),
                 count=count,
+                concurrency=concurrency,
+                order=order,
             )
 
             if looped:
@@ -1066,17 +1653,55 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
                 result = async_pipe(orig_stream, casted.extraction, tuples, **pkwargs)
                 stream = (await result) if isawaitable(result) else result
 
-                if isinstance(stream, Iterator):
-                    emit = bool(prepared.emit)
-                elif callable(prepared.emit):
-                    emit = prepared.emit(stream)
-                else:
-                    emit = bool(prepared.emit)
-
-                processed = self.process(stream, assign, emit=emit)
+                processed = self.finish(stream, prepared)
 
             return processed
 
+        async def async_feed(
+            items: AsyncIterable[Item] | OperatorWrapperInput | None = None,
+            conf: Conf | DynamicConf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> AsyncGenerator[ItemOrValue, None]:
+            """
+            Yield the results of the pipe's `feed` as it reads them from the
+            (async) `items`, so the upstream is only pulled as needed. Results
+            assigned to an item are collected first since they all end up in
+            that one item.
+            """
+            _input = self.parse_feed(items)
+            prepared = self.prepare(
+                op_module_name, conf=conf, assign=assign, count=count, **kwargs
+            )
+            context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
+            inputs = context.inputs
+            tuples, orig_stream, casted = self.setup_feed(
+                prepared, _input, inputs=inputs, field=field, count=count, **kwargs
+            )
+            feed = cast(FeedOperatorParser, self.feed)
+            pkwargs = {"inputs": inputs, "count": count, **kwargs}
+            results = feed(orig_stream, casted.extraction, tuples, **pkwargs)
+            values = cast(AsyncGenerator[ItemOrValue, None], results)
+
+            async with aclosing(_input), aclosing(values):
+                if prepared.emit:
+                    async for value in values:
+                        yield DotDict.dictize(value)
+
+                        if count == "first":
+                            break
+                else:
+                    stream = iter([value async for value in values])
+
+                    for processed in self.finish(stream, prepared):
+                        yield processed
+
         def sync_wrapper(
             items: OperatorWrapperInput | None = None,
             conf: Conf | DynamicConf | None = None,
@@ -1132,23 +1757,88 @@ class operator[B: (Literal[True], Literal[False])](Module[B]):  # noqa: N801
                 }
                 stream = sync_pipe(orig_stream, casted.extraction, tuples, **pkwargs)
 
-                if isinstance(stream, Iterator):
-                    emit = bool(prepared.emit)
-                elif callable(prepared.emit):
-                    emit = prepared.emit(stream)
-                else:
-                    emit = bool(prepared.emit)
-
-                processed = self.process(stream, assign, emit=emit)
+                processed = self.finish(stream, prepared)
 
             yield from processed
 
+        def sync_partition(
+            items: OperatorWrapperInput | None = None,
+            conf: Conf | DynamicConf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> object:
+            """
+            The partial result of one chunk of items (taking the same options
+            as the pipe itself). Must pickle for process pools.
+            """
+            prepared = self.prepare(
+                op_module_name, conf=conf, assign=assign, count=count, **kwargs
+            )
+            context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
+            inputs = context.inputs
+            tuples, orig_stream, casted = self.setup(
+                prepared,
+                self.parse(items),
+                inputs=inputs,
+                field=field,
+                count=count,
+                **kwargs,
+            )
+            partition = cast(Callable[..., object], self.partition)
+            pkwargs = {"inputs": inputs, "count": count, **kwargs}
+            return partition(orig_stream, casted.extraction, tuples, **pkwargs)
+
+        def sync_combine(
+            partials: Iterable[object],
+            conf: Conf | DynamicConf | None = None,
+            context: Context | None = None,
+            *,
+            assign: str | None = None,
+            field: str | None = None,
+            count: CountValues | None = None,
+            mode: ExecutionMode | None = None,
+            inputs: Inputs | None = None,
+            **kwargs: bool,
+        ) -> Stream:
+            """
+            Reduce the partial results of consecutive chunks (in stream order)
+            to the items the pipe would have yielded for the whole stream.
+            """
+            prepared = self.prepare(
+                op_module_name, conf=conf, assign=assign, count=count, **kwargs
+            )
+            context = parse_context(context, mode=mode, inputs=inputs, **kwargs)
+            inputs = context.inputs
+            _, _, casted = self.setup(
+                prepared, iter(()), inputs=inputs, field=field, count=count, **kwargs
+            )
+            combine = cast(Callable[..., OperatorParserOutput], self.combine)
+            pkwargs = {"inputs": inputs, "count": count, **kwargs}
+            stream = combine(iter(partials), casted.extraction, **pkwargs)
+            yield from self.finish(stream, prepared)
+
         if isasync := self._resolve_isasync(pipe):
             wrapper = wraps(pipe)(async_wrapper)
         else:
             wrapper = wraps(pipe)(sync_wrapper)
 
         self._set_wrapper_metadata(wrapper, pipe, isasync)
+
+        if self.partition and self.combine and not isasync:
+            # Lets a parallel SyncPipe aggregate chunks of its source in a pool
+            setattr(wrapper, "partition", sync_partition)  # noqa: B010
+            setattr(wrapper, "combine", sync_combine)  # noqa: B010
+
+        if self.feed and isasync:
+            # Lets an AsyncPipe run the pipe on its upstream without buffering it
+            setattr(wrapper, "feed", async_feed)  # noqa: B010
+
         return cast(OperatorWrapper, wrapper)
 
 
@@ -17,16 +17,25 @@ The lazy-async loop runs the embed once per parent *sequentially* and yields the
 per-parent fold incrementally as an ``AsyncIterator`` — preserving parent order,
 applying backpressure (the source only advances as the consumer pulls), and
 letting ``count="first"`` stop after the first result without materializing the
-rest.
+rest. With ``concurrency`` above 1, it runs the embed for up to that many parents
+at once (e.g., to overlap the requests of an embedded ``fetch``), still pulling
+parents only as workers free up, and yields each parent's fold in parent order
+or, with ``order="arrival"``, as soon as it completes.
 """
 
+from contextlib import aclosing
 from functools import partial
 from logging import Logger
-from typing import Literal, cast, overload
+from typing import Literal, cast, get_args, overload
 
 import pygogo as gogo
 
-from riko.bado.itertools import async_iter
+from riko.bado.itertools import (
+    async_iter,
+    async_map_ordered_stream,
+    async_map_stream,
+    unwrap_close,
+)
 from riko.context import Context
 from riko.modules._assignment import get_subpipe
 from riko.modules._subpipe import is_subpipe
@@ -43,7 +52,7 @@ from riko.types.general import (
     SyncProcessorWrapper,
     SyncSubPipe,
 )
-from riko.types.modules import CountValues
+from riko.types.modules import CountValues, LoopOrder
 
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
@@ -138,14 +147,33 @@ async def _run_loop_async(
     assign: str | None = None,
     emit: bool | None = None,
     count: CountValues | None,
+    concurrency: int = 1,
+    order: LoopOrder = "parent",
 ) -> AsyncStreamOrValueStream:
     embedder = get_subpipe(embed, context, embedded_kwargs, field=field)
 
-    async for parent in async_iter(source):
-        results = _take(await embedder(parent), count)
+    if concurrency > 1:
+
+        async def fold(parent: Item) -> list[Item]:
+            # Fold in the worker so ``count="first"`` closes the child there
+            results = _take(await embedder(parent), count)
+            return list(_fold_parent(parent, results, assign or "", bool(emit)))
 
-        for value in _fold_parent(parent, results, assign or "", bool(emit)):
-            yield value
+        map_stream = (
+            async_map_stream if order == "arrival" else async_map_ordered_stream
+        )
+        folds = map_stream(fold, async_iter(source), limit=concurrency)
+
+        async with unwrap_close(), aclosing(folds):
+            async for values in folds:
+                for value in values:
+                    yield value
+    else:
+        async for parent in async_iter(source):
+            results = _take(await embedder(parent), count)
+
+            for value in _fold_parent(parent, results, assign or "", bool(emit)):
+                yield value
 
 
 def loop_embed_sync(
@@ -206,19 +234,37 @@ def loop_embed_async(
     assign: str | None = None,
     emit: bool | None = None,
     count: CountValues | None = None,
+    concurrency: int = 1,
+    order: LoopOrder = "parent",
 ) -> tuple[bool, bool, AsyncStreamOrValueStream | Stream]:
     """
     Lazy-async counterpart of ``loop_embed_sync``: constructs (without advancing)
-    a sequential per-parent async loop generator that yields results as the
-    consumer pulls. Unlike the eager path this neither materializes the source
-    nor runs the embeds concurrently — ordering, backpressure, and early exit on
-    ``count="first"`` fall out of sequential iteration.
+    a per-parent async loop generator that yields results as the consumer pulls.
+    Unlike the eager path this never materializes the source. By default the
+    embeds run sequentially, so ordering, backpressure, and early exit on
+    ``count="first"`` fall out of sequential iteration; a `concurrency` above 1
+    runs up to that many at once in a bounded pool that keeps all three (parent
+    order unless `order` is "arrival").
     """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    if order not in get_args(LoopOrder):
+        raise ValueError(f"order must be 'parent' or 'arrival', not {order!r}")
+
     embed_type = getattr(embed, "type", None)
     handled = True
     looped = False
     stream = source
-    loop = partial(_run_loop_async, field=field, assign=assign, emit=emit, count=count)
+    loop = partial(
+        _run_loop_async,
+        field=field,
+        assign=assign,
+        emit=emit,
+        count=count,
+        concurrency=concurrency,
+        order=order,
+    )
 
     if is_subpipe(embed):
         # A sub-pipeline embed is self-contained, so it runs per parent with no
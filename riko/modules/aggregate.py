@@ -1,6 +1,8 @@
 # vim: sw=4:ts=4:expandtab
 """
-Provides functions for performing an arbitrary (user-defined) function on a stream
+Provides functions for performing an arbitrary (user-defined) function on a
+stream, or for computing running aggregates (count, sum, min, max, mean, and
+approximate distinct count) of a field, optionally grouped by another field.
 
 Examples:
     basic usage::
@@ -12,6 +14,16 @@ Examples:
         >>> next(pipe(items, func=func))
         {'y': 3}
 
+    streaming aggregates::
+
+        >>> items = [{'k': x % 2, 'x': x} for x in range(5)]
+        >>> conf = {'group_key': 'k', 'value_key': 'x'}
+        >>> next(pipe(items, conf=conf))
+        {'k': '0', 'count': 3, 'sum': 6, 'min': 0, 'max': 4, 'mean': 2.0}
+
+Attributes:
+    DEFAULTS (dict): The default parser options
+
 """
 
 from collections.abc import Callable
@@ -21,16 +33,57 @@ from typing import Any, cast
 
 import pygogo as gogo
 
+from riko._aggregate import AGGREGATES, aggregate_by, gen_aggregates, get_budget
 from riko._iterutils import listize
 from riko.types.configs import AggregateObjconf
 from riko.types.general import Defaults, Item, PipeTuples, Stream
 
 from . import operator
 
-DEFAULTS: Defaults = Defaults()
+DEFAULTS: Defaults = {
+    "group_key": None,
+    "value_key": "content",
+    "aggregates": ["count", "sum", "min", "max", "mean"],
+    "budget": None,
+}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
+def gen_aggregated(stream: Stream, objconf: AggregateObjconf) -> Stream:
+    """
+    Stream the configured aggregates of `stream`, one item per group.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> stream = [{'k': 'a', 'x': 2}, {'k': 'b'}, {'k': 'a', 'x': 4}]
+        >>> conf = {'group_key': 'k', 'value_key': 'x', 'aggregates': ['mean']}
+        >>> list(gen_aggregated(stream, Objectify(conf)))
+        [{'k': 'a', 'mean': 3.0}, {'k': 'b', 'mean': None}]
+        >>> conf['aggregates'] = 'median'
+        >>> gen_aggregated(stream, Objectify(conf))
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported aggregate: 'median'.
+
+    """
+    funcs = listize(objconf.aggregates or DEFAULTS["aggregates"])
+
+    if unsupported := [func for func in funcs if func not in AGGREGATES]:
+        raise ValueError(f"Unsupported aggregate: {unsupported[0]!r}.")
+
+    group_key, value_key = objconf.group_key, objconf.value_key or "content"
+    grouped = aggregate_by(
+        stream,
+        group_key,
+        lambda item: item.get(value_key),
+        distinct="distinct" in funcs,
+        budget=get_budget(objconf.budget),
+    )
+
+    return gen_aggregates(grouped, funcs, group_key)
+
+
 async def async_parser(
     stream: Stream, objconf: AggregateObjconf, tuples: PipeTuples, **kwargs: object
 ) -> Stream:
@@ -78,10 +131,13 @@ def parser(
         {'y': 3}
 
     """
-    func = cast(Callable[[Stream], Item], kwargs["func"])
-    result = func(stream)
-    listed = listize(result)
-    return iter(cast(list[Item], listed))
+    if func := cast(Callable[[Stream], Item] | None, kwargs.get("func")):
+        listed = listize(func(stream))
+        aggregated = iter(cast(list[Item], listed))
+    else:
+        aggregated = gen_aggregated(stream, objconf)
+
+    return aggregated
 
 
 @operator(DEFAULTS, isasync=True)
@@ -95,7 +151,26 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        func (callable): User defined function to apply to the stream.
+        func (callable): User defined function to apply to the stream. If
+            unset, the aggregates in `conf` are computed instead.
+
+        conf (dict): The pipe configuration. May contain the keys 'group_key',
+            'value_key', 'aggregates', or 'budget'.
+
+            group_key (str): Item attribute to aggregate by. This will report
+                the aggregates of each group, keyed by its (stringified) value
+                (default: None).
+
+            value_key (str): Item attribute (a number) to aggregate
+                (default: 'content').
+
+            aggregates (List[str]): The aggregates to report. Any of 'count',
+                'sum', 'min', 'max', 'mean', or 'distinct' (an approximate
+                count of distinct values) (default: ['count', 'sum', 'min',
+                'max', 'mean']).
+
+            budget (int): Maximum number of groups to hold in memory before
+                spilling them to disk (default: None, i.e., never spill).
 
     Examples:
         >>> from riko import run
@@ -123,7 +198,26 @@ def pipe(*args: Any, **kwargs: object) -> Stream:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        func (callable): User defined function to apply to the stream.
+        func (callable): User defined function to apply to the stream. If
+            unset, the aggregates in `conf` are computed instead.
+
+        conf (dict): The pipe configuration. May contain the keys 'group_key',
+            'value_key', 'aggregates', or 'budget'.
+
+            group_key (str): Item attribute to aggregate by. This will report
+                the aggregates of each group, keyed by its (stringified) value
+                (default: None).
+
+            value_key (str): Item attribute (a number) to aggregate
+                (default: 'content').
+
+            aggregates (List[str]): The aggregates to report. Any of 'count',
+                'sum', 'min', 'max', 'mean', or 'distinct' (an approximate
+                count of distinct values) (default: ['count', 'sum', 'min',
+                'max', 'mean']).
+
+            budget (int): Maximum number of groups to hold in memory before
+                spilling them to disk (default: None, i.e., never spill).
 
     Examples:
         >>> items = [{'x': x} for x in range(5)]
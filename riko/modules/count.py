@@ -23,18 +23,19 @@ from typing import Any
 
 import pygogo as gogo
 
-from riko._iterutils import group_by
+from riko._aggregate import Accumulator, aggregate_by, get_budget, merge_groups
+from riko.types.configs import CountObjconf
 from riko.types.general import Defaults, Opts, PipeTuples, Stream
 
 from . import operator
 
-OPTS: Opts = {"extract": "count_key"}
-DEFAULTS: Defaults = {"count_key": None}
+OPTS: Opts = Opts()
+DEFAULTS: Defaults = {"count_key": None, "budget": None}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
 def parser(
-    stream: Stream, count_key: str, tuples: PipeTuples, **kwargs: object
+    stream: Stream, objconf: CountObjconf, tuples: PipeTuples, **kwargs: object
 ) -> int | Iterator[dict[str, int]]:
     """
     Parses the pipe content
@@ -43,7 +44,7 @@ def parser(
         stream (Iter[dict]): The source. Note: this shares the `tuples`
             iterator, so consuming it will consume `tuples` as well.
 
-        key (str): the field to group by.
+        objconf (obj): The pipe configuration (an Objectify instance)
 
         tuples (Iter[(dict, obj)]): Iterable of tuples of (item, objconf)
             `item` is an element in the source stream and `objconf` is the item
@@ -60,27 +61,86 @@ def parser(
 
     Examples:
         >>> from itertools import repeat
+        >>> from meza.fntools import Objectify
         >>>
         >>> stream = ({'x': x} for x in range(5))
-        >>> tuples = zip(stream, repeat(None))
-        >>> parser(stream, None, tuples)
+        >>> objconf = Objectify({})
+        >>> tuples = zip(stream, repeat(objconf))
+        >>> parser(stream, objconf, tuples)
         5
         >>> conf = {'count_key': 'word'}
         >>> kwargs = {'conf': conf}
+        >>> objconf = Objectify(conf)
         >>> stream = [{'word': 'two'}, {'word': 'one'}, {'word': 'two'}]
-        >>> tuples = zip(stream, repeat(conf['count_key']))
-        >>> counted = parser(stream, conf['count_key'], tuples, **kwargs)
+        >>> tuples = zip(stream, repeat(objconf))
+        >>> counted = parser(stream, objconf, tuples, **kwargs)
         >>> next(counted)
         {'two': 2}
         >>> next(counted)
         {'one': 1}
 
     """
-    if count_key:
-        grouped = group_by(stream, count_key)
-        counted = ({key: len(group)} for key, group in grouped)
+    if objconf.count_key:
+        grouped = aggregate_by(
+            stream, objconf.count_key, budget=get_budget(objconf.budget)
+        )
+        counted = ({key: acc.count} for key, acc in grouped)
     else:
-        counted = len(list(stream))
+        counted = sum(1 for _ in stream)
+
+    return counted
+
+
+def partition(
+    stream: Stream, objconf: CountObjconf, tuples: PipeTuples, **kwargs: object
+) -> int | list[tuple[str, Accumulator]]:
+    """
+    Counts one chunk of the stream (the map side of a parallel count)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> partition(({'x': x} for x in range(5)), Objectify({}), iter(()))
+        5
+        >>> stream = [{'word': 'two'}, {'word': 'one'}, {'word': 'two'}]
+        >>> objconf = Objectify({'count_key': 'word'})
+        >>> [(key, acc.count) for key, acc in partition(stream, objconf, iter(()))]
+        [('two', 2), ('one', 1)]
+
+    """
+    if objconf.count_key:
+        counted = list(aggregate_by(stream, objconf.count_key))
+    else:
+        counted = sum(1 for _ in stream)
+
+    return counted
+
+
+def combine(
+    partials: Iterator[Any], objconf: CountObjconf, **kwargs: object
+) -> int | Iterator[dict[str, int]]:
+    """
+    Merges the counts of consecutive chunks (the reduce side of a parallel
+    count)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> combine(iter([2, 3]), Objectify({}))
+        5
+        >>> words = [{'word': 'two'}, {'word': 'one'}, {'word': 'two'}]
+        >>> objconf = Objectify({'count_key': 'word'})
+        >>> chunks = [words[:1], words[1:]]
+        >>> partials = (partition(chunk, objconf, iter(())) for chunk in chunks)
+        >>> list(combine(partials, objconf))
+        [{'two': 2}, {'one': 1}]
+
+    """
+    if objconf.count_key:
+        grouped = merge_groups(partials, budget=get_budget(objconf.budget))
+        counted = ({key: acc.count} for key, acc in grouped)
+    else:
+        counted = sum(partials)
 
     return counted
 
@@ -96,12 +156,17 @@ def async_pipe(*args: Any, **kwargs: object) -> int | Iterator[dict[str, int]]:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the key 'count_key'.
+        conf (dict): The pipe configuration. May contain the keys 'count_key'
+            or 'budget'.
 
             count_key (str): Item attribute to count by. This will group items
                 in the stream by the given key and report a count for each
                 group (default: None).
 
+            budget (int): Maximum number of group counts to hold in memory
+                before spilling them to disk (default: None, i.e., never
+                spill).
+
         assign (str): Attribute to assign parsed content. If `count_key` is set,
             this is ignored and the group keys are used instead. (default:
             content)
@@ -125,7 +190,7 @@ def async_pipe(*args: Any, **kwargs: object) -> int | Iterator[dict[str, int]]:
     return parser(*args, **kwargs)
 
 
-@operator(DEFAULTS, **OPTS)
+@operator(DEFAULTS, partition=partition, combine=combine, **OPTS)
 def pipe(*args: Any, **kwargs: object) -> int | Iterator[dict[str, int]]:
     """
     An operator that eagerly counts the number of items in a stream.
@@ -136,12 +201,17 @@ def pipe(*args: Any, **kwargs: object) -> int | Iterator[dict[str, int]]:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the key 'count_key'.
+        conf (dict): The pipe configuration. May contain the keys 'count_key'
+            or 'budget'.
 
             count_key (str): Item attribute to count by. This will group items
                 in the stream by the given key and report a count for each
                 group (default: None).
 
+            budget (int): Maximum number of group counts to hold in memory
+                before spilling them to disk (default: None, i.e., never
+                spill).
+
         assign (str): Attribute to assign parsed content. If `count_key` is set,
             this is ignored and the group keys are used instead. (default:
             content)
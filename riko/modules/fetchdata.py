@@ -21,6 +21,8 @@ Attributes:
 
 """
 
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from logging import Logger
 from os.path import splitext
 from typing import Any, cast
@@ -32,7 +34,7 @@ from riko._io import Fetch, auto_close
 from riko._iterutils import listize
 from riko.bado import io
 from riko.cast import SourceOpts
-from riko.parsers import any2dict
+from riko.parsers import any2dict, ijson
 from riko.types.configs import FetchDataObjconf
 from riko.types.general import Defaults, Extraction, FileTypes, Item, Opts, Stream
 
@@ -86,6 +88,99 @@ async def async_parser(
     return stream
 
 
+async def get_json_kind(reader: io.AsyncChunkReader, path: str) -> str | None:
+    """
+    The ijson event that starts the JSON value at a dot separated `path`, e.g.,
+    'start_array' for a list, or None if there is no such value. Only the
+    document up to that value is read.
+
+    Examples:
+        >>> from riko.bado import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> async def main():
+        ...     for path in ['value.items', 'value.items.item', 'value.list']:
+        ...         doc = b'{"value": {"items": [{"item": 1}]}}'
+        ...         reader = io.AsyncChunkReader(async_iter([doc]))
+        ...         print(await get_json_kind(reader, path))
+        >>>
+        >>> run(main)
+        start_array
+        None
+        None
+
+    """
+    *parents, key = path.split(".")
+    parent, keyed, kind = ".".join(parents), False, None
+
+    async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+        if keyed:
+            kind = event
+            break
+
+        keyed = prefix == parent and event == "map_key" and value == key
+
+    return kind
+
+
+async def async_feed(
+    _: Item, extraction: Extraction, objconf: FetchDataObjconf, **kwargs: object
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it downloads. The items of a
+    JSON list (at `path`) are parsed incrementally (with ijson), and any other
+    content (including a JSON object at `path`) is parsed once it is fully
+    read, just as ``parser`` does.
+
+    Args:
+        _ (Item): The item (Ignored)
+        extraction: Field values extracted from the item (Ignored)
+        objconf (obj): The pipe configuration (an Objectify instance)
+        kwargs (dict): Keyword arguments
+
+    Yields:
+        dict: The parsed items
+
+    Examples:
+        >>> from riko import get_path
+        >>> from riko import run
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> async def main():
+        ...     url = get_path('gigs.json')
+        ...     objconf = Objectify({'url': url, 'path': 'value.items'})
+        ...     items = async_feed(None, None, objconf)
+        ...     print((await anext(items))['title'])
+        ...     await items.aclose()
+        >>>
+        >>> run(main)
+        Business System Analyst
+
+    """
+    ext = splitext(objconf.url)[1].lstrip(".")
+    path = objconf.path if isinstance(objconf.path, str) else ".".join(objconf.path)
+
+    streamed = False
+
+    if ext == "json" and path and ijson:
+        chunks = io.async_url_chunks(objconf.url)
+        reader = io.AsyncReplayReader(chunks)
+
+        async with aclosing(chunks):
+            # Only a list can be streamed item by item, so peek at the value
+            if await get_json_kind(reader, path) == "start_array":
+                streamed = True
+                reader.replay()
+                prefix = f"{path}.item"
+
+                async for item in ijson.items_async(reader, prefix, use_float=True):
+                    yield item
+
+    if not streamed:
+        for item in await async_parser(_, extraction, objconf, **kwargs):
+            yield item
+
+
 def parser(
     _: Item, extraction: Extraction, objconf: FetchDataObjconf, **kwargs: object
 ) -> Stream:
@@ -125,7 +220,7 @@ def parser(
         yield from any2dict(content, ext, objconf.html5, path=path)
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
+@processor(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 async def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     A source that asynchronously fetches and parses an XML or JSON file to
@@ -20,6 +20,9 @@ Attributes:
 
 """
 
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
+from functools import partial
 from logging import Logger
 from os.path import splitext
 from typing import Any
@@ -96,6 +99,61 @@ async def async_parser(
     return stream
 
 
+async def async_feed(
+    _: Item, extraction: Extraction, objconf: FetchTableObjconf, **kwargs: object
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it downloads. A csv file is
+    parsed incrementally, and any other table once it is fully read.
+
+    Args:
+        _ (Item): The item (Ignored)
+        extraction: Field values extracted from the item (Ignored)
+        objconf (obj): The pipe configuration (an Objectify instance)
+        kwargs (dict): Keyword arguments
+
+    Yields:
+        dict: The parsed rows
+
+    Examples:
+        >>> from riko import get_path
+        >>> from riko import run
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> async def main():
+        ...     url = get_path('spreadsheet.csv')
+        ...     conf = {
+        ...         'url': url, 'sanitize': True, 'skip_rows': 0,
+        ...         'encoding': ENCODING, 'has_header': True}
+        ...     objconf = Objectify(conf)
+        ...     rows = async_feed(None, None, objconf)
+        ...     print((await anext(rows))['mileage'])
+        ...     await rows.aclose()
+        >>>
+        >>> run(main)
+        7213
+
+    """
+    first_row, custom_header = objconf.skip_rows, objconf.col_names
+    renamed = {"first_row": first_row, "custom_header": custom_header}
+    rkwargs = {**objconf, **renamed}
+    ext = splitext(objconf.url)[1]
+
+    # Without a header, meza rereads the (seekable) file for the first row
+    if ext == ".csv" and (objconf.has_header or objconf.col_names):
+        parse = partial(read, ext=ext, **rkwargs)
+        chunks = io.async_url_chunks(objconf.url)
+        args = (chunks, parse, objconf.encoding)
+        rows = io.async_parse(*args, name=objconf.url)
+
+        async with aclosing(rows):
+            async for row in rows:
+                yield row
+    else:
+        for row in await async_parser(_, extraction, objconf, **kwargs):
+            yield row
+
+
 def parser(
     _: Item, extraction: Extraction, objconf: FetchTableObjconf, **kwargs: object
 ) -> Stream:
@@ -133,7 +191,7 @@ def parser(
     return stream
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
+@processor(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 async def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     A source that asynchronously fetches a file.
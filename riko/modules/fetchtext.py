@@ -21,7 +21,8 @@ Attributes:
 
 """
 
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import aclosing
 from logging import Logger
 from typing import Any
 
@@ -79,6 +80,44 @@ async def async_parser(
     return stream
 
 
+async def async_feed(
+    _: Item, extraction: Extraction, objconf: FetchTextObjconf, **kwargs: object
+) -> AsyncGenerator[str, None]:
+    """
+    Asynchronously parses the pipe content line by line as it downloads
+
+    Args:
+        _ (Item): The item (Ignored)
+        extraction: Field values extracted from the item (Ignored)
+        objconf (obj): The pipe configuration (an Objectify instance)
+        kwargs (dict): Keyword arguments
+
+    Yields:
+        str: The stripped lines
+
+    Examples:
+        >>> from riko import get_path
+        >>> from riko import run
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> async def main():
+        ...     url = get_path('lorem.txt')
+        ...     objconf = Objectify({'url': url, 'encoding': ENCODING})
+        ...     lines = async_feed(None, None, objconf)
+        ...     print(await anext(lines))
+        ...     await lines.aclose()
+        >>>
+        >>> run(main)
+        What is Lorem Ipsum?
+
+    """
+    chunks = io.async_url_chunks(objconf.url)
+
+    async with aclosing(chunks):
+        async for line in io.async_lines(chunks, objconf.encoding):
+            yield line.strip()
+
+
 def parser(
     _: Item, extraction: Extraction, objconf: FetchTextObjconf, **kwargs: object
 ) -> Iterator[str]:
@@ -113,7 +152,7 @@ def parser(
     return stream
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
+@processor(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 async def async_pipe(*args: Any, **kwargs: object) -> Iterator[str]:
     """
     A source that asynchronously fetches and parses an XML or JSON file to
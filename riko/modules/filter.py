@@ -29,7 +29,7 @@ Attributes:
 
 import operator as op
 import re
-from collections.abc import Callable, Sequence
+from collections.abc import AsyncGenerator, Callable, Sequence
 from datetime import date
 from decimal import Decimal, InvalidOperation
 from logging import Logger
@@ -42,7 +42,15 @@ from riko._objectify import Objectify
 from riko._serialize import repr_cache
 from riko.cast import cast_date
 from riko.dotdict import DotDict
-from riko.types.general import Defaults, Item, Opts, PipeTuples, Stream
+from riko.types.general import (
+    AsyncPipeTuples,
+    AsyncStream,
+    Defaults,
+    Item,
+    Opts,
+    PipeTuples,
+    Stream,
+)
 from riko.types.modules import FilterConfRule
 
 from . import operator
@@ -173,6 +181,110 @@ def parse_rule(rule: FilterConfRule, item: Item, **kwargs: object) -> bool:
     return result
 
 
+def check_rules(extract: Sequence[FilterConfRule]) -> None:
+    """
+    Raise a ValueError for a rule with an unsupported operation, and parse
+    (and memoize) each rule's value up front.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> check_rules([Objectify({'field': 'ex', 'op': 'is', 'value': 3})])
+        >>> check_rules([Objectify({'field': 'ex', 'op': 'bogus', 'value': 3})])
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported filter operation: 'bogus'.
+
+    """
+    for rule in extract:
+        if rule.op not in SWITCH:
+            raise ValueError(f"Unsupported filter operation: {rule.op!r}.")
+
+        truthiness = rule.op in TRUTHINESS_OPS
+        has_value = rule.value is not None
+
+        if has_value and not truthiness:
+            parse_arg(rule.value, rule.op, memoize=True)
+
+
+def permits(
+    item: Item, objconf: Objectify, extract: Sequence[FilterConfRule], **kwargs: object
+) -> bool | None:
+    """
+    Whether the rules let `item` through (None for an invalid `combine`)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> objconf = Objectify({'permit': True, 'combine': 'and'})
+        >>> rule = Objectify({'field': 'ex', 'op': 'greater', 'value': 3})
+        >>> permits({'ex': 4}, objconf, [rule]), permits({'ex': 2}, objconf, [rule])
+        (True, False)
+
+    """
+    try:
+        func = COMBINE_BOOLEAN[objconf.combine]
+    except KeyError:
+        msg = f"Invalid combine: '{objconf.combine}'. (Expected 'and' or 'or')"
+        logger.error(msg)
+        permitted = None
+    else:
+        result = func(parse_rule(rule, item, **kwargs) for rule in extract)
+        permitted = bool(result) == bool(objconf.permit)
+
+    return permitted
+
+
+async def async_feed(
+    _: AsyncStream,
+    extract: Sequence[FilterConfRule],
+    tuples: AsyncPipeTuples,
+    **kwargs: object,
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it arrives
+
+    Args:
+        _ (AsyncIter[dict]): The source (unused, since its items arrive
+            through `tuples`).
+
+        extract (List[obj]): the item independent rules (Objectify instances).
+
+        tuples (AsyncIter[(dict, obj)]): Async iterable of tuples of (item,
+            conf), see `parser`.
+
+        kwargs (dict): Keyword arguments.
+
+    Yields:
+        dict: The output
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>> from riko import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> objconf = Objectify({'permit': True, 'combine': 'and'})
+        >>> objrule = Objectify({'field': 'ex', 'op': 'greater', 'value': 3})
+        >>> tuples = async_iter(({'ex': x}, objconf) for x in range(5))
+        >>>
+        >>> async def main():
+        ...     print([item async for item in async_feed(None, [objrule], tuples)])
+        >>>
+        >>> run(main)
+        [{'ex': 4}]
+
+    """
+    check_rules(extract)
+
+    async for item, objconf in tuples:
+        permitted = permits(item, objconf, extract, **kwargs)
+
+        if permitted:
+            yield item
+        elif permitted is False and objconf.stop:
+            break
+
+
 def parser(
     _: Stream, extract: Sequence[FilterConfRule], tuples: PipeTuples, **kwargs: object
 ) -> Stream:
@@ -219,32 +331,18 @@ def parser(
         ValueError: Unsupported filter operation: 'bogus'.
 
     """
-    for rule in extract:
-        if rule.op not in SWITCH:
-            raise ValueError(f"Unsupported filter operation: {rule.op!r}.")
-
-        truthiness = rule.op in TRUTHINESS_OPS
-        has_value = rule.value is not None
-
-        if has_value and not truthiness:
-            parse_arg(rule.value, rule.op, memoize=True)
+    check_rules(extract)
 
     for item, objconf in tuples:
-        try:
-            func = COMBINE_BOOLEAN[objconf.combine]
-        except KeyError:
-            msg = f"Invalid combine: '{objconf.combine}'. (Expected 'and' or 'or')"
-            logger.error(msg)
-        else:
-            result = func(parse_rule(rule, item, **kwargs) for rule in extract)
+        permitted = permits(item, objconf, extract, **kwargs)
 
-            if (result and objconf.permit) or not (result or objconf.permit):
-                yield item
-            elif objconf.stop:
-                break
+        if permitted:
+            yield item
+        elif permitted is False and objconf.stop:
+            break
 
 
-@operator(DEFAULTS, isasync=True, **OPTS)
+@operator(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that asynchronously filters for source items matching
@@ -26,6 +26,7 @@ Attributes:
 """
 
 import ctypes
+from collections.abc import Sequence
 from logging import Logger
 from typing import Any
 
@@ -50,11 +51,12 @@ def parser(
     content: str, extraction: Extraction, objconf: DynamicConf, **kwargs: object
 ) -> int:
     """
-    Parsers the pipe content
+    Parses the pipe content
 
     Args:
-        word (str): The string to hash
-        _ (None): Ignored.
+        content (str): The string to hash
+        extraction (None): Ignored.
+        objconf (None): Ignored.
         kwargs (dict): Keyword arguments
 
     Kwargs:
@@ -76,8 +78,36 @@ def parser(
     return ctypes.c_uint(hash(content)).value
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-def async_pipe(*args: Any, **kwargs: object) -> int:
+def batch_parser(
+    contents: Sequence[str],
+    extraction: Extraction,
+    objconf: DynamicConf,
+    **kwargs: object,
+) -> list[int]:
+    """
+    Parses a batch of pipe content
+
+    Args:
+        contents (List[str]): The strings to hash
+        extraction (None): Ignored.
+        objconf (None): Ignored.
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[int]: The hashes
+
+    Examples:
+        >>> contents = ['hello world', 'hello you']
+        >>> hashes = batch_parser(contents, None, None)
+        >>> hashes == [parser(content, None, None) for content in contents]
+        True
+
+    """
+    return [ctypes.c_uint(hash(content)).value for content in contents]
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+def async_pipe(*args: Any, **kwargs: object) -> list[int]:
     """
     A processor module that asynchronously hashes the field of an item.
 
@@ -104,11 +134,11 @@ def async_pipe(*args: Any, **kwargs: object) -> int:
 
     """
     # TODO: figure out why print(next(x)) errs
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> int:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[int]:
     """
     A processor that hashes the field of an item.
 
@@ -131,4 +161,4 @@ def pipe(*args: Any, **kwargs: object) -> int:
         528683593
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
@@ -15,6 +15,16 @@ Examples:
         >>> len(list(joined))
         24
 
+    keyed joins::
+
+        >>> items = [{'id': x, 'sum': x} for x in range(3)]
+        >>> other = [{'key': x, 'count': x + 5} for x in range(1, 5)]
+        >>> conf = {'join_key': 'id', 'other_join_key': 'key', 'how': 'left'}
+        >>> [(i['id'], i.get('count')) for i in pipe(items, conf=conf, other=other)]
+        [(0, None), (1, 6), (2, 7)]
+        >>> conf['how'] = 'anti'
+        >>> [i['id'] for i in pipe(items, conf=conf, other=other)]
+        [0]
 
 Attributes:
     OPTS (dict): The default pipe options
@@ -22,14 +32,18 @@ Attributes:
 
 """
 
-from collections.abc import Mapping
-from itertools import product
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from functools import partial
+from itertools import chain, groupby, islice, product
 from logging import Logger
+from operator import itemgetter, length_hint
 from typing import Any, cast
 
 import pygogo as gogo
 from meza.process import join, merge
 
+from riko._spill import DEF_BUDGET, external_sort
 from riko.dotdict import is_mapping
 from riko.types.configs import JoinObjconf
 from riko.types.general import Defaults, Item, Opts, PipeTuples, Stream
@@ -37,9 +51,397 @@ from riko.types.general import Defaults, Item, Opts, PipeTuples, Stream
 from . import operator
 
 OPTS: Opts = Opts()
-DEFAULTS: Defaults = {"join_key": None, "lower": False}
+DEFAULTS: Defaults = {
+    "join_key": None,
+    "lower": False,
+    "how": "inner",
+    "strategy": "auto",
+    "budget": DEF_BUDGET,
+}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 _MISSING = object()
+JOIN_TYPES = {"inner", "left", "anti"}
+
+
+def is_hashable(value: object) -> bool:
+    """
+    Whether `value` can key a dict. Unlike ``isinstance(value, Hashable)``, this
+    is false for a tuple holding an unhashable value.
+
+    Examples:
+        >>> is_hashable((1, 'a')), is_hashable((1, [2])), is_hashable([2])
+        (True, False, False)
+
+    """
+    try:
+        hash(value)
+    except TypeError:
+        hashable = False
+    else:
+        hashable = True
+
+    return hashable
+
+
+def get_join_value(item: Item, key: str, lower: bool = False) -> object:
+    """
+    The value an item joins on, case-folded when `lower` is set. Missing keys
+    return a sentinel that never matches anything (not even another missing key).
+
+    Examples:
+        >>> get_join_value({'x': 'FOO'}, 'x', lower=True)
+        'foo'
+        >>> get_join_value({'x': 1}, 'x', lower=True)
+        1
+        >>> get_join_value({}, 'x') is _MISSING
+        True
+
+    """
+    value = item.get(key, _MISSING)
+    return value.lower() if lower and isinstance(value, str) else value
+
+
+class HashIndex:
+    """
+    A multimap of join value -> items, built once and probed per item. Values
+    that can't be hashed (e.g., lists) fall back to a linear scan so they still
+    join on equality like the nested loop does.
+
+    Examples:
+        >>> index = HashIndex('x')
+        >>> index.extend([{'x': 1, 'y': 'a'}, {'x': 1, 'y': 'b'}, {'x': [2]}, {}])
+        >>> [item['y'] for item in index.get(1)]
+        ['a', 'b']
+        >>> index.get([2])
+        [{'x': [2]}]
+        >>> index.add({'x': (3, [4])})
+        >>> index.get((3, [4]))
+        [{'x': (3, [4])}]
+        >>> index.get(_MISSING)
+        []
+
+    """
+
+    def __init__(self, key: str, lower: bool = False) -> None:
+        self.key = key
+        self.lower = lower
+        self.table: defaultdict[Hashable, list[Item]] = defaultdict(list)
+        self.unhashable: list[tuple[object, Item]] = []
+
+    def add(self, item: Item) -> None:
+        value = get_join_value(item, self.key, self.lower)
+
+        if value is _MISSING:
+            pass
+        elif is_hashable(value):
+            self.table[value].append(item)
+        else:
+            self.unhashable.append((value, item))
+
+    def extend(self, items: Iterable[Item]) -> None:
+        for item in items:
+            if is_mapping(item):
+                self.add(item)
+            else:
+                logger.warning(f"Unsupported type for join: {type(item)}")
+
+    def get(self, value: object) -> list[Item]:
+        if value is _MISSING:
+            matches = []
+        elif is_hashable(value):
+            matches = self.table.get(value, [])
+        else:
+            matches = [item for v, item in self.unhashable if v == value]
+
+        return matches
+
+
+def _emit(x: Item, matches: list[Item], how: str) -> Stream:
+    if how == "anti":
+        if not matches:
+            yield x
+    elif matches:
+        for y in matches:
+            yield merge([x, y])
+    elif how == "left":
+        yield x
+
+
+def hash_join(
+    stream: Iterable[Item],
+    other: Iterable[Item],
+    x_key: str,
+    y_key: str,
+    lower: bool = False,
+    how: str = "inner",
+) -> Stream:
+    """
+    Join two streams by building a hash index on one side and probing it with
+    the other, so the cost is linear in the combined length. The index is built
+    on `other` unless both lengths are known and `stream` is the smaller one.
+    Either way, output follows `stream` order (and each item's matches follow
+    `other` order).
+
+    Examples:
+        >>> stream = [{'x': 'a', 'n': 1}, {'x': 'B', 'n': 2}, {'x': 'c', 'n': 3}]
+        >>> other = [{'y': 'b', 'm': 1}, {'y': 'a', 'm': 2}, {'y': 'a', 'm': 3}]
+        >>> [(i['n'], i['m']) for i in hash_join(stream, other, 'x', 'y')]
+        [(1, 2), (1, 3)]
+        >>> joined = hash_join(stream, other, 'x', 'y', lower=True)
+        >>> [(i['n'], i['m']) for i in joined]
+        [(1, 2), (1, 3), (2, 1)]
+        >>> joined = hash_join(stream[:1], other, 'x', 'y', how='left')
+        >>> [(i['n'], i['m']) for i in joined]
+        [(1, 2), (1, 3)]
+        >>> [i['n'] for i in hash_join(stream, other, 'x', 'y', how='anti')]
+        [2, 3]
+        >>> joined = hash_join(stream, other * 2, 'x', 'y', lower=True, how='left')
+        >>> [(i['n'], i.get('m')) for i in joined]
+        [(1, 2), (1, 3), (1, 2), (1, 3), (2, 1), (2, 1), (3, None)]
+
+    """
+    stream_len, other_len = length_hint(stream), length_hint(other)
+
+    if 0 < stream_len < other_len:
+        # Build on the smaller `stream` side and collect each item's matches
+        # while probing with `other`, then emit them in `stream` order.
+        # (Matches are keyed by identity, so an item repeated in `stream` is
+        # indexed once but emitted each time.)
+        buffered = list(stream)
+        index = HashIndex(x_key, lower)
+        index.extend({id(x): x for x in buffered}.values())
+        found: defaultdict[int, list[Item]] = defaultdict(list)
+
+        for y in other:
+            if not is_mapping(y):
+                logger.warning(f"Unsupported type for join: {type(y)}")
+                continue
+
+            for x in index.get(get_join_value(y, y_key, lower)):
+                found[id(x)].append(y)
+
+        for x in buffered:
+            yield from _emit(x, found.get(id(x), []), how)
+    else:
+        index = HashIndex(y_key, lower)
+        index.extend(other)
+
+        for x in stream:
+            if is_mapping(x):
+                matches = index.get(get_join_value(x, x_key, lower))
+            else:
+                logger.warning(f"Unsupported type for join: {type(x)}")
+                matches = []
+
+            yield from _emit(x, matches, how)
+
+
+def nested_join(
+    stream: Iterable[Item],
+    other: Iterable[Item],
+    x_key: str,
+    y_key: str,
+    lower: bool = False,
+    how: str = "inner",
+) -> Stream:
+    """
+    Join two streams by comparing every pair of items (quadratic). Kept as a
+    reference implementation for the hash join.
+
+    Examples:
+        >>> stream = [{'x': 'a', 'n': 1}, {'x': 'B', 'n': 2}]
+        >>> other = [{'y': 'b', 'm': 1}, {'y': 'a', 'm': 2}]
+        >>> joined = nested_join(stream, other, 'x', 'y', lower=True)
+        >>> [(i['n'], i['m']) for i in joined]
+        [(1, 2), (2, 1)]
+
+    """
+
+    def compare(x: Item, y: Item) -> bool:
+        if isinstance(x, Mapping) and isinstance(y, Mapping):
+            x_value, y_value = x.get(x_key, _MISSING), y.get(y_key, _MISSING)
+
+            if x_value is _MISSING or y_value is _MISSING:
+                equal = False
+            elif lower and isinstance(x_value, str) and isinstance(y_value, str):
+                equal = x_value.lower() == y_value.lower()
+            else:
+                equal = x_value == y_value
+        else:
+            logger.warning(f"Unsupported types for compare: {type(x)} and {type(y)}")
+            equal = False
+
+        return equal
+
+    if how == "inner":
+        joined = (merge([x, y]) for x, y in product(stream, other) if compare(x, y))
+    else:
+        others = list(other)
+
+        def _joined() -> Stream:
+            for x in stream:
+                yield from _emit(x, [y for y in others if compare(x, y)], how)
+
+        joined = _joined()
+
+    return joined
+
+
+def _canonical(value: object) -> Hashable:
+    """
+    A hashable stand-in for a join value that is the same for any two equal
+    values, e.g., dicts that differ only in insertion order.
+
+    Examples:
+        >>> _canonical({'a': 1, 'b': [2]}) == _canonical({'b': [2], 'a': 1})
+        True
+        >>> _canonical((1, [2]))
+        (1, (2,))
+
+    """
+    if is_hashable(value):
+        canonical = value
+    elif isinstance(value, Mapping):
+        canonical = frozenset((_canonical(k), _canonical(v)) for k, v in value.items())
+    elif isinstance(value, (set, frozenset)):
+        canonical = frozenset(map(_canonical, value))
+    elif isinstance(value, Iterable):
+        canonical = tuple(map(_canonical, value))
+    else:
+        canonical = repr(value)
+
+    return cast(Hashable, canonical)
+
+
+def _sort_key(value: object) -> tuple[int, int]:
+    """
+    The merge join sort key: the hash of a join value (so any mix of value
+    types can be ordered), with missing values sorted last. Equal values share
+    a key even when they can't be hashed.
+
+    Examples:
+        >>> _sort_key(2), _sort_key(_MISSING)
+        ((0, 2), (1, 0))
+        >>> _sort_key({'a': 1, 'b': 2}) == _sort_key({'b': 2, 'a': 1})
+        True
+
+    """
+    return (1, 0) if value is _MISSING else (0, hash(_canonical(value)))
+
+
+def _sort_side(
+    items: Iterable[Item], key: str, lower: bool, budget: int, missing: bool = False
+) -> Iterator[tuple[tuple[int, int], Item]]:
+    def gen_pairs() -> Iterator[tuple[tuple[int, int], Item]]:
+        for item in items:
+            if not is_mapping(item):
+                logger.warning(f"Unsupported type for join: {type(item)}")
+                continue
+
+            value = get_join_value(item, key, lower)
+
+            if missing or value is not _MISSING:
+                yield _sort_key(value), item
+
+    return external_sort(gen_pairs(), key=itemgetter(0), budget=budget)
+
+
+def merge_join(
+    stream: Iterable[Item],
+    other: Iterable[Item],
+    x_key: str,
+    y_key: str,
+    lower: bool = False,
+    how: str = "inner",
+    budget: int = DEF_BUDGET,
+) -> Stream:
+    """
+    Join two streams by sorting both sides on their join values, then merging
+    them in a single pass. A side longer than `budget` items is sorted in runs
+    spilled to temp files, and only one group of equally keyed `other` items is
+    held in memory at a time. Output follows the sort order (by the hash of the
+    join value) rather than `stream` order.
+
+    Examples:
+        >>> stream = [{'x': x % 4, 'n': x} for x in range(6)]
+        >>> other = [{'y': y, 'm': y} for y in (3, 1, 1, 5)]
+        >>> joined = merge_join(stream, other, 'x', 'y', budget=2)
+        >>> sorted((i['n'], i['m']) for i in joined)
+        [(1, 1), (1, 1), (3, 3), (5, 1), (5, 1)]
+        >>> joined = merge_join(stream, other, 'x', 'y', how='anti', budget=2)
+        >>> sorted(i['n'] for i in joined)
+        [0, 2, 4]
+
+    """
+    xs = _sort_side(stream, x_key, lower, budget, missing=how != "inner")
+    ygroups = groupby(_sort_side(other, y_key, lower, budget), itemgetter(0))
+    ykey, ygroup = next(ygroups, (None, iter(())))
+
+    for xkey, xgroup in groupby(xs, itemgetter(0)):
+        while ykey is not None and ykey < xkey:
+            ykey, ygroup = next(ygroups, (None, iter(())))
+
+        candidates = [y for _, y in ygroup] if ykey == xkey else []
+
+        for _, x in xgroup:
+            value = get_join_value(x, x_key, lower)
+            matches = [
+                y for y in candidates if get_join_value(y, y_key, lower) == value
+            ]
+            yield from _emit(x, matches, how)
+
+
+def auto_join(
+    stream: Iterable[Item],
+    other: Iterable[Item],
+    x_key: str,
+    y_key: str,
+    lower: bool = False,
+    how: str = "inner",
+    budget: int = DEF_BUDGET,
+) -> Stream:
+    """
+    Plan the join by the size of the side a hash join would index: hash join
+    while it fits in `budget` items, and merge join (spilling to disk)
+    otherwise. Sizes come from `length_hint` when known. Otherwise up to
+    `budget` items of `other` are read ahead to observe its size.
+
+    Examples:
+        >>> stream = [{'x': x, 'n': x} for x in (2, 0, 1)]
+        >>> other = ({'y': y, 'm': y} for y in range(3))
+        >>> [i['n'] for i in auto_join(stream, other, 'x', 'y')]
+        [2, 0, 1]
+        >>> other = ({'y': y, 'm': y} for y in range(3))
+        >>> [i['n'] for i in auto_join(stream, other, 'x', 'y', budget=2)]
+        [0, 1, 2]
+
+    """
+    stream_len, other_len = length_hint(stream), length_hint(other)
+    build_len = stream_len if 0 < stream_len < other_len else other_len
+    spill = partial(merge_join, x_key=x_key, y_key=y_key, lower=lower, how=how)
+    index = partial(hash_join, x_key=x_key, y_key=y_key, lower=lower, how=how)
+
+    if build_len > budget:
+        yield from spill(stream, other, budget=budget)
+    elif build_len:
+        yield from index(stream, other)
+    else:
+        others = iter(other)
+        head = list(islice(others, budget + 1))
+
+        if len(head) > budget:
+            yield from spill(stream, chain(head, others), budget=budget)
+        else:
+            yield from index(stream, head)
+
+
+JOINERS = {
+    "auto": auto_join,
+    "hash": hash_join,
+    "merge": merge_join,
+    "nested": nested_join,
+}
+SPILLABLE = {"auto", "merge"}
 
 
 def parser(
@@ -89,35 +491,32 @@ def parser(
         {'x': 'foo-0', 'sum': 0, 'y': 'foo-0', 'count': 5}
         >>> len(list(joined))
         4
+        >>> objconf = Objectify({'join_key': 'x', 'how': 'outer'})
+        >>> next(parser(stream, objconf, tuples, other=other))
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported join type: 'outer'.
 
     """
     other = cast(Stream, kwargs["other"])
 
-    def compare(x: Item, y: Item, x_key: str, y_key: str) -> bool:
-        if isinstance(x, Mapping) and isinstance(y, Mapping):
-            x_value, y_value = x.get(x_key, _MISSING), y.get(y_key, _MISSING)
-
-            if x_value is _MISSING or y_value is _MISSING:
-                equal = False
-            elif (
-                objconf.lower and isinstance(x_value, str) and isinstance(y_value, str)
-            ):
-                equal = x_value.lower() == y_value.lower()
-            else:
-                equal = x_value == y_value
-        else:
-            logger.warning(f"Unsupported types for compare: {type(x)} and {type(y)}")
-            equal = False
+    if objconf.join_key or objconf.other_join_key:
+        how = objconf.how or "inner"
+        strategy = objconf.strategy or "auto"
 
-        return equal
+        if how not in JOIN_TYPES:
+            raise ValueError(f"Unsupported join type: {how!r}.")
+        elif strategy not in JOINERS:
+            raise ValueError(f"Unsupported join strategy: {strategy!r}.")
 
-    if objconf.join_key or objconf.other_join_key:
         x_key = objconf.join_key or objconf.other_join_key
         y_key = objconf.other_join_key or x_key
-        prod = product(stream, other)
-        joined = (
-            merge([x, y]) for x, y in prod if compare(x, y, x_key=x_key, y_key=y_key)
-        )
+        joiner = JOINERS[strategy]
+
+        if strategy in SPILLABLE:
+            joiner = partial(joiner, budget=int(objconf.budget or DEF_BUDGET))
+
+        joined = joiner(stream, other, x_key, y_key, lower=objconf.lower, how=how)
     else:
         joined = join(stream, filter(is_mapping, other))
 
@@ -142,6 +541,18 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
                 (default: value of `join_key`).
             lower (str): Transform values to lower case before comparing
                 (for joining purposes, default: False)
+            how (str): The join type. Must be one of 'inner' (only matched
+                items), 'left' (every item, merged with its matches if any),
+                or 'anti' (only unmatched items) (default: 'inner').
+            strategy (str): The keyed join algorithm. Must be one of 'hash'
+                (index one side and probe it with the other), 'merge' (sort
+                both sides, spilling to disk past `budget`, then merge them),
+                'nested' (compare every pair), or 'auto' (hash while the
+                indexed side fits in `budget`, merge otherwise)
+                (default: 'auto').
+            budget (int): The maximum number of items a join may hold in
+                memory before the 'auto' and 'merge' strategies spill to disk
+                (default: 100000).
 
 
         other (Iter[dict]): stream to join
@@ -183,6 +594,18 @@ def pipe(*args: Any, **kwargs: object) -> Stream:
                 (default: value of `join_key`).
             lower (str): Transform values to lower case before comparing
                 (for joining purposes, default: False)
+            how (str): The join type. Must be one of 'inner' (only matched
+                items), 'left' (every item, merged with its matches if any),
+                or 'anti' (only unmatched items) (default: 'inner').
+            strategy (str): The keyed join algorithm. Must be one of 'hash'
+                (index one side and probe it with the other), 'merge' (sort
+                both sides, spilling to disk past `budget`, then merge them),
+                'nested' (compare every pair), or 'auto' (hash while the
+                indexed side fits in `budget`, merge otherwise)
+                (default: 'auto').
+            budget (int): The maximum number of items a join may hold in
+                memory before the 'auto' and 'merge' strategies spill to disk
+                (default: 100000).
 
         other (Iter[dict]): stream to join
 
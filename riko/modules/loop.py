@@ -22,6 +22,11 @@ form):
 * ``emit=False, assign="foo"`` -- store each result at ``item["foo"]`` (one
   preserved-parent copy per result).
 
+The async loop also takes ``concurrency`` -- how many source items to run the
+submodule for at once (default 1, i.e., one at a time) -- and ``order`` -- whether
+to yield the results in source order (``"parent"``, the default) or as each
+source item's results complete (``"arrival"``).
+
 Rule of thumb: if the submodule yields exactly **one** value per item (``rename``,
 ``strconcat``, ``urlbuilder``, ``regex``), ``emit=True`` replaces the item and
 ``count`` is irrelevant. If it yields **many** (``tokenizer``, ``fetchdata``) and
@@ -119,6 +124,34 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
     preserved, source advanced only as the consumer pulls, ``count="first"``
     stopping after the first result) and applying the same per-parent
     ``count``/``emit``/``assign`` fold. See ``pipe`` for kwargs.
+
+    Kwargs:
+        concurrency (int): The number of parents to run the embed for at once.
+            The source still advances only as the embeds finish (default: 1).
+
+        order (str): Yield each parent's results in parent order (``"parent"``)
+            or as soon as they complete (``"arrival"``) (default: "parent").
+
+    Examples:
+        >>> from riko.bado import issync, run
+        >>> from riko.modules.tokenizer import async_pipe as tokenizer
+        >>>
+        >>> items = [{"title": "a b"}, {"title": "c d"}]
+        >>> conf = {"delimiter": {"type": "text", "value": " "}}
+        >>> kwargs = {"conf": conf, "field": "title", "count": "first"}
+        >>>
+        >>> async def main():
+        ...     stream = await async_pipe(
+        ...         items, embed=tokenizer, concurrency=2, **kwargs
+        ...     )
+        ...     print([item async for item in stream])
+        >>>
+        >>> if issync:
+        ...     print([{'content': 'a'}, {'content': 'c'}])
+        ... else:
+        ...     run(main)
+        [{'content': 'a'}, {'content': 'c'}]
+
     """
     return parser(*args, **kwargs)
 
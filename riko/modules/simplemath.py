@@ -20,7 +20,7 @@ Attributes:
 """
 
 import operator
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from decimal import Decimal
 from logging import Logger
 from typing import Any
@@ -83,8 +83,36 @@ def parser(
     return operation(num, other)
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-def async_pipe(*args: Any, **kwargs: object) -> NumLike:
+def batch_parser(
+    nums: Sequence[Decimal],
+    extraction: Extraction,
+    objconf: SimpleMathObjconf,
+    **kwargs: object,
+) -> list[NumLike]:
+    """
+    Parsers a batch of pipe content
+
+    Args:
+        nums (List[Decimal]): The first numbers to operate on
+        objconf (obj): The pipe configuration (an Objectify instance)
+
+    Returns:
+        List[Decimal]: The results
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>> objconf = Objectify({'op': 'divide', 'other': 4})
+        >>> batch_parser([10, 2], None, objconf)
+        [Decimal('2.5'), Decimal('0.5')]
+
+    """
+    operation = OPS[objconf.op]
+    other = cast_value(objconf.other, _type=CastType.DECIMAL)
+    return [operation(num, other) for num in nums]
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+def async_pipe(*args: Any, **kwargs: object) -> list[NumLike]:
     """
     A processor module that asynchronously performs basic arithmetic, such
     as addition and subtraction.
@@ -121,11 +149,11 @@ def async_pipe(*args: Any, **kwargs: object) -> NumLike:
         2
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> NumLike:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[NumLike]:
     """
     A processor module that performs basic arithmetic, such as addition and
     subtraction.
@@ -160,4 +188,4 @@ def pipe(*args: Any, **kwargs: object) -> NumLike:
         Decimal('2')
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
@@ -16,6 +16,7 @@ Attributes:
 
 """
 
+from collections.abc import Sequence
 from logging import Logger
 from typing import Any
 
@@ -65,8 +66,30 @@ def parser(word: str, separator: str, objconf: SlugifyObjconf, **kwargs: object)
     return slugify(word.strip(), separator=separator)
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-def async_pipe(*args: Any, **kwargs: object) -> str:
+def batch_parser(
+    words: Sequence[str], separator: str, objconf: SlugifyObjconf, **kwargs: object
+) -> list[str]:
+    """
+    Parsers a batch of pipe content
+
+    Args:
+        words (List[str]): The strings to transform
+        separator (str): The slug separator.
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[str]: The slugs
+
+    Examples:
+        >>> batch_parser(['hello world', ' bye you '], '-', None)
+        ['hello-world', 'bye-you']
+
+    """
+    return [slugify(word.strip(), separator=separator) for word in words]
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+def async_pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor module that asynchronously slugifies the field of an item.
 
@@ -92,11 +115,11 @@ def async_pipe(*args: Any, **kwargs: object) -> str:
         hello-world
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> str:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor that slugifies the field of an item.
 
@@ -124,4 +147,4 @@ def pipe(*args: Any, **kwargs: object) -> str:
         'hello_world'
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
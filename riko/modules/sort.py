@@ -11,35 +11,166 @@ Examples:
         >>> next(pipe(items))
         {'content': 'a'}
 
+    top-k (e.g., when followed by `truncate` or `tail`)::
+
+        >>> items = [{'content': x % 4} for x in range(10)]
+        >>> [i['content'] for i in pipe(items, limit=3)]
+        [0, 0, 0]
+        >>> [i['content'] for i in pipe(items, limit=3, from_end=True)]
+        [2, 3, 3]
+
+    bounded memory::
+
+        >>> conf = {'rule': {'field': 'content'}, 'budget': '4'}
+        >>> [i['content'] for i in pipe(items, conf=conf)][:5]
+        [0, 0, 0, 1, 1]
+
 Attributes:
     OPTS (dict): The default pipe options
     DEFAULTS (dict): The default parser options
 
 """
 
-from collections.abc import Sequence
-from functools import reduce
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Decimal
+from heapq import nlargest, nsmallest
+from itertools import chain
 from logging import Logger
-from typing import Any
+from operator import itemgetter
+from typing import Any, cast
 
 import pygogo as gogo
 
 from riko._iterutils import def_itemgetter
-from riko.bado.itertools import async_reduce
-from riko.types.general import Defaults, Opts, PipeTuples, Stream
+from riko._spill import external_sort
+from riko.types.general import Defaults, Item, Opts, PipeTuples, Stream
 from riko.types.modules import SortConfRule
 
 from . import operator
 
 OPTS: Opts = {"listize": True, "extract": "rule"}
-DEFAULTS: Defaults = {"rule": SortConfRule(dir="asc", field="content")}
+DEFAULTS: Defaults = {
+    "rule": SortConfRule(dir="asc", field="content"),
+    "budget": None,
+}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
-def reducer(stream: Stream, rule: SortConfRule) -> Stream:
-    reverse = rule.dir.lower() == "desc" if rule.dir else False
-    keyfunc = def_itemgetter(rule.field, _type=rule.type)
-    return iter(sorted(stream, key=keyfunc, reverse=reverse))
+class Descending:
+    """
+    Inverts the ordering of a (non numeric) value so that it sorts descending
+    within an otherwise ascending composite key.
+
+    Examples:
+        >>> sorted(['a', 'c', 'b'], key=Descending)
+        ['c', 'b', 'a']
+
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Descending) and self.value == other.value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
+
+    def __gt__(self, other: "Descending") -> bool:
+        return self.value < other.value
+
+    __hash__ = None
+
+
+def descending(value: Any) -> Any:
+    """Numbers are negated (cheaper to compare), other values wrapped."""
+    numeric = isinstance(value, (int, float, Decimal))
+    return -value if numeric else Descending(value)
+
+
+def _reverse_keyfunc(keyfunc: Callable[[Item], Any]) -> Callable[[Item], Any]:
+    return lambda item: descending(keyfunc(item))
+
+
+def get_sort_key(rules: Sequence[SortConfRule]) -> Callable[[Item], tuple]:
+    """
+    Build a composite key that casts each rule's field once per item and
+    orders the fields by their (possibly mixed) directions, so a single stable
+    sort is equivalent to one sort per rule.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> rules = [Objectify({'field': 'a'}), Objectify({'field': 'b', 'dir': 'desc'})]
+        >>> items = [{'a': 1, 'b': 'x'}, {'a': 0, 'b': 'y'}, {'a': 1, 'b': 'z'}]
+        >>> [(i['a'], i['b']) for i in sorted(items, key=get_sort_key(rules))]
+        [(0, 'y'), (1, 'z'), (1, 'x')]
+
+    """
+    keyfuncs = []
+
+    for rule in rules:
+        keyfunc = def_itemgetter(rule.field, _type=rule.type)
+        desc = rule.dir.lower() == "desc" if rule.dir else False
+        keyfuncs.append(_reverse_keyfunc(keyfunc) if desc else keyfunc)
+
+    def sort_key(item: Item) -> tuple:
+        return tuple([keyfunc(item) for keyfunc in keyfuncs])
+
+    return sort_key
+
+
+def sort_items(
+    stream: Iterable[Item],
+    rules: Sequence[SortConfRule],
+    limit: int | None = None,
+    from_end: bool = False,
+    budget: int | None = None,
+) -> Stream:
+    """
+    Sort `stream` by `rules` in a single pass. When only the first (or, with
+    `from_end`, the last) `limit` items are needed, a bounded heap selects them
+    instead of sorting everything. Otherwise, with a `budget`, at most that
+    many items are held in memory: longer streams are sorted in runs spilled
+    to temp files and lazily merged. Either way the output matches the
+    corresponding slice of the full (stable) in-memory sort.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> rules = [Objectify({'field': 'k'})]
+        >>> items = [{'k': x % 2, 'n': x} for x in range(6)]
+        >>> [i['n'] for i in sort_items(items, rules)]
+        [0, 2, 4, 1, 3, 5]
+        >>> [i['n'] for i in sort_items(items, rules, limit=2)]
+        [0, 2]
+        >>> [i['n'] for i in sort_items(items, rules, limit=2, from_end=True)]
+        [3, 5]
+        >>> [i['n'] for i in sort_items(items, rules, budget=4)]
+        [0, 2, 4, 1, 3, 5]
+
+    """
+    sort_key = get_sort_key(rules)
+
+    if limit is None and budget:
+        # Spill each item with its key so the merge doesn't recompute it
+        decorated = ((sort_key(item), item) for item in stream)
+        merged = external_sort(decorated, key=itemgetter(0), budget=budget)
+        ordered = (item for _, item in merged)
+    elif limit is None:
+        ordered = sorted(stream, key=sort_key)
+    elif from_end:
+        # The last `limit` items of a stable sort are the largest by (key,
+        # position), i.e., later items win ties
+        decorated = ((sort_key(i), pos, i) for pos, i in enumerate(stream))
+        largest = nlargest(max(limit, 0), decorated, key=itemgetter(0, 1))
+        ordered = [item for _, _, item in reversed(largest)]
+    else:
+        ordered = nsmallest(max(limit, 0), stream, key=sort_key)
+
+    return iter(ordered)
 
 
 async def async_parser(
@@ -87,7 +218,7 @@ async def async_parser(
         {'content': 4}
 
     """
-    return await async_reduce(reducer, list(reversed(rules)), stream)
+    return parser(stream, rules, tuples, **kwargs)
 
 
 def parser(
@@ -127,7 +258,19 @@ def parser(
         {'content': 4}
 
     """
-    return reduce(reducer, list(reversed(rules)), stream)
+    limit = cast(int | None, kwargs.get("limit"))
+    from_end = bool(kwargs.get("from_end"))
+
+    # `budget` is a pipe level setting, so read it off the first item's conf
+    if (first := next(tuples, None)) is None:
+        sorted_items = iter(())
+    else:
+        item, objconf = first
+        budget = int(objconf.budget) if objconf.budget else None
+        items = chain([item], (item for item, _ in tuples))
+        sorted_items = sort_items(items, rules, limit, from_end, budget)
+
+    return sorted_items
 
 
 @operator(DEFAULTS, isasync=True, **OPTS)
@@ -141,7 +284,8 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the key 'rule'
+        conf (dict): The pipe configuration. May contain the keys 'rule' or
+            'budget'.
 
             rule (dict): The sort configuration, can be either a dict or list
                 of dicts (default: {'dir': 'asc', 'field': 'content'}).
@@ -157,6 +301,19 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
                 dir (str): The sort direction. Must be either 'asc' or
                     'desc' (default: 'asc').
 
+            budget (int): Maximum number of items to hold in memory. Longer
+                streams are sorted in runs spilled to temp files and then
+                lazily merged (default: None, i.e., sort in memory).
+
+        limit (int): Only the first `limit` items of the sorted stream are
+            needed, so select them with a bounded heap instead of sorting
+            everything (default: None, i.e., sort everything). A pipe
+            sets this automatically when `sort` is followed by `truncate` or
+            `tail`.
+
+        from_end (bool): Select the last (rather than the first) `limit`
+            items (default: False).
+
     Returns:
         Awaitable: stream
 
@@ -179,14 +336,16 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
 def pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that eagerly sorts a stream according to a specified
-    key. Note that this pipe is not lazy.
+    key. Note that this pipe is not lazy (though with a `budget`, it only
+    holds that many items in memory).
 
     Args:
         items (Iter[dict]): The source.
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the key 'rule'
+        conf (dict): The pipe configuration. May contain the keys 'rule' or
+            'budget'.
 
             rule (dict): The sort configuration, can be either a dict or list
                 of dicts (default: {'dir': 'asc', 'field': 'content'}).
@@ -200,6 +359,19 @@ def pipe(*args: Any, **kwargs: object) -> Stream:
                 dir (str): The sort direction. Must be either 'asc' or
                     'desc'.
 
+            budget (int): Maximum number of items to hold in memory. Longer
+                streams are sorted in runs spilled to temp files and then
+                lazily merged (default: None, i.e., sort in memory).
+
+        limit (int): Only the first `limit` items of the sorted stream are
+            needed, so select them with a bounded heap instead of sorting
+            everything (default: None, i.e., sort everything). A pipe
+            sets this automatically when `sort` is followed by `truncate` or
+            `tail`.
+
+        from_end (bool): Select the last (rather than the first) `limit`
+            items (default: False).
+
     Yields:
         dict: an item
 
@@ -6,6 +6,13 @@ Use split when you want to perform different operations on data from the same
 stream. The Union module is the reverse of Split, it merges multiple input
 streams into a single combined stream.
 
+By default each copy is a deep copy of the (fully read) stream. With `lazy`,
+the copies instead pull from the source through a shared buffer (holding only
+the items some copies have yet to reach) and yield copy-on-write views of the
+same items, so an N-way split costs about as much memory as the stream itself.
+Note: the buffer is unbounded, so a copy that lags far behind the others (or is
+never read) makes the buffer hold every item the others have read past.
+
 Examples:
     basic usage::
 
@@ -14,6 +21,9 @@ Examples:
         >>> stream1, stream2 = pipe({'x': x} for x in range(5))
         >>> next(stream1)
         {'x': 0}
+        >>> stream1, stream2 = pipe(({'x': x} for x in range(5)), lazy=True)
+        >>> next(stream2)
+        {'x': 0}
 
 Attributes:
     OPTS (dict): The default pipe options
@@ -23,12 +33,14 @@ Attributes:
 
 from collections.abc import Iterator
 from copy import deepcopy
+from itertools import tee
 from logging import Logger
 from typing import Any
 
 import pygogo as gogo
 
 from riko.cast import BasicCastType
+from riko.dotdict import SharedDotDict
 from riko.types.general import Defaults, Opts, PipeTuples, Stream
 
 from . import splitter
@@ -57,6 +69,11 @@ def parser(
 
         kwargs (dict): Keyword arguments.
 
+    Kwargs:
+        lazy (bool): Lazily share the source items between the copies rather
+            than eagerly deep copying the stream (default: False). Note: a
+            copy lagging behind the others buffers every item they have read.
+
     Yields:
         Iter(dict): a stream of items
 
@@ -70,19 +87,33 @@ def parser(
         >>> stream1, stream2, stream3 = parser(stream, conf['splits'], tuples, **kwargs)
         >>> next(stream1)
         {'x': 0}
+        >>> stream = (({'x': x}) for x in range(5))
+        >>> tuples = zip(stream, repeat(conf))
+        >>> streams = parser(stream, conf['splits'], tuples, lazy=True)
+        >>> stream1, stream2, stream3 = streams
+        >>> item = next(stream1)
+        >>> item['x'] = 10
+        >>> item, next(stream2)
+        ({'x': 10}, {'x': 0})
 
     """
-    source = list(stream)
+    if kwargs.get("lazy"):
+        # `tee` frees each item once every copy has moved past it, but its
+        # buffer is unbounded, so the slowest copy sets the memory cost
+        for branch in tee(stream, splits):
+            yield map(SharedDotDict, branch)
+    else:
+        source = list(stream)
 
-    for _ in range(splits):
-        yield map(deepcopy, source)
+        for _ in range(splits):
+            yield map(deepcopy, source)
 
 
 @splitter(DEFAULTS, isasync=True, **OPTS)
 def async_pipe(*args: Any, **kwargs: object) -> Iterator[Stream]:
     """
-    An operator that asynchronously and eagerly splits a stream into identical
-    copies. Note that this pipe is not lazy.
+    An operator that asynchronously splits a stream into identical copies.
+    Note that this pipe is not lazy unless `lazy` is set.
 
     Args:
         items (Iter[dict]): The source stream.
@@ -93,6 +124,10 @@ def async_pipe(*args: Any, **kwargs: object) -> Iterator[Stream]:
 
             splits (int): the number of copies to create (default: 2).
 
+        lazy (bool): Lazily share the source items between the copies rather
+            than eagerly deep copying the stream (default: False). Note: a
+            copy lagging behind the others buffers every item they have read.
+
     Returns:
         Awaitable: iterable of streams
 
@@ -113,8 +148,8 @@ def async_pipe(*args: Any, **kwargs: object) -> Iterator[Stream]:
 @splitter(DEFAULTS, **OPTS)
 def pipe(*args: Any, **kwargs: object) -> Iterator[Stream]:
     """
-    An operator that eagerly splits a stream into identical copies.
-    Note that this pipe is not lazy.
+    An operator that splits a stream into identical copies. Note that this
+    pipe is not lazy unless `lazy` is set.
 
     Args:
         items (Iter[dict]): The source stream.
@@ -125,6 +160,10 @@ def pipe(*args: Any, **kwargs: object) -> Iterator[Stream]:
 
             splits (int): the number of copies to create (default: 2).
 
+        lazy (bool): Lazily share the source items between the copies rather
+            than eagerly deep copying the stream (default: False). Note: a
+            copy lagging behind the others buffers every item they have read.
+
     Yields:
         Iter(dict): a stream of items
 
@@ -24,12 +24,13 @@ Attributes:
 """
 
 from collections.abc import Callable, Sequence
-from functools import reduce
+from functools import partial, reduce
 from logging import Logger
 from typing import Any
 
 import pygogo as gogo
 
+from riko._cache import shared_cache
 from riko.bado.itertools import coop_reduce
 from riko.cast import BasicCastType
 from riko.types.configs import StrReplaceObjconf
@@ -58,6 +59,28 @@ def reducer(word: str, rule: StrReplaceConfRule) -> str:
     return OPS.get(rule.param, OPS["every"])(word, rule)
 
 
+@shared_cache
+def get_replacer(*specs: tuple[str | None, str, str]) -> Callable[[str], str]:
+    """
+    Compiles `(param, find, replace)` rule specs into a single function that
+    applies them all to a word. Memoized, so that a batch pipe builds its ops
+    once rather than once per batch.
+
+    Examples:
+        >>> replace = get_replacer(('first', 'l', 'L'), (None, 'o', '0'))
+        >>> replace('hello world')
+        'heLl0 w0rld'
+        >>> get_replacer(('first', 'l', 'L'), (None, 'o', '0')) is replace
+        True
+
+    """
+    ops = [
+        partial(OPS.get(param, OPS["every"]), rule=StrReplaceConfRule(find, repl))
+        for param, find, repl in specs
+    ]
+    return partial(reduce, lambda word, op: op(word), ops)
+
+
 async def async_parser(
     word: str,
     rules: Sequence[StrReplaceConfRule],
@@ -131,8 +154,58 @@ def parser(
     return reduce(reducer, rules, word)
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-async def async_pipe(*args: Any, **kwargs: object) -> str:
+def batch_parser(
+    words: Sequence[str],
+    rules: Sequence[StrReplaceConfRule],
+    objconf: StrReplaceObjconf,
+    **kwargs: object,
+) -> list[str]:
+    """
+    Parses a batch of pipe content
+
+    Args:
+        words (List[str]): The strings to transform
+        rules (List[obj]): the parsed rules (Objectify instances).
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[str]: The transformed strings
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> rule = Objectify({'find': 'hello', 'replace': 'bye'})
+        >>> batch_parser(['hello world', 'hello you'], [rule], None)
+        ['bye world', 'bye you']
+
+    """
+    replace = get_replacer(*((rule.param, rule.find, rule.replace) for rule in rules))
+    return list(map(replace, words))
+
+
+async def async_batch_parser(
+    words: Sequence[str],
+    rules: Sequence[StrReplaceConfRule],
+    objconf: StrReplaceObjconf,
+    **kwargs: object,
+) -> list[str]:
+    """
+    Asynchronously parses a batch of pipe content
+
+    Args:
+        words (List[str]): The strings to transform
+        rules (List[obj]): the parsed rules (Objectify instances).
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[str]: The transformed strings
+
+    """
+    return [await coop_reduce(reducer, rules, word) for word in words]
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+async def async_pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor module that asynchronously replaces the text of a field of
     an item.
@@ -170,11 +243,11 @@ async def async_pipe(*args: Any, **kwargs: object) -> str:
         bye world
 
     """
-    return await async_parser(*args, **kwargs)
+    return await async_batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> str:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor that replaces the text of a field of an item.
 
@@ -214,4 +287,4 @@ def pipe(*args: Any, **kwargs: object) -> str:
         'Meatings'
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
@@ -145,8 +145,57 @@ def parser(
     return reduce(reducer, rules, word)
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-async def async_pipe(*args: Any, **kwargs: object) -> str:
+def batch_parser(
+    words: Sequence[str],
+    rules: Sequence[StrTransformConfRule],
+    objconf: StrTransformObjconf,
+    **kwargs: object,
+) -> list[str]:
+    """
+    Parses a batch of pipe content
+
+    Args:
+        words (List[str]): The strings to transform
+        rules (List[obj]): the parsed rules (Objectify instances).
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[str]: The transformed strings
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> rule = Objectify({'transform': 'title'})
+        >>> batch_parser(['hello world', 'bye you'], [rule], None)
+        ['Hello World', 'Bye You']
+
+    """
+    return [reduce(reducer, rules, word) for word in words]
+
+
+async def async_batch_parser(
+    words: Sequence[str],
+    rules: Sequence[StrTransformConfRule],
+    objconf: StrTransformObjconf,
+    **kwargs: object,
+) -> list[str]:
+    """
+    Asynchronously parses a batch of pipe content
+
+    Args:
+        words (List[str]): The strings to transform
+        rules (List[obj]): the parsed rules (Objectify instances).
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[str]: The transformed strings
+
+    """
+    return [await coop_reduce(reducer, rules, word) for word in words]
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+async def async_pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor module that asynchronously performs string transformations
     on the field of an item.
@@ -187,11 +236,11 @@ async def async_pipe(*args: Any, **kwargs: object) -> str:
         Hello World
 
     """
-    return await async_parser(*args, **kwargs)
+    return await async_batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> str:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[str]:
     """
     A processor that performs string transformations on the field of an item.
 
@@ -232,4 +281,4 @@ def pipe(*args: Any, **kwargs: object) -> str:
         2
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
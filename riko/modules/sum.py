@@ -24,14 +24,14 @@ from typing import Any
 
 import pygogo as gogo
 
-from riko._iterutils import group_by
+from riko._aggregate import Accumulator, aggregate_by, get_budget, merge_groups
 from riko.types.configs import SumObjconf
 from riko.types.general import Defaults, Opts, PipeTuples, Stream
 
 from . import operator
 
 OPTS: Opts = Opts()
-DEFAULTS: Defaults = {"sum_key": "content", "group_key": None}
+DEFAULTS: Defaults = {"sum_key": "content", "group_key": None, "budget": None}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
@@ -83,13 +83,72 @@ def parser(
         {'two': Decimal('2')}
 
     """
-    _sum = lambda group: sum(Decimal(g[objconf.sum_key]) for g in group) or Decimal(0)
+    valuefunc = lambda item: Decimal(item[objconf.sum_key])
+    group_key, budget = objconf.group_key, get_budget(objconf.budget)
 
+    if group_key:
+        grouped = aggregate_by(stream, group_key, valuefunc, budget=budget)
+        summed = ({key: acc.total} for key, acc in grouped)
+    else:
+        summed = sum(map(valuefunc, stream)) or Decimal(0)
+
+    return summed
+
+
+def partition(
+    stream: Stream, objconf: SumObjconf, tuples: PipeTuples, **kwargs: object
+) -> Decimal | list[tuple[str, Accumulator]]:
+    """
+    Sums one chunk of the stream (the map side of a parallel sum)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> objconf = Objectify({'sum_key': 'content'})
+        >>> partition(({'content': x} for x in range(5)), objconf, iter(()))
+        Decimal('10')
+        >>> stream = [{'amount': 2, 'x': 'one'}, {'amount': 1, 'x': 'one'}]
+        >>> objconf = Objectify({'sum_key': 'amount', 'group_key': 'x'})
+        >>> [(key, acc.total) for key, acc in partition(stream, objconf, iter(()))]
+        [('one', Decimal('3'))]
+
+    """
+    valuefunc = lambda item: Decimal(item[objconf.sum_key])
+
+    if objconf.group_key:
+        summed = list(aggregate_by(stream, objconf.group_key, valuefunc))
+    else:
+        summed = sum(map(valuefunc, stream)) or Decimal(0)
+
+    return summed
+
+
+def combine(
+    partials: Iterator[Any], objconf: SumObjconf, **kwargs: object
+) -> Decimal | Iterator[dict[str, Decimal]]:
+    """
+    Merges the sums of consecutive chunks (the reduce side of a parallel sum)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> combine(iter([Decimal(2), Decimal(3)]), Objectify({}))
+        Decimal('5')
+        >>> stream = [
+        ...     {'amount': 2, 'x': 'one'},
+        ...     {'amount': 1, 'x': 'two'},
+        ...     {'amount': 2, 'x': 'one'}]
+        >>> objconf = Objectify({'sum_key': 'amount', 'group_key': 'x'})
+        >>> partials = (partition([item], objconf, iter(())) for item in stream)
+        >>> list(combine(partials, objconf))
+        [{'one': Decimal('4')}, {'two': Decimal('1')}]
+
+    """
     if objconf.group_key:
-        grouped = group_by(stream, objconf.group_key)
-        summed = ({key: _sum(group)} for key, group in grouped)
+        grouped = merge_groups(partials, budget=get_budget(objconf.budget))
+        summed = ({key: acc.total} for key, acc in grouped)
     else:
-        summed = _sum(stream)
+        summed = sum(partials) or Decimal(0)
 
     return summed
 
@@ -105,8 +164,8 @@ def async_pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Dec
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the keys 'sum_key' or
-            'group_key'.
+        conf (dict): The pipe configuration. May contain the keys 'sum_key',
+            'group_key', or 'budget'.
 
             sum_key (str): Item attribute to sum. (default: 'content').
 
@@ -114,6 +173,10 @@ def async_pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Dec
                 in the stream by the given key and report a sum for each
                 group (default: None).
 
+            budget (int): Maximum number of group sums to hold in memory
+                before spilling them to disk (default: None, i.e., never
+                spill).
+
         assign (str): Attribute to assign parsed content. If `sum_key` is set,
             this is ignored and the group keys are used instead. (default:
             content)
@@ -136,7 +199,7 @@ def async_pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Dec
     return parser(*args, **kwargs)
 
 
-@operator(DEFAULTS, **OPTS)
+@operator(DEFAULTS, partition=partition, combine=combine, **OPTS)
 def pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Decimal]]:
     """
     An operator that eagerly sums fields of items in a stream.
@@ -147,8 +210,8 @@ def pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Decimal]]
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the keys 'sum_key' or
-            'group_key'.
+        conf (dict): The pipe configuration. May contain the keys 'sum_key',
+            'group_key', or 'budget'.
 
             sum_key (str): Item attribute to sum. (default: 'content').
 
@@ -156,6 +219,10 @@ def pipe(*args: Any, **kwargs: object) -> Decimal | Iterator[dict[str, Decimal]]
                 in the stream by the given key and report a sum for each
                 group (default: None).
 
+            budget (int): Maximum number of group sums to hold in memory
+                before spilling them to disk (default: None, i.e., never
+                spill).
+
         assign (str): Attribute to assign parsed content. If `sum_key` is set,
             this is ignored and the group keys are used instead. (default:
             content)
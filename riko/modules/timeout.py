@@ -28,6 +28,7 @@ Attributes:
 """
 
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterable,
     AsyncIterator,
     Generator,
@@ -44,7 +45,15 @@ import pygogo as gogo
 from riko.bado.itertools import async_iter
 from riko.cast import BasicCastType
 from riko.types.configs import TimeoutObjconf
-from riko.types.general import Defaults, Opts, PipeTuples, Stream
+from riko.types.general import (
+    AsyncPipeTuples,
+    AsyncStream,
+    Defaults,
+    Item,
+    Opts,
+    PipeTuples,
+    Stream,
+)
 
 from . import operator
 
@@ -125,6 +134,68 @@ class TimeoutIterator[T](Iterator[T]):
         return item
 
 
+def get_timeout_ms(objconf: TimeoutObjconf) -> int:
+    """
+    The timeout in milliseconds
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> get_timeout_ms(Objectify({'seconds': 1, 'milliseconds': 250}))
+        1250
+
+    """
+    # objconf only parses on __getitem__
+    td_kwargs = cast(dict[str, int], {k: objconf[k] for k in objconf if k})
+    return timedelta(**td_kwargs) // timedelta(milliseconds=1)
+
+
+async def async_feed(
+    stream: AsyncStream,
+    objconf: TimeoutObjconf,
+    tuples: AsyncPipeTuples,
+    **kwargs: object,
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it arrives
+
+    Args:
+        stream (AsyncIter[dict]): The source.
+        objconf (obj): the item independent configuration (an Objectify
+            instance).
+
+        tuples (AsyncIter[(dict, obj)]): Async iterable of tuples of (item,
+            objconf). Note: this shares the `stream` iterator.
+
+        kwargs (dict): Keyword arguments.
+
+    Yields:
+        dict: The output
+
+    Examples:
+        >>> from itertools import count
+        >>> from riko import async_sleep, run
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> objconf = Objectify({'milliseconds': 250})
+        >>>
+        >>> async def gen_stream():
+        ...     for x in count():
+        ...         await async_sleep(0.1)
+        ...         yield {'x': x}
+        >>>
+        >>> async def main():
+        ...     items = async_feed(gen_stream(), objconf, None)
+        ...     print(len([item async for item in items]))
+        >>>
+        >>> run(main)
+        2
+
+    """
+    async for item in AsyncTimeoutIterator(stream, get_timeout_ms(objconf)):
+        yield item
+
+
 async def async_parser(
     stream: Stream, objconf: TimeoutObjconf, tuples: PipeTuples, **kwargs: object
 ) -> Stream:
@@ -169,9 +240,7 @@ async def async_parser(
         2
 
     """
-    td_kwargs = cast(dict[str, int], {k: objconf[k] for k in objconf if k})
-    time_ms = timedelta(**td_kwargs) // timedelta(milliseconds=1)
-    return await AsyncTimeoutIterator(stream, time_ms)
+    return await AsyncTimeoutIterator(stream, get_timeout_ms(objconf))
 
 
 def parser(
@@ -213,13 +282,10 @@ def parser(
         2
 
     """
-    # objconf only parses on __getitem__
-    td_kwargs = cast(dict[str, int], {k: objconf[k] for k in objconf if k})
-    time_ms = timedelta(**td_kwargs) // timedelta(milliseconds=1)
-    return TimeoutIterator(stream, time_ms)
+    return TimeoutIterator(stream, get_timeout_ms(objconf))
 
 
-@operator(DEFAULTS, isasync=True, **OPTS)
+@operator(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 async def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that asynchronously returns items from a stream until a
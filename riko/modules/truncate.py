@@ -20,6 +20,7 @@ Attributes:
 
 """
 
+from collections.abc import AsyncGenerator
 from itertools import islice
 from logging import Logger
 from typing import Any
@@ -28,7 +29,15 @@ import pygogo as gogo
 
 from riko.cast import BasicCastType
 from riko.types.configs import TruncateObjconf
-from riko.types.general import Defaults, Opts, PipeTuples, Stream
+from riko.types.general import (
+    AsyncPipeTuples,
+    AsyncStream,
+    Defaults,
+    Item,
+    Opts,
+    PipeTuples,
+    Stream,
+)
 
 from . import operator
 
@@ -38,6 +47,60 @@ DEFAULTS: Defaults = {"start": 0, "count": 0}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
+async def async_feed(
+    stream: AsyncStream,
+    objconf: TruncateObjconf,
+    tuples: AsyncPipeTuples,
+    **kwargs: object,
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it arrives, reading no further
+    than the last item kept
+
+    Args:
+        stream (AsyncIter[dict]): The source.
+        objconf (obj): the item independent configuration (an Objectify
+            instance).
+
+        tuples (AsyncIter[(dict, obj)]): Async iterable of tuples of (item,
+            objconf). Note: this shares the `stream` iterator.
+
+        kwargs (dict): Keyword arguments.
+
+    Yields:
+        dict: The output
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>> from riko import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> objconf = Objectify({'count': 2, 'start': 1})
+        >>> stream = async_iter({'x': x} for x in range(5))
+        >>>
+        >>> async def main():
+        ...     print([item async for item in async_feed(stream, objconf, None)])
+        >>>
+        >>> run(main)
+        [{'x': 1}, {'x': 2}]
+
+    """
+    start = int(objconf.start)
+    stop = start + int(objconf.count)
+
+    if stop > start:
+        index = 0
+
+        async for item in stream:
+            if index >= start:
+                yield item
+
+            index += 1
+
+            if index >= stop:
+                break
+
+
 def parser(
     stream: Stream, objconf: TruncateObjconf, tuples: PipeTuples, **kwargs: object
 ) -> Stream:
@@ -78,7 +141,7 @@ def parser(
     return islice(stream, start, stop)
 
 
-@operator(DEFAULTS, isasync=True, **OPTS)
+@operator(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that asynchronously returns a specified number of items
@@ -17,6 +17,7 @@ Attributes:
 
 """
 
+from collections.abc import Sequence
 from logging import Logger
 from typing import Any
 
@@ -66,8 +67,42 @@ def parser(
     return cast_value(content, CastType(objconf.type)) if objconf.type else content
 
 
-@processor(DEFAULTS, isasync=True, **OPTS)
-def async_pipe(*args: Any, **kwargs: object) -> PrimitiveValue:
+def batch_parser(
+    contents: Sequence[str],
+    extraction: Extraction,
+    objconf: TypecastObjconf,
+    **kwargs: object,
+) -> list[PrimitiveValue]:
+    """
+    Parsers a batch of pipe content
+
+    Args:
+        contents (List[scalar]): The content to cast
+        objconf (obj): The pipe configuration (an Objectify instance)
+        kwargs (dict): Keyword arguments
+
+    Returns:
+        List[scalar]: The cast values
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> objconf = Objectify({'type': 'int'})
+        >>> batch_parser(['1.0', '2'], None, objconf)
+        [1, 2]
+
+    """
+    if objconf.type:
+        _type = CastType(objconf.type)
+        casted = [cast_value(content, _type) for content in contents]
+    else:
+        casted = list(contents)
+
+    return casted
+
+
+@processor(DEFAULTS, isasync=True, batch=True, **OPTS)
+def async_pipe(*args: Any, **kwargs: object) -> list[PrimitiveValue]:
     """
     A processor that asynchronously converts a text string into a variety of
     different types, e.g., int, bool, date, etc. Useful as terminal data. Loopable.
@@ -98,11 +133,11 @@ def async_pipe(*args: Any, **kwargs: object) -> PrimitiveValue:
         1
 
     """
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
 
 
-@processor(DEFAULTS, **OPTS)
-def pipe(*args: Any, **kwargs: object) -> PrimitiveValue:
+@processor(DEFAULTS, batch=True, **OPTS)
+def pipe(*args: Any, **kwargs: object) -> list[PrimitiveValue]:
     """
     A processor that converts a text string into a variety of different types, e.g.,
     int, bool, date, etc. Useful as terminal data. Loopable.
@@ -144,4 +179,4 @@ def pipe(*args: Any, **kwargs: object) -> PrimitiveValue:
 
     """
     # TODO: add option to specify timezone
-    return parser(*args, **kwargs)
+    return batch_parser(*args, **kwargs)
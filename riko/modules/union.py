@@ -19,16 +19,25 @@ Attributes:
 
 """
 
-from collections.abc import Iterable
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable
 from itertools import chain
 from logging import Logger
 from typing import Any, cast
 
 import pygogo as gogo
 
+from riko.bado.itertools import async_iter
 from riko.dotdict import DotDict
 from riko.types.configs import DynamicConf
-from riko.types.general import Defaults, Opts, PipeTuples, Stream
+from riko.types.general import (
+    AsyncPipeTuples,
+    AsyncStream,
+    Defaults,
+    Item,
+    Opts,
+    PipeTuples,
+    Stream,
+)
 
 from . import operator
 
@@ -80,7 +89,63 @@ def parser(
     return chain(stream, chain.from_iterable(others))
 
 
-@operator(DEFAULTS, isasync=True, **OPTS)
+async def async_feed(
+    stream: AsyncStream,
+    objconf: DynamicConf,
+    tuples: AsyncPipeTuples,
+    **kwargs: object,
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it arrives
+
+    Args:
+        stream (AsyncIter[dict]): The source.
+        objconf (obj): the item independent configuration (an Objectify
+            instance).
+
+        tuples (AsyncIter[(dict, obj)]): Async iterable of tuples of (item,
+            objconf). Note: this shares the `stream` iterator.
+
+        kwargs (dict): Keyword arguments.
+
+    Kwargs:
+        others (List[Iter(dict)|AsyncIter(dict)]): List of streams to join
+
+    Yields:
+        dict: The output
+
+    Examples:
+        >>> from riko import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> stream = async_iter({'x': x} for x in range(2))
+        >>> others = [async_iter([{'x': 2}]), [{'x': 3}]]
+        >>>
+        >>> async def main():
+        ...     merged = async_feed(stream, None, None, others=others)
+        ...     print([item['x'] async for item in merged])
+        >>>
+        >>> run(main)
+        [0, 1, 2, 3]
+
+    """
+    _others = DotDict(kwargs).get("others", [])
+    others = cast(Iterable[AsyncIterable[Item] | Iterable[Item]], _others)
+
+    async for item in stream:
+        yield item
+
+    for other in others:
+        if isinstance(other, AsyncIterable):
+            source = aiter(other)
+        else:
+            source = async_iter(other)
+
+        async for item in source:
+            yield item
+
+
+@operator(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that asynchronously merges multiple source streams together.
@@ -15,28 +15,310 @@ Examples:
         >>> list(pipe(items, conf={'uniq_key': 'mod'}))
         [{'x': 0, 'mod': 0}, {'x': 1, 'mod': 1}]
 
+    dedupe modes::
+
+        >>> items = [{'x': x % 3} for x in range(6)]
+        >>> conf = {'uniq_key': 'x', 'mode': 'exact'}
+        >>> [item['x'] for item in pipe(items, conf=conf)]
+        [0, 1, 2]
+        >>> conf = {'uniq_key': 'x', 'mode': 'bloom', 'limit': 10**6}
+        >>> [item['x'] for item in pipe(items, conf=conf)]
+        [0, 1, 2]
+        >>> items = [{'x': -1}, {'x': -2}, {'x': [1]}, {'x': '[1]'}, {'x': [1]}]
+        >>> [item['x'] for item in pipe(items, conf=conf)]
+        [-1, -2, [1], '[1]']
+
 Attributes:
     OPTS (dict): The default pipe options
     DEFAULTS (dict): The default parser options
 
 """
 
-from collections import deque
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Hashable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from fractions import Fraction
+from hashlib import blake2b
 from logging import Logger
-from typing import Any
+from math import ceil, log
+from numbers import Number
+from typing import Any, cast
 
 import pygogo as gogo
 
 from riko.types.configs import UniqObjconf
-from riko.types.general import Defaults, Opts, PipeTuples, Stream
+from riko.types.general import (
+    AsyncPipeTuples,
+    AsyncStream,
+    Defaults,
+    Item,
+    Opts,
+    PipeTuples,
+    Stream,
+)
 
 from . import operator
 
 OPTS: Opts = Opts()
-DEFAULTS: Defaults = {"uniq_key": "content", "limit": 1024}
+DEFAULTS: Defaults = {
+    "uniq_key": "content",
+    "limit": 1024,
+    "mode": "lru",
+    "error_rate": 0.001,
+}
 logger: Logger = gogo.Gogo(__name__, monolog=True).logger
 
 
+@dataclass(frozen=True, slots=True)
+class Unhashable:
+    """
+    A hashable stand-in for an unhashable value (e.g., a list) that equals the
+    stand-in of any equal value of the same type, and nothing else.
+    """
+
+    kind: str
+    value: Hashable
+
+
+def freeze(value: object) -> Hashable:
+    """
+    The hashable form of a value: the value itself if it is hashable, or else
+    an ``Unhashable`` of its type and (recursively frozen) contents. Mapping
+    and set contents are sorted, so equal ones freeze (and repr) alike.
+
+    Examples:
+        >>> freeze(1), freeze('[1]')
+        (1, '[1]')
+        >>> freeze([1]) == freeze('[1]')
+        False
+        >>> freeze({'a': 1, 'b': [2]}) == freeze({'b': [2], 'a': 1})
+        True
+
+    """
+    try:
+        hash(value)
+    except TypeError:
+        if isinstance(value, Mapping):
+            pairs = ((freeze(k), freeze(v)) for k, v in value.items())
+            contents = tuple(sorted(pairs, key=repr))
+        elif isinstance(value, (set, frozenset)):
+            contents = tuple(sorted(map(freeze, value), key=repr))
+        elif isinstance(value, Iterable):
+            contents = tuple(map(freeze, value))
+        else:
+            contents = repr(value)
+
+        frozen = Unhashable(type(value).__qualname__, contents)
+    else:
+        frozen = value
+
+    return cast(Hashable, frozen)
+
+
+def canonical(value: Hashable) -> Hashable:
+    """
+    A type-tagged form of a (frozen) value whose repr is the same for any two
+    equal values, e.g., ``1``, ``1.0`` and ``True``, just as their hashes are.
+    Numbers are tagged alike and keyed on their exact ratio.
+
+    Examples:
+        >>> len({repr(canonical(x)) for x in [1, 1.0, True]})
+        1
+        >>> canonical((1, 'a')) == canonical((1.0, 'a'))
+        True
+        >>> repr(canonical(1)) == repr(canonical('1'))
+        False
+
+    """
+    if isinstance(value, Number) and not isinstance(value, complex):
+        try:
+            key: Hashable = ("number", Fraction(cast(Any, value)))
+        except (ValueError, OverflowError, TypeError):
+            key = ("number", repr(value))
+    elif isinstance(value, tuple):
+        key = ("tuple", tuple(map(canonical, value)))
+    elif isinstance(value, frozenset):
+        key = ("frozenset", tuple(sorted(map(canonical, value), key=repr)))
+    elif isinstance(value, Unhashable):
+        key = (value.kind, canonical(value.value))
+    else:
+        key = (type(value).__qualname__, value)
+
+    return key
+
+
+def get_uniq_value(item: dict, key: str) -> Hashable:
+    """
+    The value an item is deduped on. Unhashable values (e.g., lists) are
+    frozen, so they still dedupe on equality.
+
+    Examples:
+        >>> get_uniq_value({'x': 1}, 'x')
+        1
+        >>> get_uniq_value({'x': [1]}, 'x')
+        Unhashable(kind='list', value=(1,))
+        >>> get_uniq_value({}, 'x') is None
+        True
+
+    """
+    return freeze(item.get(key))
+
+
+class LRUSet:
+    """
+    The `limit` most recently seen values, with O(1) lookups and eviction. A
+    `limit` of None never evicts.
+
+    Examples:
+        >>> seen = LRUSet(2)
+        >>> [seen.add(x) for x in [1, 2, 1, 3, 1, 2]]
+        [True, True, False, True, False, True]
+
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.limit = limit
+        self.values: OrderedDict[Hashable, None] = OrderedDict()
+
+    def add(self, value: Hashable) -> bool:
+        """Record `value` and return whether it was new."""
+        new = value not in self.values
+
+        if new:
+            self.values[value] = None
+
+            if self.limit is not None and len(self.values) > self.limit:
+                self.values.popitem(last=False)
+        else:
+            self.values.move_to_end(value)
+
+        return new
+
+
+class ExactSet:
+    """
+    Every value ever seen.
+
+    Examples:
+        >>> seen = ExactSet()
+        >>> [seen.add(x) for x in [1, 2, 1]]
+        [True, True, False]
+
+    """
+
+    def __init__(self) -> None:
+        self.values: set[Hashable] = set()
+
+    def add(self, value: Hashable) -> bool:
+        """Record `value` and return whether it was new."""
+        new = value not in self.values
+
+        if new:
+            self.values.add(value)
+
+        return new
+
+
+class BloomFilter:
+    """
+    A fixed size probabilistic set sized for `capacity` values at the given
+    false positive rate. It never reports a new value as seen twice, but may
+    (at about `error_rate`) report an unseen value as already seen.
+
+    Examples:
+        >>> bloom = BloomFilter(1000, 0.01)
+        >>> bloom.size, bloom.hashes
+        (9586, 7)
+        >>> [bloom.add(x) for x in ['a', 'b', 'a', -1, -2, -1.0]]
+        [True, True, False, True, True, False]
+        >>> 'a' in bloom, 'c' in bloom
+        (True, False)
+
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Unsupported error rate: {error_rate!r}.")
+
+        capacity = max(capacity, 1)
+        self.size = ceil(-capacity * log(error_rate) / log(2) ** 2)
+        self.hashes = max(round(self.size / capacity * log(2)), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: Hashable) -> list[int]:
+        # Double hashing (Kirsch-Mitzenmacher) over a 128 bit digest of the
+        # canonical repr. Not the builtin hash, whose collisions (e.g., -1
+        # and -2) would always collide here too
+        key = repr(canonical(value)).encode()
+        digest = blake2b(key, digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8]), int.from_bytes(digest[8:]) | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, value: Hashable) -> bool:
+        positions = self._positions(value)
+        return all(self.bits[pos >> 3] & 1 << (pos & 7) for pos in positions)
+
+    def add(self, value: Hashable) -> bool:
+        """Record `value` and return whether it was (probably) new."""
+        new = False
+
+        for position in self._positions(value):
+            byte, mask = position >> 3, 1 << (position & 7)
+
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+
+        return new
+
+
+def get_seen(
+    mode: str, limit: int | None = None, error_rate: float = 0.001
+) -> LRUSet | ExactSet | BloomFilter:
+    """
+    The set that tracks already seen values for the given dedupe mode.
+
+    Examples:
+        >>> get_seen('lru', 8).limit
+        8
+        >>> get_seen('fuzzy')
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported uniq mode: 'fuzzy'.
+
+    """
+    if mode == "lru":
+        seen = LRUSet(limit)
+    elif mode == "exact":
+        seen = ExactSet()
+    elif mode == "bloom":
+        seen = BloomFilter(limit or DEFAULTS["limit"], error_rate)
+    else:
+        raise ValueError(f"Unsupported uniq mode: {mode!r}.")
+
+    return seen
+
+
+def new_seen(objconf: UniqObjconf) -> LRUSet | ExactSet | BloomFilter:
+    """
+    The seen set for a pipe configuration.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> new_seen(Objectify({'mode': 'bloom', 'limit': 8})).hashes
+        10
+        >>> new_seen(Objectify({'mode': 'bloom', 'error_rate': 0}))
+        Traceback (most recent call last):
+            ...
+        ValueError: Unsupported error rate: 0.0.
+
+    """
+    error_rate = objconf.error_rate
+    error_rate = DEFAULTS["error_rate"] if error_rate is None else float(error_rate)
+    return get_seen(objconf.mode or "lru", objconf.limit, error_rate)
+
+
 def parser(
     stream: Stream, objconf: UniqObjconf, tuples: PipeTuples, **kwargs: object
 ) -> Stream:
@@ -73,18 +355,112 @@ def parser(
         [{'x': 0, 'mod': 0}, {'x': 1, 'mod': 1}]
 
     """
-    key, limit = objconf.uniq_key, objconf.limit
-    seen = deque(maxlen=limit)
+    # the whole stream is a single chunk, whose repeats are left to `combine`
+    paired = ((get_uniq_value(item, objconf.uniq_key), item) for item in stream)
+    return combine(iter([paired]), objconf)
+
+
+def partition(
+    stream: Stream, objconf: UniqObjconf, tuples: PipeTuples, **kwargs: object
+) -> list[tuple[Hashable, Item]]:
+    """
+    Pairs the items of one chunk of the stream with the values they are
+    deduped on, dropping repeats within the chunk (the map side of a parallel
+    uniq). A bounded 'lru' mode depends on every repeat, so it keeps them all.
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> stream = [{'x': x % 2} for x in range(4)]
+        >>> objconf = Objectify({'uniq_key': 'x', 'mode': 'exact'})
+        >>> partition(stream, objconf, iter(()))
+        [(0, {'x': 0}), (1, {'x': 1})]
+        >>> objconf = Objectify({'uniq_key': 'x', 'mode': 'lru', 'limit': 1})
+        >>> len(partition(stream, objconf, iter(())))
+        4
+
+    """
+    key, mode = objconf.uniq_key, objconf.mode or "lru"
+    pairs = ((get_uniq_value(item, key), item) for item in stream)
 
-    for item in stream:
-        value = item.get(key)
+    if mode == "lru" and objconf.limit is not None:
+        paired = list(pairs)
+    else:
+        seen = ExactSet()
+        paired = [(value, item) for value, item in pairs if seen.add(value)]
 
-        if value not in seen:
-            seen.append(value)
+    return paired
+
+
+def combine(
+    partials: Iterator[Iterable[tuple[Hashable, Item]]],
+    objconf: UniqObjconf,
+    **kwargs: object,
+) -> Stream:
+    """
+    Filters the paired items of consecutive chunks (the reduce side of a
+    parallel uniq)
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>>
+        >>> objconf = Objectify({'uniq_key': 'x', 'limit': 256})
+        >>> partials = iter([[(0, {'x': 0})], [(0, {'x': 0}), (1, {'x': 1})]])
+        >>> list(combine(partials, objconf))
+        [{'x': 0}, {'x': 1}]
+
+    """
+    seen = new_seen(objconf)
+
+    for paired in partials:
+        for value, item in paired:
+            if seen.add(value):
+                yield item
+
+
+async def async_feed(
+    stream: AsyncStream,
+    objconf: UniqObjconf,
+    tuples: AsyncPipeTuples,
+    **kwargs: object,
+) -> AsyncGenerator[Item, None]:
+    """
+    Asynchronously parses the pipe content as it arrives
+
+    Args:
+        stream (AsyncIter[dict]): The source.
+        objconf (obj): The pipe configuration (an Objectify instance)
+        tuples (AsyncIter[(dict, obj)]): Async iterable of tuples of (item,
+            rules). Note: this shares the `stream` iterator.
+
+        kwargs (dict): Keyword arguments.
+
+    Yields:
+        dict: The output
+
+    Examples:
+        >>> from meza.fntools import Objectify
+        >>> from riko import run
+        >>> from riko.bado.itertools import async_iter
+        >>>
+        >>> objconf = Objectify({'uniq_key': 'mod', 'limit': 256})
+        >>> stream = async_iter({'x': x, 'mod': x % 2} for x in range(5))
+        >>>
+        >>> async def main():
+        ...     print([item async for item in async_feed(stream, objconf, None)])
+        >>>
+        >>> run(main)
+        [{'x': 0, 'mod': 0}, {'x': 1, 'mod': 1}]
+
+    """
+    seen = new_seen(objconf)
+
+    async for item in stream:
+        if seen.add(get_uniq_value(item, objconf.uniq_key)):
             yield item
 
 
-@operator(DEFAULTS, isasync=True, **OPTS)
+@operator(DEFAULTS, isasync=True, feed=async_feed, **OPTS)
 def async_pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that asynchronously filters out non unique items according
@@ -95,14 +471,24 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the keys 'uniq_key' or
-            'limit'.
+        conf (dict): The pipe configuration. May contain the keys 'uniq_key',
+            'limit', 'mode', or 'error_rate'.
 
             uniq_key (str): Item attribute which should be unique (default:
                 'content').
 
-            limit (int): Maximum number of unique items to track (default:
-                1024)
+            limit (int): Maximum number of unique items to track. In
+                'bloom' mode, the number of unique items the filter is sized
+                for (default: 1024)
+
+            mode (str): How seen items are tracked. Must be one of 'lru'
+                (remember the `limit` most recently seen values), 'exact'
+                (remember every value, ignoring `limit`), or 'bloom' (a fixed
+                size Bloom filter that may drop a unique item at about
+                `error_rate`) (default: 'lru').
+
+            error_rate (float): The 'bloom' mode false positive rate
+                (default: 0.001)
 
     Returns:
         Awaitable: stream
@@ -122,7 +508,7 @@ def async_pipe(*args: Any, **kwargs: object) -> Stream:
     return parser(*args, **kwargs)
 
 
-@operator(DEFAULTS, **OPTS)
+@operator(DEFAULTS, partition=partition, combine=combine, **OPTS)
 def pipe(*args: Any, **kwargs: object) -> Stream:
     """
     An operator that filters out non unique items according to a specified
@@ -133,14 +519,24 @@ def pipe(*args: Any, **kwargs: object) -> Stream:
         kwargs (dict): The keyword arguments passed to the wrapper
 
     Kwargs:
-        conf (dict): The pipe configuration. May contain the keys 'uniq_key' or
-            'limit'.
+        conf (dict): The pipe configuration. May contain the keys 'uniq_key',
+            'limit', 'mode', or 'error_rate'.
 
             uniq_key (str): Item attribute which should be unique (default:
                 'content').
 
-            limit (int): Maximum number of unique items to track (default:
-                1024)
+            limit (int): Maximum number of unique items to track. In
+                'bloom' mode, the number of unique items the filter is sized
+                for (default: 1024)
+
+            mode (str): How seen items are tracked. Must be one of 'lru'
+                (remember the `limit` most recently seen values), 'exact'
+                (remember every value, ignoring `limit`), or 'bloom' (a fixed
+                size Bloom filter that may drop a unique item at about
+                `error_rate`) (default: 'lru').
+
+            error_rate (float): The 'bloom' mode false positive rate
+                (default: 0.001)
 
     Yields:
         dict: an item
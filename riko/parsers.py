@@ -504,6 +504,27 @@ def element2dict(element: AnyElement) -> StringyDict:
     return result
 
 
+def get_json_prefix(path: str | None = None) -> str:
+    """
+    The ijson prefix of the items in the list at a dot separated `path`.
+
+    Examples:
+        >>> get_json_prefix('value.items')
+        'value.items.item'
+        >>> get_json_prefix('value.items.item')
+        'value.items.item'
+        >>> get_json_prefix()
+        ''
+
+    """
+    if path and not path.endswith(".item"):
+        prefix = f"{path}.item"
+    else:
+        prefix = path or ""
+
+    return prefix
+
+
 def any2dict(
     content: FileTypes | RikoDict | list[RikoDict],
     ext: str | None = "xml",
@@ -548,12 +569,7 @@ def any2dict(
             use_ijson = isinstance(content, RawIOBase)
 
         if use_ijson:
-            if path and not path.endswith(".item"):
-                prefix = f"{path}.item"
-            else:
-                prefix = path
-
-            items = ijson.items(content, prefix, use_float=True)
+            items = ijson.items(content, get_json_prefix(path), use_float=True)
             yield from cast(Stream, items)
         elif isinstance(content, str):
             try:
@@ -49,6 +49,7 @@ class DynamicConf(Objectify[Any]):
 
 class SortObjconf(DynamicConf):
     rule: SortConfRule | list[SortConfRule]
+    budget: int | None
 
 
 class InputObjconf(DynamicConf):
@@ -97,10 +98,15 @@ class LoopObjconf(DynamicConf):
 
 class AggregateObjconf(DynamicConf):
     func: Function
+    group_key: str | None
+    value_key: str
+    aggregates: list[str]
+    budget: int | None
 
 
 class CountObjconf(DynamicConf):
     count_key: str | None
+    budget: int | None
 
 
 class CsvObjconf(DynamicConf):
@@ -180,6 +186,9 @@ class JoinObjconf(DynamicConf):
     join_key: str | None
     other_join_key: str
     lower: bool
+    how: Literal["inner", "left", "anti"]
+    strategy: Literal["auto", "hash", "merge", "nested"]
+    budget: int
 
 
 class ReceiveObjconf(DynamicConf):
@@ -252,6 +261,7 @@ class SubstrObjconf(DynamicConf):
 class SumObjconf(DynamicConf):
     sum_key: str
     group_key: str | None
+    budget: int | None
 
 
 class TimeoutObjconf(DynamicConf):
@@ -287,6 +297,8 @@ class UdfObjconf(DynamicConf):
 class UniqObjconf(DynamicConf):
     uniq_key: str
     limit: int
+    mode: Literal["lru", "exact", "bloom"]
+    error_rate: float
 
 
 class UrlBuilderObjconf(DynamicConf):
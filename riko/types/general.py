@@ -88,8 +88,12 @@ type OperatorWrapperInput = ProcessorWrapperOutput | OperatorWrapperOutput
 type SplitterWrapperInput = ProcessorWrapperOutput | OperatorWrapperOutput
 type WrapperInput = ProcessorWrapperInput | OperatorWrapperInput | SplitterWrapperInput
 
+# The per-item step of a planned processor invocation (see ``wrapper.stage``)
+type Stage = Callable[..., tuple[DotDict[RikoValue], ProcessorWrapperOutput]]
+
 type PipeTuple = tuple[Item, DynamicConf]
 type PipeTuples = Iterator[PipeTuple]
+type AsyncPipeTuples = AsyncIterator[PipeTuple]
 type Extraction = T
 type ConversionFunc = Callable[..., Items | StringIO]
 type Caster = Callable[[str | int], PrimitiveValue | AnyLocation]
@@ -299,6 +303,9 @@ type AsyncOperatorParser = Callable[
     [Stream, Extraction, PipeTuples],
     OperatorParserOutput | Awaitable[OperatorParserOutput],
 ]
+type FeedOperatorParser = Callable[
+    [AsyncStream, Extraction, AsyncPipeTuples], AsyncIterator[ItemOrValue]
+]
 type AsyncSplitterParser = Callable[
     [Stream, Extraction, PipeTuples],
     SplitterParserOutput | Awaitable[SplitterParserOutput],
@@ -103,6 +103,7 @@ ModuleId = (
 )
 
 CountValues = Literal["first", "all"]
+LoopOrder = Literal["parent", "arrival"]
 
 
 class ConfArg(TypedDict):
@@ -188,6 +189,7 @@ class SortRawRule(TypedDict, total=False):
 
 class SortRawConf(TypedDict):
     rule: SortRawRule | list[SortRawRule]
+    budget: NotRequired[Value]
 
 
 class TailRawConf(TypedDict):
@@ -228,6 +230,7 @@ class LoopRawConf(TypedDict, total=False):
 
 class CountRawConf(TypedDict, total=False):
     count_key: Value
+    budget: Value
 
 
 class CsvRawConf(TypedDict):
@@ -322,6 +325,9 @@ class JoinRawConf(TypedDict, total=False):
     join_key: Value
     other_join_key: Value
     lower: Value
+    how: Value
+    strategy: Value
+    budget: Value
 
 
 class ReceiveRawConf(TypedDict):
@@ -433,6 +439,7 @@ class SubstrRawConf(TypedDict, total=False):
 class SumRawConf(TypedDict, total=False):
     sum_key: Value
     group_key: Value
+    budget: Value
 
 
 class TimeoutRawConf(TypedDict, total=False):
@@ -464,6 +471,8 @@ class TypecastRawConf(TypedDict, total=False):
 class UniqRawConf(TypedDict, total=False):
     uniq_key: Value
     limit: Value
+    mode: Value
+    error_rate: Value
 
 
 class UrlBuilderRawConf(TypedDict, total=False):
@@ -634,6 +643,7 @@ class StrTransformConfRule:
 # Confs
 class SortConf(TypedDict):
     rule: SortConfRule | list[SortConfRule]
+    budget: NotRequired[int | None]
 
 
 class InputConf(TypedDict, total=False):
@@ -682,10 +692,15 @@ class LoopConf(TypedDict, total=False):
 
 class AggregateConf(TypedDict):
     func: "Function"
+    group_key: NotRequired[str | None]
+    value_key: NotRequired[str]
+    aggregates: NotRequired[list[str]]
+    budget: NotRequired[int | None]
 
 
 class CountConf(TypedDict, total=False):
     count_key: str | None
+    budget: int | None
 
 
 class CsvConf(TypedDict):
@@ -765,6 +780,9 @@ class JoinConf(TypedDict, total=False):
     join_key: str | None
     other_join_key: str
     lower: bool
+    how: Literal["inner", "left", "anti"]
+    strategy: Literal["auto", "hash", "merge", "nested"]
+    budget: int
 
 
 class ReceiveConf(TypedDict, total=False):
@@ -837,6 +855,7 @@ class SubstrConf(TypedDict):
 class SumConf(TypedDict):
     sum_key: str = "content"
     group_key: str | None = None
+    budget: int | None = None
 
 
 class TimeoutConf(TypedDict, total=False):
@@ -872,6 +891,8 @@ class UdfConf(TypedDict):
 class UniqConf(TypedDict, total=False):
     uniq_key: str = "content"
     limit: int = 1024
+    mode: Literal["lru", "exact", "bloom"] = "lru"
+    error_rate: float = 0.001
 
 
 class UrlBuilderConf(TypedDict, total=False):
@@ -0,0 +1,57 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Tests the streaming hash aggregation in riko._aggregate and the count, sum,
+and aggregate modules built on it: spilling high-cardinality key tables to
+disk must not change the results or their (first seen) order.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from riko.modules.aggregate import pipe as aggregate_pipe
+from riko.modules.count import pipe as count_pipe
+from riko.modules.sum import pipe as sum_pipe
+
+
+def _items(size: int = 500) -> list[dict]:
+    return [{"k": f"key-{(x * 37) % 101}", "v": x % 13} for x in range(size)]
+
+
+@pytest.mark.parametrize("budget", [None, 1, 7, "7"])
+def test_count_spills_without_changing_results(budget):
+    expected = {}
+
+    for item in _items():
+        expected[item["k"]] = expected.get(item["k"], 0) + 1
+
+    conf = {"count_key": "k", "budget": budget}
+    counted = [next(iter(c.items())) for c in count_pipe(_items(), conf=conf)]
+    assert counted == list(expected.items())
+
+
+@pytest.mark.parametrize("budget", [None, 1, 7, "7"])
+def test_sum_spills_without_changing_results(budget):
+    expected = {}
+
+    for item in _items():
+        expected[item["k"]] = expected.get(item["k"], 0) + Decimal(item["v"])
+
+    conf = {"sum_key": "v", "group_key": "k", "budget": budget}
+    summed = [next(iter(s.items())) for s in sum_pipe(_items(), conf=conf)]
+    assert summed == list(expected.items())
+
+
+@pytest.mark.parametrize("budget", [5, "5"])
+def test_aggregate_results(budget):
+    conf = {
+        "group_key": "k",
+        "value_key": "v",
+        "aggregates": ["count", "min", "max", "distinct"],
+        "budget": budget,
+    }
+    aggregated = list(aggregate_pipe(_items(), conf=conf))
+    assert len(aggregated) == 101
+    assert all(a["min"] >= 0 and a["max"] <= 12 for a in aggregated)
+    assert sum(a["count"] for a in aggregated) == 500
+    assert all(a["distinct"] <= a["count"] for a in aggregated)
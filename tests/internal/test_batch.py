@@ -0,0 +1,82 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Batch processors (``@processor(batch=True)``): a stream is handed to the pipe
+in chunks of field values, which must yield exactly what per-item calls yield,
+including skipped items and confs that depend on the item.
+"""
+
+from importlib import import_module
+
+import pytest
+
+from riko import run
+from riko.ext import processor
+from riko.modules.slugify import pipe as slugify
+
+CASES = [
+    ("strreplace", {"rule": {"find": "hello", "replace": "bye"}}),
+    ("strtransform", {"rule": {"transform": "title"}}),
+    ("slugify", {"separator": "_"}),
+    ("hash", {}),
+    ("typecast", {"type": "int"}),
+    ("simplemath", {"op": "multiply", "other": "3"}),
+]
+
+
+def _items(size: int = 25) -> list[dict]:
+    return [{"content": f"{x}", "title": f"hello world {x}"} for x in range(size)]
+
+
+def _field(name: str) -> str:
+    return "content" if name in {"typecast", "simplemath"} else "title"
+
+
+@pytest.mark.parametrize(("name", "conf"), CASES)
+@pytest.mark.parametrize("batch_size", [1, 4, None])
+def test_batch_matches_per_item(name, conf, batch_size):
+    pipe = import_module(f"riko.modules.{name}").pipe
+    kwargs = {"conf": conf, "field": _field(name)}
+    expected = [next(pipe(item, **kwargs)) for item in _items()]
+    batched = pipe(iter(_items()), batch_size=batch_size, **kwargs)
+    assert list(batched) == expected
+
+
+@pytest.mark.parametrize(("name", "conf"), CASES)
+def test_async_batch_matches_sync(name, conf):
+    module = import_module(f"riko.modules.{name}")
+    kwargs = {"conf": conf, "field": _field(name), "batch_size": 4}
+    expected = list(module.pipe(iter(_items()), **kwargs))
+
+    async def main():
+        return list(await module.async_pipe(iter(_items()), **kwargs))
+
+    assert run(main) == expected
+
+
+def test_skipped_items_keep_their_place():
+    skip_if = lambda item: int(item["content"]) % 3 == 0  # noqa: E731
+    kwargs = {"field": "title", "skip_if": skip_if, "batch_size": 4}
+    results = list(slugify(iter(_items(10)), **kwargs))
+    assert [r["content"] for r in results] == [f"{x}" for x in range(10)]
+    assert ["slugify" in r for r in results] == [bool(x % 3) for x in range(10)]
+
+
+def test_dynamic_conf_falls_back_to_per_item():
+    items = [{"title": "a b", "sep": sep} for sep in "_-+"]
+    conf = {"separator": {"subkey": "sep"}}
+    results = slugify(iter(items), conf=conf, field="title", batch_size=2)
+    assert [r["slugify"] for r in results] == ["a_b", "a-b", "a+b"]
+
+
+def test_pipe_is_called_once_per_batch():
+    calls = []
+
+    @processor(batch=True)
+    def pipe(contents, extraction, objconf, **kwargs):
+        calls.append(len(contents))
+        return [content * 2 for content in contents]
+
+    items = iter({"content": x} for x in range(10))
+    results = pipe(items, field="content", assign="content", batch_size=4)
+    assert [r["content"] for r in results] == [x * 2 for x in range(10)]
+    assert calls == [4, 4, 2]
@@ -1,9 +1,11 @@
 # vim: sw=4:ts=4:expandtab
 """
-Tests DotDict deletion: root, nested, and case-insensitive.
+Tests DotDict deletion (root, nested, and case-insensitive) and SharedDotDict
+copy-on-write views (including in place mutation of nested containers).
 """
 
-from riko.dotdict import DotDict
+from riko.dotdict import DotDict, SharedDotDict
+from riko.modules.split import pipe as split
 
 
 class TestDotDictDelete:
@@ -51,3 +53,44 @@ class TestDotDictDelete:
         d = DotDict({"author": {"name": "bar"}})
         d.delete("missing.name")
         assert d.asdict() == {"author": {"name": "bar"}}
+
+    def test_nested_mutation_is_in_place(self):
+        author = {"name": "bar", "uri": "baz"}
+        d = DotDict({"author": author})
+        d.delete("author.uri")
+        assert d.get("author") == author == {"name": "bar"}
+        d["author.name"] = "foo"
+        assert author == {"name": "foo"}
+
+
+class TestSharedDotDict:
+    def test_views_share_until_written(self):
+        item = DotDict({"author": {"name": "bar"}, "title": "foo"})
+        view1, view2 = SharedDotDict(item), SharedDotDict(item)
+        view1["title"] = "baz"
+        view2["author.name"] = "qux"
+        view2.delete("title")
+        assert item.asdict() == {"author": {"name": "bar"}, "title": "foo"}
+        assert view1.asdict() == {"author": {"name": "bar"}, "title": "baz"}
+        assert view2.asdict() == {"author": {"name": "qux"}}
+
+    def test_nested_delete_keeps_source(self):
+        item = DotDict({"a": {"b": {"c": 1, "d": 2}}})
+        view = SharedDotDict(item)
+        view.delete("a.b.c")
+        assert item.asdict() == {"a": {"b": {"c": 1, "d": 2}}}
+        assert view.asdict() == {"a": {"b": {"d": 2}}}
+
+    def test_nested_mutation_stays_in_view(self):
+        item = DotDict({"tags": ["a"], "author": {"urls": ["x.com"]}})
+        view1, view2 = SharedDotDict(item), SharedDotDict(item)
+        view1["tags"].append("b")
+        view1.get("author")["urls"].append("y.com")
+        assert item.asdict() == {"tags": ["a"], "author": {"urls": ["x.com"]}}
+        assert view2.asdict() == item.asdict()
+        assert view1["tags"] == ["a", "b"]
+
+    def test_lazy_split_branches_stay_independent(self):
+        stream1, stream2 = split(({"tags": ["a"]} for _ in range(1)), lazy=True)
+        next(stream1)["tags"].append("LEAK")
+        assert next(stream2)["tags"] == ["a"]
@@ -0,0 +1,91 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Tests the keyed join strategies in riko.modules.join: every strategy must agree
+with the nested-loop reference (up to output order), including when the merge
+join spills its sorted runs to disk.
+"""
+
+import pytest
+
+from riko.modules.join import JOINERS, auto_join, pipe
+
+
+def _items(size: int) -> list[dict]:
+    return [{"x": f"k{x % 7}" if x % 5 else None, "n": x} for x in range(size)]
+
+
+def _others(size: int) -> list[dict]:
+    keys = [f"K{y % 9}" for y in range(size)]
+    return [{"y": key, "m": y} if y % 4 else {"m": y} for y, key in enumerate(keys)]
+
+
+def _key(item: dict) -> tuple:
+    return item["n"], item.get("m", -1)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "anti"])
+@pytest.mark.parametrize("strategy", ["hash", "merge", "auto"])
+def test_strategy_matches_nested(strategy, how):
+    kwargs = {"lower": True, "how": how}
+    expected = JOINERS["nested"](_items(40), _others(30), "x", "y", **kwargs)
+
+    if strategy == "hash":
+        joined = JOINERS[strategy](_items(40), _others(30), "x", "y", **kwargs)
+    else:
+        joiner = JOINERS[strategy]
+        joined = joiner(_items(40), _others(30), "x", "y", budget=4, **kwargs)
+
+    assert sorted(map(_key, joined)) == sorted(map(_key, expected))
+
+
+def test_auto_join_keeps_stream_order_within_budget():
+    items = ({"x": x, "n": x} for x in (3, 1, 2))
+    others = ({"y": y} for y in range(4))
+    assert [i["n"] for i in auto_join(items, others, "x", "y", budget=4)] == [3, 1, 2]
+
+
+def test_auto_join_spills_past_budget():
+    items = ({"x": x % 10, "n": x} for x in range(100))
+    others = ({"y": y, "m": y} for y in range(50))
+    conf = {"join_key": "x", "other_join_key": "y", "budget": 8}
+    joined = list(pipe(items, conf=conf, other=others))
+    assert sorted(i["n"] for i in joined) == list(range(100))
+    assert all(i["x"] == i["m"] for i in joined)
+
+    # the merge join emits in join key order rather than stream order
+    assert [i["x"] for i in joined] == sorted(i["x"] for i in joined)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "anti"])
+def test_hash_join_order_ignores_length_hints(how):
+    items = [{"x": x % 3, "n": x} for x in range(6)]
+    others = [{"y": y % 2, "m": y} for y in range(12)]
+    expected = list(map(_key, JOINERS["nested"](items, others, "x", "y", how=how)))
+
+    # a list `stream` shorter than `other` is indexed, an iterator is probed
+    for stream in (items, iter(items)):
+        joined = JOINERS["hash"](stream, others, "x", "y", how=how)
+        assert list(map(_key, joined)) == expected
+
+
+def test_hash_join_warns_on_non_mappings(caplog):
+    items = [{"x": 1, "n": 1}, "bogus"]
+    others = [{"y": 1, "m": 1}] * 3
+    assert len(list(JOINERS["hash"](items, others, "x", "y"))) == 3
+    assert "Unsupported type for join" in caplog.text
+
+
+@pytest.mark.parametrize("strategy", ["hash", "merge", "nested"])
+def test_unhashable_tuples_join_on_equality(strategy):
+    items = [{"x": (1, [2]), "n": 1}, {"x": (1, [3]), "n": 2}]
+    others = [{"y": (1, [2]), "m": 1}]
+    joined = JOINERS[strategy](items, others, "x", "y")
+    assert [_key(i) for i in joined] == [(1, 1)]
+
+
+@pytest.mark.parametrize("strategy", ["hash", "merge"])
+def test_equal_dicts_join_regardless_of_key_order(strategy):
+    items = [{"x": {"a": 1, "b": [2]}, "n": 1}]
+    others = [{"y": {"b": [2], "a": 1}, "m": 1}]
+    joined = JOINERS[strategy](items, others, "x", "y")
+    assert [_key(i) for i in joined] == [(1, 1)]
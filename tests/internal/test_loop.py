@@ -11,12 +11,14 @@ Every stream uses at least two parent items — a single parent cannot expose th
 global-vs-per-parent ``count`` gap.
 """
 
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from typing import cast
 
 import pytest
 
 import riko.modules.loop as loop_module
-from riko.bado import issync, run
+from riko.bado import async_sleep, issync, run
 from riko.context import Context
 from riko.modules._subpipe import mark_subpipe
 from riko.modules.loop import async_pipe as async_loop
@@ -433,3 +435,123 @@ class TestAsyncSubpipeLoop:
         assert run(main) == [{"content": "a0"}, {"content": "b0"}]
         assert produced == [0, 0]
         assert closed == ["a", "b"]
+
+
+@pytest.mark.skipif(issync, reason="async support not installed")
+class TestConcurrentAsyncLoop:
+    """
+    With ``concurrency`` above 1, the async loop runs the embed for that many
+    parents at once while keeping parent order (or arrival order), backpressure,
+    and the per-parent ``count="first"`` fold.
+    """
+
+    def _overlapping(self, active: list[int], peak: list[int], delays: dict):
+        async def _sub(item, context=None, **_):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await async_sleep(delays.get(item["title"], 0.01))
+            active[0] -= 1
+            return iter([{"content": item["title"]}, {"content": "-"}])
+
+        return mark_subpipe(_sub)
+
+    def test_runs_parents_concurrently_in_parent_order(self):
+        active, peak = [0], [0]
+        embed = self._overlapping(active, peak, {"a": 0.03})
+        parents = [{"title": title} for title in "abcdef"]
+
+        async def main():
+            stream = await async_loop(
+                iter(parents), embed=embed, count="first", emit=True, concurrency=3
+            )
+            return [item async for item in stream]
+
+        assert run(main) == [{"content": title} for title in "abcdef"]
+        assert peak[0] == 3
+
+    def test_arrival_order(self):
+        active, peak = [0], [0]
+        embed = self._overlapping(active, peak, {"a": 0.05})
+        kwargs = {"concurrency": 2, "order": "arrival", "assign": "x"}
+
+        async def main():
+            stream = await async_loop(
+                iter([{"title": "a"}, {"title": "b"}]),
+                embed=embed,
+                count="first",
+                emit=False,
+                **kwargs,
+            )
+            return [item async for item in stream]
+
+        assert run(main) == [
+            {"title": "b", "x": {"content": "b"}},
+            {"title": "a", "x": {"content": "a"}},
+        ]
+
+    def test_source_advances_with_the_workers(self):
+        consumed: list[int] = []
+
+        def tracking() -> Stream:
+            for index in range(100):
+                consumed.append(index)
+                yield {"title": str(index)}
+
+        async def main():
+            stream = await async_loop(
+                tracking(),
+                embed=_ASYNC_SUBPIPE,
+                count="first",
+                emit=True,
+                concurrency=4,
+            )
+
+            async with aclosing(cast(AsyncGenerator, stream)) as results:
+                first = await anext(results)
+
+            return first, len(consumed)
+
+        first, pulled = run(main)
+        assert first == {"content": "0"}
+        assert pulled <= 8
+
+    def test_count_first_closes_each_child(self):
+        closed: list[str] = []
+
+        def child(tag: str):
+            try:
+                for index in range(50):
+                    yield {"content": f"{tag}{index}"}
+            finally:
+                closed.append(tag)
+
+        async def _sub(item, context=None, **_):
+            return child(str(item["title"]))
+
+        async def main():
+            stream = await async_loop(
+                iter([{"title": "a"}, {"title": "b"}, {"title": "c"}]),
+                embed=mark_subpipe(_sub),
+                count="first",
+                emit=True,
+                concurrency=2,
+            )
+            return [item async for item in stream]
+
+        assert run(main) == [{"content": "a0"}, {"content": "b0"}, {"content": "c0"}]
+        assert sorted(closed) == ["a", "b", "c"]
+
+    def test_concurrency_must_be_positive(self):
+        async def main():
+            await async_loop(iter(PARENTS), embed=_ASYNC_SUBPIPE, concurrency=0)
+
+        with pytest.raises(ValueError, match="concurrency"):
+            run(main)
+
+    def test_order_must_be_known(self):
+        async def main():
+            order = "random"
+            await async_loop(iter(PARENTS), embed=_ASYNC_SUBPIPE, order=order)  # pyright: ignore[reportArgumentType]
+
+        with pytest.raises(ValueError, match="order"):
+            run(main)
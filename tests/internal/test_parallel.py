@@ -0,0 +1,259 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Tests the pool streaming primitives in riko._parallel: ``imap_bounded`` keeps at
+most ``window`` calls in flight (reading the source only as results are taken)
+and propagates worker errors in both ordered and completion order;
+``imap_transport`` ships batches to process pools (or a ``FuturesPool``) as
+single pickles; ``FuturesPool`` streams chunks over any ``concurrent.futures``
+executor and cancels only the tasks it queued; and ``AutoTuner`` sizes chunks from measured latency and result size and trims the
+active workers only while throughput holds up. The caches parallel threads
+share hand every caller the same result.
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.dummy import Pool
+from time import sleep
+
+import pytest
+from dateutil.parser import ParserError
+
+from riko import _parallel
+from riko._io import get_opener
+from riko._parallel import (
+    MAX_BATCH_BYTES,
+    MAX_CHUNKSIZE,
+    AutoTuner,
+    FuturesPool,
+    ProcessPool,
+    imap_bounded,
+    imap_chunks,
+    imap_transport,
+)
+from riko.dates import _parse_date_cached, parse_date_string
+
+
+def _skewed(x: int) -> int:
+    sleep(0.01 * (x % 3))
+    return x * 2
+
+
+def _fail_on_three(x: int) -> int:
+    if x == 3:
+        raise ValueError("three")
+
+    return x
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_maps_all_items(ordered):
+    with Pool(4) as pool:
+        results = list(imap_bounded(pool, _skewed, range(20), 3, ordered=ordered))
+
+    expected = [x * 2 for x in range(20)]
+    assert results == expected if ordered else sorted(results) == expected
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_backpressure_bounds_inflight(ordered):
+    lock = threading.Lock()
+    running = peak = 0
+
+    def track(x: int) -> int:
+        nonlocal running, peak
+
+        with lock:
+            running += 1
+            peak = max(peak, running)
+
+        sleep(0.005)
+
+        with lock:
+            running -= 1
+
+        return x
+
+    with Pool(8) as pool:
+        list(imap_bounded(pool, track, range(30), 2, ordered=ordered))
+
+    assert peak <= 2
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_errors_propagate(ordered):
+    with Pool(2) as pool, pytest.raises(ValueError, match="three"):
+        list(imap_bounded(pool, _fail_on_three, range(6), 2, ordered=ordered))
+
+
+def test_chunks_preserve_order():
+    with Pool(3) as pool:
+        results = list(imap_chunks(pool, _skewed, range(25), chunksize=4, window=2))
+
+    assert results == [x * 2 for x in range(25)]
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_transport_over_processes(ordered):
+    with ProcessPool(2) as pool:
+        args = (pool, _skewed, range(50))
+        results = list(imap_transport(*args, chunksize=7, ordered=ordered))
+
+    expected = [x * 2 for x in range(50)]
+    assert results == expected if ordered else sorted(results) == expected
+
+
+def test_transport_errors_propagate():
+    with ProcessPool(2) as pool, pytest.raises(ValueError, match="three"):
+        list(imap_transport(pool, _fail_on_three, range(6), chunksize=2))
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_transport_over_futures(ordered):
+    # the executor forks its workers lazily while its own threads run, which
+    # can deadlock them, so spawn them; and wait for them to exit, so the next
+    # test doesn't fork beside them
+    context = get_context("spawn")
+
+    with (
+        ProcessPoolExecutor(2, mp_context=context) as executor,
+        FuturesPool(executor, 2) as pool,
+    ):
+        results = list(imap_transport(pool, _skewed, range(30), 4, ordered=ordered))
+
+        with pytest.raises(ValueError, match="three"):
+            list(imap_transport(pool, _fail_on_three, range(6), 2, ordered=ordered))
+
+    expected = [x * 2 for x in range(30)]
+    assert results == expected if ordered else sorted(results) == expected
+
+
+def test_futures_pool_lifecycle():
+    pool = FuturesPool(ThreadPoolExecutor(1))
+
+    with pytest.raises(ValueError, match="still running"):
+        pool.join()
+
+    pool.close()
+    pool.join()
+
+    with pytest.raises(ValueError, match="not running"):
+        pool.apply_async(abs, (1,))
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+def test_futures_pool_streams_chunks(ordered):
+    pulled = []
+
+    def source():
+        for x in range(100):
+            pulled.append(x)
+            yield x
+
+    with FuturesPool(ThreadPoolExecutor(2)) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        results = imap(_skewed, source(), chunksize=3)
+        first = next(results)
+
+        # at most twice the worker count of chunks were read ahead
+        assert len(pulled) <= 4 * 3 + 3
+        rest = list(results)
+
+    expected = [x * 2 for x in range(100)]
+    everything = [first, *rest]
+    assert everything == expected if ordered else sorted(everything) == expected
+
+
+def test_futures_pool_cancels_queued_tasks():
+    release = threading.Event()
+
+    with ThreadPoolExecutor(1) as executor:
+        pool = FuturesPool(executor)
+        results = [pool.apply_async(release.wait) for _ in range(3)]
+        assert pool.cancel() == 2
+        release.set()
+
+        assert results[0].get() is True
+        assert [result.future.cancelled() for result in results] == [
+            False,
+            True,
+            True,
+        ]
+        # the caller's executor is left running
+        assert executor.submit(abs, -1).result() == 1
+
+
+def test_tuner_grows_chunks_for_fast_items():
+    tuner = AutoTuner(2)
+    sizes = []
+
+    for _ in range(20):
+        size = tuner.get_chunksize()
+        sizes.append(size)
+        tuner.record(size, size * 1e-6)
+
+    assert sizes == sorted(sizes)
+    assert sizes[1] == 2
+    assert tuner.get_chunksize() == MAX_CHUNKSIZE
+
+
+def test_tuner_caps_chunk_bytes():
+    tuner = AutoTuner(2, start=64)
+    tuner.record(64, 64e-6, size=64 * MAX_BATCH_BYTES // 16)
+    assert tuner.get_chunksize() == 16
+
+
+def test_tuner_shrinks_chunks_for_slow_items():
+    tuner = AutoTuner(2, start=64)
+    tuner.record(64, 64 * _parallel.TARGET_TASK_TIME / 4)
+    assert tuner.get_chunksize() == 4
+
+
+def test_tuner_leaves_pinned_values():
+    tuner = AutoTuner(4, chunksize=32, active=3)
+
+    for _ in range(10):
+        tuner.record(32, 1)
+
+    assert (tuner.get_chunksize(), tuner.get_window()) == (32, 3)
+    assert tuner.stats.settled
+
+
+def test_tuner_settles_workers(monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr(_parallel, "perf_counter", lambda: next(clock))
+    tuner = AutoTuner(4, chunksize=10)
+    windows = []
+
+    # throughput holds with 4 and 3 active workers but drops with 2
+    while not tuner.stats.settled:
+        windows.append(tuner.get_window())
+        tuner.record(10 if tuner.get_window() > 2 else 5, 1)
+
+    assert 2 in windows
+    assert tuner.get_window() == 3
+
+
+def test_shared_caches_agree_across_threads():
+    get_opener.cache_clear()
+
+    with ThreadPoolExecutor(8) as executor:
+        openers = list(executor.map(lambda _: get_opener(encoding="ascii"), range(64)))
+
+    assert len(set(map(id, openers))) == 1
+
+
+def test_cached_date_errors_are_raised_afresh():
+    _parse_date_cached.cache_clear()
+
+    def parse(_):
+        with pytest.raises(ParserError) as info:
+            parse_date_string("not a date")
+
+        return info.value
+
+    with ThreadPoolExecutor(4) as executor:
+        errors = list(executor.map(parse, range(8)))
+
+    assert len(set(map(id, errors))) == len(errors)
+    assert _parse_date_cached.cache_info().currsize == 1
@@ -0,0 +1,27 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Tests the external merge sort in riko.modules.sort: spilling sorted runs to
+disk must produce exactly the (stable) in-memory ordering.
+"""
+
+import pytest
+
+from riko.modules.sort import pipe
+
+
+def _items(size: int = 300) -> list[dict]:
+    return [{"k": (x * 37) % 11, "s": f"s{x % 5}", "n": x} for x in range(size)]
+
+
+RULES = [
+    {"field": "k"},
+    [{"field": "s", "dir": "desc"}, {"field": "k"}],
+]
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("budget", [1, 7, 1000])
+def test_external_sort_matches_in_memory(rule, budget):
+    expected = [i["n"] for i in pipe(_items(), conf={"rule": rule})]
+    spilled = pipe(iter(_items()), conf={"rule": rule}, budget=budget)
+    assert [i["n"] for i in spilled] == expected
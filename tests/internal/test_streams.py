@@ -2,9 +2,12 @@
 """
 Tests the AnyIO streaming primitives in riko.bado.itertools: ``async_map_stream``
 (concurrent, order-independent, bounded-memory) and ``async_map_ordered_stream``
-(same bound, results in source order).
+(same bound, results in source order), and the async processor mapping built on
+them.
 """
 
+from contextlib import aclosing
+
 import pytest
 
 from riko.bado import Semaphore, async_sleep, isasync, lowlevel, run
@@ -14,6 +17,7 @@ from riko.bado.itertools import (
     async_map_stream,
     async_merge,
 )
+from riko.ext import processor
 from tests import aresolve
 
 
@@ -209,3 +213,71 @@ def test_async_merge_rejects_bad_limit():
 def test_async_merge_rejects_negative_buffer():
     with pytest.raises(ValueError, match="buffer cannot be negative"):
         aresolve(async_merge([_afeed([1])], buffer=-1))
+
+
+def _tracked_processor(active: list[int], peak: list[int], delays: dict | None = None):
+    """An async processor recording how many items it processes at once."""
+
+    @processor(isasync=True, emit=True)
+    async def async_pipe(item, extraction, objconf, **kwargs):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await async_sleep((delays or {}).get(item["x"], 0.01))
+        active[0] -= 1
+        return {"x": item["x"] * 2}
+
+    return async_pipe
+
+
+@pytest.mark.skipif(not isasync, reason="anyio not installed")
+def test_processor_map_bounds_concurrency():
+    active, peak = [0], [0]
+    async_pipe = _tracked_processor(active, peak)
+    items = [{"x": x} for x in range(20)]
+
+    async def main():
+        return list(await async_pipe(iter(items), concurrency=3))
+
+    assert run(main) == [{"x": x * 2} for x in range(20)]
+    assert peak[0] == 3
+
+
+@pytest.mark.skipif(not isasync, reason="anyio not installed")
+def test_processor_stream_yields_before_source_ends():
+    active, peak = [0], [0]
+    async_pipe = _tracked_processor(active, peak)
+
+    async def main():
+        pulled = 0
+
+        async def gen():
+            nonlocal pulled
+
+            for x in range(1000):
+                pulled += 1
+                yield {"x": x}
+
+        stream = async_pipe.stream(gen(), concurrency=2, buffer=1)
+
+        async with aclosing(stream):
+            first = await anext(stream)
+
+        return first, pulled
+
+    first, pulled = run(main)
+    assert first == {"x": 0}
+    assert pulled <= 2 * (2 + 1)
+    assert peak[0] <= 2
+
+
+@pytest.mark.skipif(not isasync, reason="anyio not installed")
+def test_processor_stream_arrival_order():
+    active, peak = [0], [0]
+    async_pipe = _tracked_processor(active, peak, {0: 0.05})
+    items = [{"x": x} for x in range(3)]
+
+    async def main():
+        stream = async_pipe.stream(items, concurrency=3, ordered=False)
+        return [item["x"] async for item in stream]
+
+    assert run(main) == [2, 4, 0]
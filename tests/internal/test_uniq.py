@@ -0,0 +1,57 @@
+# vim: sw=4:ts=4:expandtab
+"""
+Tests the dedupe modes of riko.modules.uniq: ``lru`` forgets the least recently
+seen values first, ``exact`` never forgets, and ``bloom`` never lets a repeat
+through while letting few new values be dropped (false positives). All modes
+agree on which values are equal.
+"""
+
+import pytest
+
+from riko.modules.uniq import BloomFilter, pipe
+
+MODES = ["lru", "exact", "bloom"]
+
+
+def _uniq(values: list, **conf) -> list:
+    items = [{"x": value} for value in values]
+    return [item["x"] for item in pipe(items, conf={"uniq_key": "x", **conf})]
+
+
+def test_lru_evicts_least_recently_seen():
+    # seeing 1 again keeps it, so 2 is evicted by 3, and then 1 by 2
+    assert _uniq([1, 2, 1, 3, 2, 1], mode="lru", limit=2) == [1, 2, 3, 2, 1]
+
+
+def test_exact_keeps_every_distinct_value():
+    values = [1, "1", [1], (1,), {"a": 1, "b": [2]}, {"b": [2], "a": 1}, [1]]
+    assert _uniq(values, mode="exact") == [1, "1", [1], (1,), {"a": 1, "b": [2]}]
+
+    many = list(range(5000))
+    assert _uniq(many + many, mode="exact") == many
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_modes_agree_on_equal_values(mode):
+    values = [1, 1.0, True, (1, "a"), (1.0, "a"), [1], [1.0], 0.5, "1"]
+    assert _uniq(values, mode=mode) == [1, (1, "a"), [1], 0.5, "1"]
+
+
+def test_bloom_never_lets_repeats_through():
+    values = [f"v{x}" for x in range(2000)]
+    result = _uniq(values + values, mode="bloom", limit=2000, error_rate=0.01)
+    assert len(result) <= len(values)
+    assert set(result) <= set(values)
+
+
+def test_bloom_false_positives_stay_near_the_error_rate():
+    bloom = BloomFilter(1000, 0.01)
+    seen = [f"seen{x}" for x in range(1000)]
+
+    for value in seen:
+        bloom.add(value)
+
+    assert all(value in bloom for value in seen)
+
+    false_positives = sum(f"unseen{x}" in bloom for x in range(10000))
+    assert 0 < false_positives < 200
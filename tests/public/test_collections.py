@@ -4,19 +4,37 @@ Provides pipeline collection tests.
 """
 
 from collections.abc import Awaitable, Callable, Iterable, Iterator
+from functools import partial
 from multiprocessing.dummy import Pool as ThreadPool
 from operator import itemgetter
+from time import sleep
 from typing import Any, cast
 
 import pytest
 
+try:
+    import anyio
+    import httpx
+except ImportError:
+    anyio = httpx = None
+
 from riko import get_path
 from riko._iterutils import noop
+from riko._parallel import START_METHOD, pool_registry
 from riko._pubsub import async_hub, close, sync_hub
-from riko.bado import gather_results, issync, run
-from riko.collections import AsyncPipe, Executor, SyncCollection, SyncPipe
+from riko.bado import _util, async_sleep, gather_results, issync, run
+from riko.bado.bridge import LoopBridge, get_bridge
+from riko.collections import (
+    AsyncCollection,
+    AsyncPipe,
+    Executor,
+    SyncCollection,
+    SyncPipe,
+)
 from riko.exceptions import ReceiverUnavailableError
 from riko.ext.names import ModuleName, normalize_module_name
+from riko.modules import sort as sort_module
+from riko.modules import strreplace as strreplace_module
 from riko.types.general import Item, Items
 from riko.types.modules import (
     ItemBuilderConf,
@@ -452,6 +470,366 @@ class TestAsyncCollections(_CollectionTest):
         assert self.runs == 3
 
 
+def _json_transport(hosts: list[str]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(200, json={"items": [{"path": request.url.path}]})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.skipif(issync, reason="async support not available")
+class TestAsyncHttpClient:
+    """Requests of a running pipe or collection share one pooled client."""
+
+    def _patch_client(self, monkeypatch: pytest.MonkeyPatch, hosts: list[str]):
+        created = []
+        init = _util.HttpClient.__init__
+
+        def spy(self, *args: Any, **kwargs: Any) -> None:
+            init(self, *args, **kwargs)
+            created.append(self)
+
+        factory = partial(httpx.AsyncClient, transport=_json_transport(hosts))
+        monkeypatch.setattr(_util.httpx, "AsyncClient", factory)
+        monkeypatch.setattr(_util.HttpClient, "__init__", spy)
+        return created
+
+    def test_collection_shares_one_client(self, monkeypatch):
+        hosts = []
+        created = self._patch_client(monkeypatch, hosts)
+        urls = [f"https://example.com/{x}.json" for x in range(5)]
+        sources = [{"url": url, "type": "fetchdata", "path": "items"} for url in urls]
+
+        async def main():
+            async with AsyncCollection(sources, connections=3) as collection:
+                items = [await anext(collection)]
+                open_during = not created[0].client.is_closed
+                items += [item async for item in collection]
+
+            return items, open_during
+
+        items, open_during = run(main)
+        paths = sorted(item["path"] for item in items)
+        assert paths == [f"/{x}.json" for x in range(5)]
+        assert hosts == ["example.com"] * 5
+        assert len(created) == 1
+        assert open_during
+        assert created[0].client.is_closed
+
+    def test_pipe_closes_its_client_on_aclose(self, monkeypatch):
+        created = self._patch_client(monkeypatch, [])
+        conf = {"url": "https://example.com/a.json", "path": "items"}
+
+        async def main():
+            pipe = AsyncPipe("fetchdata", conf=conf).hash()
+            first = await anext(pipe)
+            await pipe.aclose()
+            return first
+
+        assert run(main)["path"] == "/a.json"
+        assert len(created) == 1
+        assert created[0].client.is_closed
+
+    def test_requests_per_host_are_bounded(self):
+        active, peak = [0], [0]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await async_sleep(0.01)
+            active[0] -= 1
+            return httpx.Response(200)
+
+        async def main():
+            transport = httpx.MockTransport(handler)
+            client = httpx.AsyncClient(transport=transport)
+            pooled = _util.HttpClient(8, host_connections=2, client=client)
+            urls = [f"https://example.com/{x}" for x in range(6)]
+            await gather_results(pooled.get(url) for url in urls)
+            await client.aclose()
+
+        run(main)
+        assert peak[0] == 2
+
+    def test_callers_client_is_left_open(self):
+        hosts = []
+        conf = {"url": "https://example.com/a.json", "path": "items"}
+
+        async def main():
+            client = httpx.AsyncClient(transport=_json_transport(hosts))
+
+            async with AsyncPipe("fetchdata", conf=conf, client=client) as pipe:
+                chained = pipe.hash()
+                items = [item async for item in chained]
+
+            left_open = not client.is_closed
+            await client.aclose()
+            return items, chained.client is client, left_open
+
+        items, propagated, left_open = run(main)
+        assert [item["path"] for item in items] == ["/a.json"]
+        assert hosts == ["example.com"]
+        assert propagated
+        assert left_open
+
+
+def _gated_transport(body: list[bytes], gate: Any) -> Any:
+    async def stream():
+        # Everything after the first chunk waits for the gate
+        yield body[0]
+        await gate.wait()
+
+        for chunk in body[1:]:
+            yield chunk
+
+    return httpx.MockTransport(lambda _: httpx.Response(200, content=stream()))
+
+
+@pytest.mark.skipif(issync, reason="async support not available")
+class TestAsyncStreamingSources:
+    """Async sources yield items as their bodies download."""
+
+    @pytest.mark.parametrize(
+        ("name", "url", "conf", "body", "first"),
+        [
+            ("fetchtext", "a.txt", {}, [b"a\nb", b"\nc\n"], "a"),
+            (
+                "fetchdata",
+                "a.json",
+                {"path": "items"},
+                [b'{"items": [{"x": 1}, {"x"', b": 2}]}"],
+                {"x": 1},
+            ),
+            ("csv", "a.csv", {}, [b"x,y\n1,2\n3", b",4\n"], {"x": "1", "y": "2"}),
+            (
+                "fetchtable",
+                "a.csv",
+                {},
+                [b"x,y\n1,2\n3", b",4\n"],
+                {"x": "1", "y": "2"},
+            ),
+        ],
+    )
+    def test_first_item_before_body_completes(self, name, url, conf, body, first):
+        conf = {"url": f"https://example.com/{url}", **conf}
+
+        async def main():
+            gate = anyio.Event()
+            transport = _gated_transport(body, gate)
+
+            async with httpx.AsyncClient(transport=transport) as client:
+                pipe = AsyncPipe(name, conf=conf, client=client)
+                item = await anext(pipe)
+                waiting = not gate.is_set()
+                gate.set()
+                rest = [item async for item in pipe]
+
+            return item, waiting, rest
+
+        item, waiting, rest = run(main)
+        assert item == first
+        assert waiting
+        assert len(rest) == (2 if name == "fetchtext" else 1)
+
+    @pytest.mark.parametrize(
+        ("name", "conf"),
+        [
+            ("fetchtext", {"url": get_path("lorem.txt")}),
+            ("fetchdata", {"url": get_path("gigs.json"), "path": "value.items"}),
+            ("csv", {"url": get_path("spreadsheet.csv"), "sanitize": True}),
+            ("fetchtable", {"url": get_path("spreadsheet.csv")}),
+        ],
+    )
+    def test_matches_sync_pipe(self, name, conf):
+        async def main():
+            return [item async for item in AsyncPipe(name, conf=conf)]
+
+        assert run(main) == list(SyncPipe(name, conf=conf))
+
+    # the file's ResourceWarning is raised in its finalizer, and so reported as
+    # unraisable
+    @pytest.mark.filterwarnings("error::ResourceWarning")
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    def test_closing_early_stops_the_parser(self):
+        conf = {"url": get_path("spreadsheet.csv")}
+
+        async def main():
+            async with AsyncPipe("csv", conf=conf) as pipe:
+                first = await anext(pipe)
+
+            return first
+
+        assert run(main) == next(SyncPipe("csv", conf=conf))
+
+
+_STREAMING_OPERATORS = [
+    ("filter", {"rule": {"field": "x", "op": "atleast", "value": 1}}, {}),
+    ("truncate", {"count": 3}, {}),
+    ("uniq", {"uniq_key": "x"}, {}),
+    ("union", {}, {"others": [[{"x": 3}]]}),
+    ("timeout", {"seconds": 60}, {}),
+    # mapped pipes stream one window (of `connections` items) at a time
+    ("rename", {"rule": {"field": "x", "newval": "y"}}, {"connections": 1}),
+]
+
+_UPSTREAM = [{"x": 1}, {"x": 2}, {"x": 2}]
+
+
+@pytest.mark.skipif(issync, reason="async support not available")
+class TestAsyncStreamingOperators:
+    """Feed-native operators (and mapped pipes) never buffer their upstream."""
+
+    def _gated(self, gate: Any) -> Any:
+        async def upstream():
+            # Everything after the first item waits for the gate
+            yield _UPSTREAM[0]
+            await gate.wait()
+
+            for item in _UPSTREAM[1:]:
+                yield item
+
+        return upstream()
+
+    @pytest.mark.parametrize(("name", "conf", "kwargs"), _STREAMING_OPERATORS)
+    def test_first_item_before_upstream_completes(self, name, conf, kwargs):
+        async def main():
+            gate = anyio.Event()
+            pipe = AsyncPipe(name, source=self._gated(gate), conf=conf, **kwargs)
+
+            with anyio.fail_after(5):
+                first = await anext(pipe)
+                waiting = not gate.is_set()
+                gate.set()
+                rest = [item async for item in pipe]
+
+            return [first, *rest], waiting
+
+        streamed, waiting = run(main)
+        assert waiting
+        sync_kwargs = {k: v for k, v in kwargs.items() if k != "connections"}
+        items = SyncPipe(name, source=_UPSTREAM, conf=conf, **sync_kwargs)
+        assert streamed == list(items)
+
+    def test_chain_streams_end_to_end(self):
+        async def main():
+            gate = anyio.Event()
+            source = self._gated(gate)
+            pipe = (
+                AsyncPipe("uniq", source=source, conf={"uniq_key": "x"}, connections=1)
+                .rename(conf={"rule": {"field": "x", "newval": "y"}})
+                .filter(conf={"rule": {"field": "y", "op": "is", "value": 1}})
+            )
+
+            with anyio.fail_after(5):
+                first = await anext(pipe)
+
+            waiting = not gate.is_set()
+            await pipe.aclose()
+            return first, waiting
+
+        assert run(main) == ({"y": 1}, True)
+
+    def test_truncate_stops_reading_upstream(self):
+        async def main():
+            gate = anyio.Event()
+            pipe = AsyncPipe("truncate", source=self._gated(gate), conf={"count": 1})
+
+            with anyio.fail_after(5):
+                return [item async for item in pipe]
+
+        assert run(main) == [{"x": 1}]
+
+
+_FEEDS = [{"url": get_path(f)} for f in ["feed.xml", "gawker.xml"]]
+
+
+@pytest.mark.skipif(issync, reason="async support not available")
+class TestLoopBridge:
+    """Sync code reads async pipelines through a background event loop."""
+
+    def test_iterate_matches_sync_pipe(self):
+        with LoopBridge() as bridge:
+            streamed = list(bridge.iterate(AsyncPipe("hash", source=SRC)))
+
+        assert streamed == list(SyncPipe("hash", source=SRC))
+
+    def test_prefetch_is_bounded(self):
+        pulled = []
+
+        async def upstream():
+            for num in range(100):
+                pulled.append(num)
+                yield num
+
+        with LoopBridge() as bridge, bridge.iterate(upstream(), prefetch=2) as stream:
+            assert next(stream) == 0
+            sleep(0.1)
+
+            # the consumed item, a full buffer, and the one waiting to be sent
+            assert len(pulled) <= 4
+
+    def test_close_cancels_the_producer(self):
+        finalized = []
+
+        async def upstream():
+            try:
+                yield 1
+                await anyio.sleep_forever()
+            finally:
+                finalized.append(True)
+
+        with LoopBridge() as bridge:
+            stream = bridge.iterate(upstream())
+            assert next(stream) == 1
+            stream.close()
+            assert finalized == [True]
+            assert list(stream) == []
+
+    def test_errors_reach_the_consumer(self):
+        async def upstream():
+            yield 1
+            raise ValueError("boom")
+
+        with LoopBridge() as bridge:
+            stream = bridge.iterate(upstream())
+            assert next(stream) == 1
+
+            with pytest.raises(ValueError, match="boom"):
+                next(stream)
+
+    def test_loop_and_client_are_reused(self):
+        bridge = get_bridge()
+        portal, client = bridge.portal, bridge.client()
+        assert list(bridge.iterate(AsyncPipe("hash", source=SRC, client=client)))
+        assert bridge.portal is portal
+        assert bridge.client() is client
+
+    def test_closed_bridge_starts_a_new_loop(self):
+        bridge = LoopBridge()
+        portal, client = bridge.portal, bridge.client()
+        bridge.close()
+        assert client.is_closed
+        assert bridge.run(async_sleep, 0) is None
+        assert bridge.portal is not portal
+        bridge.close()
+
+    def test_async_backend_matches_sync_backend(self):
+        coll = SyncCollection(_FEEDS, backend="async", ordered=True, parallel=True)
+        assert coll.pool is None
+        assert list(coll) == list(SyncCollection(_FEEDS))
+
+    def test_async_backend_close_stops_fetching(self):
+        coll = SyncCollection(_FEEDS, backend="async", prefetch=0)
+        assert next(coll)
+        coll.close()
+        assert list(coll) == []
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            SyncCollection(_FEEDS, backend="trio")  # pyright: ignore[reportArgumentType]
+
+
 class TestCollectionParity(_CollectionTest):
     """Behaviors whose observable output is identical across both engines."""
 
@@ -488,6 +866,21 @@ class TestCollectionParity(_CollectionTest):
         assert first2 == {"content": "once is 1x"}
         assert self.runs == 3
 
+    def test_lazy_split(self):
+        splits = (
+            SyncPipe("itembuilder", conf=builder_conf)
+            .tokenizer(emit=True)
+            .udf(func=self.udf)
+            .split(lazy=True)
+        )
+        first1, first2 = _first_two(splits)
+        assert first1 == {"content": "once is 1x"}
+        assert first2 == {"content": "once is 1x"}
+        assert first1 is not first2
+
+        # the copies only pull the items they reach
+        assert self.runs == 1
+
 
 class TestPoolLifecycle:
     """Owned pools are cleaned up; caller-provided pools remain usable."""
@@ -695,3 +1088,186 @@ class TestModuleNameEnum:
         assert via_or.name == "truncate"
         assert via_method.name == "truncate"
         assert len(list(via_method)) == 1
+
+
+_SORT_ITEMS = [{"content": x % 7, "n": x} for x in range(50)]
+_SORT_RULES = {"rule": [{"field": "content", "dir": "desc"}, {"field": "n"}]}
+
+
+class TestSortLimitPushDown:
+    """``sort`` followed by ``truncate``/``tail`` selects only the kept items."""
+
+    @pytest.fixture
+    def limits(self, monkeypatch: pytest.MonkeyPatch) -> list[tuple]:
+        """The (limit, from_end) each ``sort`` is run with."""
+        calls = []
+        sort_items = sort_module.sort_items
+
+        def tracked(stream, rules, limit=None, from_end=False, budget=None):
+            calls.append((limit, from_end))
+            return sort_items(stream, rules, limit, from_end, budget)
+
+        monkeypatch.setattr(sort_module, "sort_items", tracked)
+        return calls
+
+    def _sorted(self) -> list[Item]:
+        return list(SyncPipe("sort", source=_SORT_ITEMS, conf=_SORT_RULES))
+
+    def test_truncate_matches_full_sort(self, limits):
+        conf = {"start": 2, "count": 5}
+        sort = SyncPipe("sort", source=_SORT_ITEMS, conf=_SORT_RULES)
+        flow = sort.truncate(conf=conf)
+        assert list(flow) == self._sorted()[2:7]
+        assert limits[0] == (7, False)
+
+        # the limit is passed down the chain, not stored on the sort pipe
+        assert "limit" not in sort.kwargs
+
+    def test_tail_matches_full_sort(self, limits):
+        sort = SyncPipe("sort", source=_SORT_ITEMS, conf=_SORT_RULES)
+        flow = sort.tail(conf={"count": 4})
+        assert list(flow) == self._sorted()[-4:]
+        assert limits[0] == (4, True)
+
+    @marks
+    def test_async_truncate_matches_full_sort(self, limits):
+        async def main() -> list[Item]:
+            flow = AsyncPipe("sort", source=_SORT_ITEMS, conf=_SORT_RULES)
+            return await flow.truncate(conf={"count": 3})
+
+        assert list(run(main)) == self._sorted()[:3]
+        assert limits[0] == (3, False)
+
+
+_FUSION_ITEMS = [{"content": f"Hello World {x}", "n": x} for x in range(20)]
+
+
+class TestStageFusion:
+    """Consecutive processors fused into one step match the unfused chain."""
+
+    def _chain(self, fuse: bool) -> SyncPipe:
+        skip_if = lambda item: item["n"] % 5 == 0  # noqa: E731
+        return (
+            SyncPipe("hash", source=_FUSION_ITEMS, fuse=fuse)
+            .strreplace(conf={"rule": {"find": "Hello", "replace": "Bye"}})
+            .strtransform(conf={"rule": {"transform": "upper"}}, assign="a.b")
+            .slugify(skip_if=skip_if)
+            .tokenizer(conf={"delimiter": " "}, emit=True)
+            .hash()
+        )
+
+    def test_fused_matches_unfused(self):
+        fused = self._chain(True)
+        assert fused._get_fused()
+        assert list(fused) == list(self._chain(False))
+
+    def test_batch_processors_receive_batches(self, monkeypatch):
+        sizes = []
+        batch_parser = strreplace_module.batch_parser
+
+        def record(words, *args, **kwargs):
+            sizes.append(len(words))
+            return batch_parser(words, *args, **kwargs)
+
+        monkeypatch.setattr(strreplace_module, "batch_parser", record)
+        fused = self._chain(True)
+        assert fused.source.source.batch
+        assert list(fused) == list(self._chain(False))
+        assert sizes == [len(_FUSION_ITEMS)] * 2
+
+    def test_fused_pipes_share_lifecycle(self):
+        flow = self._chain(True)
+        list(flow)
+        assert flow.source.state is flow.source.source.state is flow.state
+        assert flow.state == "exhausted"
+
+    def test_fusion_stops_at_started_and_non_processor_pipes(self):
+        flow = SyncPipe("hash", source=_FUSION_ITEMS).truncate(conf={"count": 3})
+        assert not flow._get_fused()
+        chained = flow.hash().hash()
+        assert chained._get_fused() == [chained.source, chained]
+
+    def test_opt_out_carries_down_the_chain(self):
+        flow = SyncPipe("hash", source=_FUSION_ITEMS, fuse=False).hash().hash()
+        assert not flow.fuse
+        assert not flow._get_fused()
+
+    def test_source_items_are_left_intact(self):
+        items = [{"content": "a"}]
+        assert list(SyncPipe("hash", source=items).slugify().hash())
+        assert items == [{"content": "a"}]
+
+
+class TestWarmPoolRegistry:
+    """``pool_scope='process'`` leases warm pools from ``pool_registry``."""
+
+    def teardown_method(self):
+        pool_registry.shutdown()
+
+    @pytest.mark.parametrize("threads", [True, False])
+    def test_pool_reused_across_pipelines(self, threads):
+        kwargs = {"parallel": True, "threads": threads, "pool_scope": "process"}
+        first = SyncPipe("hash", source=SRC, workers=2, **kwargs)
+        pool = first.pool
+        assert len(list(first)) == 3
+
+        second = SyncPipe("hash", source=SRC, workers=2, **kwargs)
+        assert second.pool is pool
+        assert len(list(second)) == 3
+
+    def test_process_pool_is_not_forked(self):
+        # the warm thread pools and the loop bridge keep this process threaded
+        kwargs = {"parallel": True, "threads": False, "pool_scope": "process"}
+
+        with SyncPipe("hash", source=SRC, workers=2, **kwargs) as pipe:
+            assert pipe.pool._ctx.get_start_method() == START_METHOD
+            assert len(list(pipe)) == 3
+
+    def test_leases_are_counted_and_released(self):
+        kwargs = {"parallel": True, "pool_scope": "process", "workers": 2}
+        key = Executor.THREAD
+        flow = SyncPipe("hash", source=SRC, **kwargs).hash()
+        assert pool_registry.leases(key) == 2
+
+        assert len(list(flow)) == 3
+        assert pool_registry.leases(key) == 0
+        assert flow.pool is None
+
+    def test_one_pool_per_executor(self):
+        kwargs = {"parallel": True, "pool_scope": "process"}
+        small = SyncPipe("hash", source=SRC, workers=2, **kwargs)
+        shared = SyncPipe("hash", source=SRC, workers=4, **kwargs)
+        assert (pool := shared.pool) is small.pool
+        assert shared._get_active(pool) == (4, 8)
+        assert len(list(small)) == len(list(shared)) == 3
+
+        larger = SyncPipe("hash", source=SRC, workers=4, **kwargs)
+        assert larger.pool is not pool
+        assert getattr(larger.pool, "_processes", None) == 4
+        assert SyncPipe("hash", source=SRC, workers=1, **kwargs).pool is larger.pool
+
+    def test_failure_keeps_shared_pool_running(self):
+        kwargs = {"parallel": True, "pool_scope": "process", "workers": 2}
+        other = SyncPipe("hash", source=SRC, **kwargs)
+
+        with pytest.raises(RuntimeError), SyncPipe("hash", source=SRC, **kwargs):
+            raise RuntimeError("boom")
+
+        assert len(list(other)) == 3
+
+    def test_collection_leases_warm_pool(self):
+        sources = [{"url": get_path("feed.xml")}]
+        kwargs = {"parallel": True, "pool_scope": "process", "workers": 2}
+
+        with (coll := SyncCollection(sources, **kwargs)):
+            pool = coll.pool
+            assert list(coll)
+
+        assert coll.pool is None
+        assert SyncCollection(sources, **kwargs).pool is pool
+
+    def test_shutdown_replaces_pools(self):
+        kwargs = {"parallel": True, "pool_scope": "process", "workers": 2}
+        pool = SyncPipe("hash", source=SRC, **kwargs).pool
+        pool_registry.shutdown()
+        assert SyncPipe("hash", source=SRC, **kwargs).pool is not pool
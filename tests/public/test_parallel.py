@@ -11,13 +11,36 @@ feeds (always fanned out).
 The primitives' precise ``limit + buffer`` bound is covered in
 ``tests/internal/test_streams.py``; here we assert the *pipe/collection-level*
 contract: same results as sequential, order control, and non-materialization.
+
+A ``parallel=True`` SyncPipe likewise streams its source through the worker pool
+with a bounded window of in-flight chunks (``riko._parallel.imap_chunks``), and a
+``pipelined=True`` one runs each upstream stage in its own thread behind a bounded
+queue (``riko._parallel.QueueFeed``). Unless pinned, a parallel SyncPipe's
+chunksize and active workers are tuned as it runs (``riko._parallel.AutoTuner``),
+and piecewise aggregations (``count``, ``sum``, ``uniq``) combine per-chunk
+partial results computed in the pool. ``executor='free_threaded'`` runs on
+threads when the GIL is disabled, ``executor='interpreter'`` on subinterpreters
+(Python 3.14+), and both run on processes otherwise.
 """
 
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import cpu_count, get_context
+from time import sleep
+
 import pytest
 
-from riko import get_path
+from riko import collections, get_path
+from riko._parallel import START_METHOD, FuturesPool, has_interpreters, is_free_threaded
 from riko.bado import issync, run
-from riko.collections import AsyncCollection, AsyncPipe
+from riko.collections import (
+    AsyncCollection,
+    AsyncPipe,
+    Executor,
+    SyncCollection,
+    SyncPipe,
+)
+from riko.modules.count import pipe as count
 from riko.types.modules import ItemBuilderConf
 
 BUILDER_CONF = ItemBuilderConf({"attrs": {"key": "content", "value": "a,bb,ccc,dddd"}})
@@ -146,3 +169,385 @@ class TestAsyncCollectionParallel:
         single, everything = run(main)
         assert single
         assert len(everything) == 5 * len(single)
+
+
+class TestSyncStreamingParallel:
+    @pytest.mark.parametrize("threads", [True, False])
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_parallel_matches_sequential(self, threads, ordered):
+        items = [{"content": str(x)} for x in range(50)]
+        sequential = list(SyncPipe("hash", source=items))
+        kwargs = {"parallel": True, "threads": threads, "ordered": ordered}
+        parallel = list(SyncPipe("hash", source=iter(items), workers=2, **kwargs))
+
+        if ordered:
+            assert parallel == sequential
+        else:
+            assert _by_content(parallel) == _by_content(sequential)
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_source_is_read_lazily(self, ordered):
+        pulled = []
+
+        def unbounded():
+            index = 0
+
+            while True:
+                pulled.append(index)
+                yield {"content": str(index)}
+                index += 1
+
+        kwargs = {"parallel": True, "ordered": ordered, "window": 2, "chunksize": 3}
+        pipe = SyncPipe("hash", source=unbounded(), workers=2, **kwargs)
+
+        with pipe:
+            first = next(iter(pipe))
+
+        assert first.get("hash") is not None
+        # at most `window` chunks (plus the one being batched) were read
+        assert len(pulled) <= 3 * 3 + 1
+
+
+class TestSyncAutotune:
+    @pytest.mark.parametrize("threads", [True, False])
+    def test_tuned_pipe_reports_its_choice(self, threads):
+        items = ({"content": str(x)} for x in range(300))
+        kwargs = {"parallel": True, "threads": threads, "ordered": True}
+
+        with (pipe := SyncPipe("hash", source=items, workers=2, **kwargs)):
+            results = list(pipe)
+
+        stats = pipe.tuning
+        assert [r["content"] for r in results] == [str(x) for x in range(300)]
+        assert stats.items == 300
+        assert stats.batches > 1
+        assert stats.chunksize > 1
+        assert 1 <= stats.workers <= 2
+
+    def test_pinned_values_are_kept(self):
+        items = ({"content": str(x)} for x in range(100))
+        kwargs = {"parallel": True, "chunksize": 3, "window": 2}
+        pipe = SyncPipe("hash", source=items, workers=2, **kwargs)
+        assert len(list(pipe)) == 100
+        assert pipe.tuning is None
+
+    def test_autotune_off(self):
+        items = ({"content": str(x)} for x in range(100))
+        kwargs = {"parallel": True, "autotune": False}
+        pipe = SyncPipe("hash", source=items, workers=2, **kwargs)
+        assert len(list(pipe)) == 100
+        assert pipe.tuning is None
+
+    def test_chained_pipes_inherit_pins(self):
+        items = ({"content": str(x)} for x in range(10))
+        conf = {"rule": {"transform": "upper"}}
+
+        with SyncPipe("hash", source=items, parallel=True, window=2) as pipe:
+            child = pipe.strtransform(conf=conf)
+            assert child.tune_chunksize
+            assert not child.tune_workers
+
+
+AGGREGATIONS = [
+    ("count", {}),
+    ("count", {"count_key": "key"}),
+    ("count", {"count_key": "key", "budget": 2}),
+    ("sum", {"sum_key": "value"}),
+    ("sum", {"sum_key": "value", "group_key": "key"}),
+    ("uniq", {"uniq_key": "key"}),
+    ("uniq", {"uniq_key": "value", "mode": "exact"}),
+    ("uniq", {"uniq_key": "value", "mode": "bloom", "limit": 100}),
+    ("uniq", {"uniq_key": "value", "limit": 3}),
+]
+
+
+class TestSyncPartitioned:
+    @pytest.mark.parametrize(("name", "conf"), AGGREGATIONS)
+    @pytest.mark.parametrize("threads", [True, False])
+    def test_partitioned_matches_sequential(self, name, conf, threads):
+        def gen_items():
+            return ({"key": f"k{x % 7}", "value": x % 11} for x in range(500))
+
+        sequential = list(SyncPipe(name, source=gen_items(), conf=conf))
+        kwargs = {"conf": conf, "parallel": True, "threads": threads}
+
+        with (pipe := SyncPipe(name, source=gen_items(), chunksize=16, **kwargs)):
+            assert pipe.partitioned
+            assert list(pipe) == sequential
+
+    def test_chunks_are_aggregated_in_the_pool(self, monkeypatch):
+        callers = []
+        partition = count.partition
+
+        def spy(chunk, **kwargs):
+            callers.append(threading.current_thread())
+            return partition(chunk, **kwargs)
+
+        monkeypatch.setattr(count, "partition", spy)
+        items = ({"x": x} for x in range(100))
+        pipe = SyncPipe("count", source=items, parallel=True, chunksize=10)
+        assert list(pipe) == [{"count": 100}]
+        assert len(callers) == 10
+        assert threading.main_thread() not in callers
+
+    def test_sequential_pipes_are_not_partitioned(self):
+        items = [{"x": x} for x in range(5)]
+        assert not SyncPipe("count", source=items).partitioned
+
+        with SyncPipe("hash", source=items, parallel=True) as pipe:
+            assert not pipe.partitioned
+
+
+class TestFreeThreaded:
+    @pytest.mark.skipif(is_free_threaded(), reason="requires the GIL")
+    def test_falls_back_to_processes(self):
+        pipe = SyncPipe("hash", source=[{"content": "a"}], executor="free_threaded")
+        assert pipe.executor == Executor.INLINE
+
+        items = [{"content": str(x)} for x in range(20)]
+        kwargs = {"parallel": True, "executor": "free_threaded", "ordered": True}
+
+        with (pipe := SyncPipe("hash", source=iter(items), **kwargs)):
+            assert pipe.executor == Executor.PROCESS
+            assert not pipe.threads
+            assert list(pipe) == list(SyncPipe("hash", source=items))
+
+    def test_runs_on_one_thread_per_core(self, monkeypatch):
+        free_threaded = lambda: True  # noqa: E731
+        monkeypatch.setitem(
+            collections._SUPPORTED, Executor.FREE_THREADED, free_threaded
+        )
+        items = [{"content": f"{x} b"} for x in range(50)]
+        rule = {"field": "content", "match": r"(\d+) (\w+)", "replace": "$2 $1"}
+        kwargs = {"parallel": True, "executor": "free_threaded", "ordered": True}
+        sequential = list(SyncPipe("regex", source=items, conf={"rule": rule}))
+
+        with (
+            pipe := SyncPipe("regex", source=iter(items), conf={"rule": rule}, **kwargs)
+        ):
+            child = pipe.hash()
+            assert pipe.executor == Executor.FREE_THREADED
+            assert pipe.threads
+            assert pipe.workers == cpu_count()
+            assert child.executor == Executor.FREE_THREADED
+            assert list(pipe) == sequential
+
+    def test_gil_is_rechecked_per_pool(self, monkeypatch):
+        # The GIL is re-enabled (e.g., by an extension import) after the pipe
+        # resolved its executor but before it creates its pool
+        checks = iter([True, False])
+        free_threaded = lambda: next(checks)  # noqa: E731
+        monkeypatch.setitem(
+            collections._SUPPORTED, Executor.FREE_THREADED, free_threaded
+        )
+        items = [{"content": str(x)} for x in range(20)]
+        kwargs = {"parallel": True, "executor": "free_threaded", "ordered": True}
+
+        with (pipe := SyncPipe("hash", source=iter(items), **kwargs)):
+            assert pipe.executor == Executor.PROCESS
+            assert not pipe.threads
+            assert list(pipe) == list(SyncPipe("hash", source=items))
+
+    def test_executor_overrides_threads(self):
+        kwargs = {"parallel": True, "threads": False, "executor": "thread"}
+
+        with (pipe := SyncPipe("hash", source=[{"content": "a"}], **kwargs)):
+            assert pipe.executor == Executor.THREAD
+            assert pipe.threads
+
+
+def _process_executor(workers, **kwargs):
+    # start the workers as riko's own process pools do, since forking them
+    # beside this process's threads (e.g., the loop bridge) can deadlock them
+    context = get_context(START_METHOD)
+    return ProcessPoolExecutor(workers, mp_context=context, **kwargs)
+
+
+def _futures_process_pool(workers, **kwargs):
+    # stands in for subinterpreters: workers share nothing with the caller
+    return FuturesPool(_process_executor(workers, **kwargs), workers)
+
+
+class TestInterpreterExecutor:
+    @pytest.mark.skipif(has_interpreters(), reason="requires Python < 3.14")
+    def test_falls_back_to_processes(self):
+        kwargs = {"parallel": True, "executor": "interpreter"}
+
+        with (pipe := SyncPipe("hash", source=[{"content": "a"}], **kwargs)):
+            assert pipe.executor == Executor.PROCESS
+            assert len(list(pipe)) == 1
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_ships_pipeline_to_isolated_workers(self, monkeypatch, ordered):
+        pools, supported = collections._POOLS, collections._SUPPORTED
+        monkeypatch.setitem(pools, Executor.INTERPRETER, _futures_process_pool)
+        monkeypatch.setitem(supported, Executor.INTERPRETER, lambda: True)
+        items = [{"content": str(x)} for x in range(60)]
+        sequential = list(SyncPipe("hash", source=items))
+        kwargs = {"parallel": True, "executor": "interpreter", "ordered": ordered}
+
+        with (pipe := SyncPipe("hash", source=iter(items), workers=2, **kwargs)):
+            assert pipe.executor == Executor.INTERPRETER
+            assert isinstance(pipe.pool, FuturesPool)
+            parallel = list(pipe)
+
+        if ordered:
+            assert parallel == sequential
+        else:
+            assert _by_content(parallel) == _by_content(sequential)
+
+    @pytest.mark.skipif(not has_interpreters(), reason="requires Python 3.14+")
+    def test_runs_on_subinterpreters(self):
+        items = [{"content": str(x)} for x in range(60)]
+        kwargs = {"parallel": True, "executor": "interpreter", "ordered": True}
+
+        with (pipe := SyncPipe("hash", source=iter(items), workers=2, **kwargs)):
+            assert pipe.executor == Executor.INTERPRETER
+            assert list(pipe) == list(SyncPipe("hash", source=items))
+
+
+class TestCallerExecutor:
+    @pytest.mark.parametrize("ordered", [False, True])
+    @pytest.mark.parametrize("factory", [ThreadPoolExecutor, _process_executor])
+    def test_runs_on_the_callers_executor(self, factory, ordered):
+        items = [{"content": str(x)} for x in range(60)]
+        sequential = list(SyncPipe("hash", source=items))
+
+        with factory(2) as executor:
+            kwargs = {"parallel": True, "executor": executor, "ordered": ordered}
+            pipe = SyncPipe("hash", source=iter(items), **kwargs)
+            parallel = list(pipe)
+
+            assert pipe.threads == (factory is ThreadPoolExecutor)
+            assert pipe.workers == 2
+            # the executor is borrowed, so it is left running
+            assert executor.submit(abs, -1).result() == 1
+
+        if ordered:
+            assert parallel == sequential
+        else:
+            assert _by_content(parallel) == _by_content(sequential)
+
+    def test_chain_shares_the_executor(self):
+        items = [{"content": str(x)} for x in range(20)]
+        kwargs = {"parallel": True, "fuse": False}
+
+        with ThreadPoolExecutor(2) as executor:
+            flow = SyncPipe("hash", source=items, executor=executor, **kwargs)
+            chained = flow.slugify(field="hash")
+            assert chained.pool is flow.pool
+            assert chained.pool.executor is executor
+            assert len(list(chained)) == 20
+
+            scoped = flow.pipe("slugify", field="hash", pool_scope="pipe")
+            assert scoped.pool is not flow.pool
+            assert scoped.pool.executor is executor
+
+    def test_early_close_cancels_queued_chunks(self):
+        started = []
+
+        def unbounded():
+            index = 0
+
+            while True:
+                started.append(index)
+                sleep(0.001)
+                yield {"content": str(index)}
+                index += 1
+
+        kwargs = {"parallel": True, "chunksize": 1, "window": 8, "autotune": False}
+
+        with ThreadPoolExecutor(1) as executor:
+            pipe = SyncPipe("hash", source=unbounded(), executor=executor, **kwargs)
+            stream = iter(pipe)
+            next(stream)
+            stream.close()
+
+            assert pipe.pool.cancel() == 0
+            assert not pipe.pool._pending or all(
+                future.done() for future in pipe.pool._pending
+            )
+
+        assert len(started) <= 10
+
+    def test_pool_and_executor_conflict(self):
+        with ThreadPoolExecutor(1) as executor, pytest.raises(TypeError):
+            SyncPipe("hash", source=[], parallel=True, executor=executor, pool=object())
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_collection_streams_as_completed(self, ordered):
+        sources = [{"url": get_path(f)} for f in ["feed.xml", "gawker.xml"]]
+        expected = list(SyncCollection(sources))
+
+        with ThreadPoolExecutor(2) as executor:
+            kwargs = {"parallel": True, "executor": executor, "ordered": ordered}
+            collection = SyncCollection(sources, **kwargs)
+            results = list(collection)
+
+        assert len(results) == len(expected)
+
+        if ordered:
+            assert results == expected
+
+
+class TestSyncPipelined:
+    def test_pipelined_matches_sequential(self):
+        def build(pipelined):
+            items = ({"content": f"{x % 7} b"} for x in range(40))
+            pipe = SyncPipe("hash", source=items, pipelined=pipelined, fuse=False)
+            return list(pipe.slugify().sort(conf={"rule": {"field": "hash"}}))
+
+        assert build(True) == build(False)
+
+    def test_upstream_runs_in_its_own_thread(self):
+        threads = set()
+
+        def source():
+            for x in range(5):
+                threads.add(threading.current_thread().name)
+                yield {"content": str(x)}
+
+        assert len(list(SyncPipe("hash", source=source(), pipelined=True))) == 5
+        assert threading.current_thread().name not in threads
+
+    def test_capacity_bounds_read_ahead(self):
+        pulled = []
+
+        def unbounded():
+            index = 0
+
+            while True:
+                pulled.append(index)
+                yield {"content": str(index)}
+                index += 1
+
+        pipe = SyncPipe("hash", source=unbounded(), pipelined=True, capacity=4)
+
+        with pipe:
+            next(iter(pipe))
+            sleep(0.1)
+            # capacity queued + the one taken + the one blocked on a full queue
+            assert len(pulled) <= 4 + 2
+
+        assert pipe.queue_stats()[0].capacity == 4
+
+    def test_upstream_errors_propagate(self):
+        def failing():
+            yield {"content": "a"}
+            raise ValueError("upstream")
+
+        pipe = SyncPipe("hash", source=failing(), pipelined=True)
+
+        with pytest.raises(ValueError, match="upstream"):
+            list(pipe)
+
+    def test_queue_stats_per_stage(self):
+        items = [{"content": str(x)} for x in range(10)]
+        pipe = SyncPipe("hash", source=items, pipelined=True, fuse=False)
+        flow = pipe.slugify(field="hash", capacity=3).count()
+        assert list(flow) == [{"count": 10}]
+
+        stats = flow.queue_stats()
+        assert [s.name for s in stats] == ["source", "hash", "slugify"]
+        assert [s.capacity for s in stats] == [1024, 3, 1024]
+        assert all(s.items == 10 and s.depth == 0 for s in stats)
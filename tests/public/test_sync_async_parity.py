@@ -12,6 +12,8 @@ Lifecycle/close/split/export parity lives in ``test_pipe_lifecycle.py`` and
 ``test_context_modes.py``. This file locks *data-output* equivalence.
 """
 
+import json
+
 import pytest
 
 from riko.bado import issync, run
@@ -26,6 +28,8 @@ from tests import PipeBuilder, aresolve
 
 BUILDER_CONF = ItemBuilderConf({"attrs": {"key": "content", "value": "a,bb,ccc"}})
 STRR_CONF = StrReplaceConf({"rule": StrReplaceConfRule(find="c", replace="C")})
+LISTED = [{"a": 1}, {"a": 2}]
+ONLY = {"title": "only"}
 
 
 def _both[P: (SyncPipe, AsyncPipe), T](
@@ -88,6 +92,22 @@ class TestOutputParity:
         assert sync_result == async_result
         assert sync_result == [{"content": "a"}, {"content": "bb"}]
 
+    @pytest.mark.parametrize(
+        ("data", "path", "expected"),
+        [
+            ({"value": {"items": [{"a": 1}, {"a": 2}]}}, "value.items", LISTED),
+            ({"value": {"items": {"title": "only"}}}, "value.items", [ONLY]),
+            ({"value": {"list": {"item": [{"a": 1}]}}}, "value.list.item", LISTED[:1]),
+            ({"value": {"list": [{"a": 1}]}}, "value.list.item", [{"content": ""}]),
+        ],
+    )
+    def test_fetchdata_path(self, tmp_path, data, path, expected):
+        source = tmp_path / "data.json"
+        source.write_text(json.dumps(data))
+        conf = {"url": f"file://{source}", "path": path}
+        sync_result, async_result = _both(lambda pipe: pipe("fetchdata", conf=conf))
+        assert sync_result == async_result == expected
+
 
 @pytest.mark.skipif(issync, reason="async support not available")
 class TestLifecycleObservableParity: